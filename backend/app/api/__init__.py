@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from .endpoints import health, users, news, community, standings, auth, predictions, scoring, bets
+from .endpoints import health, users, news, community, standings, auth, predictions, scoring, bets, realtime
 
 api_router = APIRouter()
 
@@ -12,3 +12,4 @@ api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(predictions.router, prefix="/predictions", tags=["predictions"])
 api_router.include_router(scoring.router, prefix="/scoring", tags=["scoring"])
 api_router.include_router(bets.router, prefix="/bets", tags=["bets"])
+api_router.include_router(realtime.router, prefix="/realtime", tags=["realtime"])
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from typing import List, Optional
 
 from ...models.database import get_db, Bet, User, PredictionEvent
-from ...schemas.bet import BetCreate, BetResponse, UserBetsResponse
+from ...schemas.bet import BetCreate, BetResponse, UserBetsResponse, PoolTotalsResponse, BetBulkCreate, BetBulkResponse
+from ...core.config import settings
 from ...core.security import get_current_user
+from ...services.bet_ingest import announce_bets, bulk_summary, ingest_bets
+from ...services.creator_stats import record_bet_created
+from ...services.pool_totals import bet_side, load_pool_totals, rebuild_pool_totals, record_bet_totals
 
 router = APIRouter()
 
@@ -27,6 +31,13 @@ def create_bet(
             detail="Prediction event not found"
         )
     
+    side = bet_side(prediction, bet_data.option)
+    if side is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Option must be one of the prediction's options"
+        )
+    
     # 이미 베팅했는지 확인
     existing_bet = db.query(Bet).filter(
         Bet.prediction_id == bet_data.prediction_id,
@@ -51,11 +62,58 @@ def create_bet(
     )
     
     db.add(bet)
-    db.commit()
+    record_bet_created(db, prediction.creator_id, current_user.id, bet_data.amount)
+    # 예측 전체/옵션별 베팅 합계를 같은 트랜잭션에서 증분 갱신
+    record_bet_totals(db, prediction.id, side, bet_data.amount)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="This transaction has already been recorded"
+        )
     db.refresh(bet)
     
+    # 커밋된 베팅만 메모리 배당 집계에 반영하고 구독자에게 알림
+    announce_bets([{
+        "prediction_id": prediction.id,
+        "option_a": prediction.option_a,
+        "option_b": prediction.option_b,
+        "side": side,
+        "bet_id": bet.id,
+        "option": bet.option,
+        "amount": bet.amount,
+        "user_address": bet.user_address
+    }])
+    
     return bet
 
+@router.post("/bulk", response_model=BetBulkResponse)
+def create_bets_bulk(
+    bulk: BetBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    베팅 일괄 등록 (transaction_hash 기준 멱등, 재시도해도 중복 저장되지 않음)
+    항목별로 accepted/duplicate/rejected 결과 반환, user_id 지정은 Admin만 가능
+    """
+    if len(bulk.bets) > settings.BET_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BET_BULK_MAX_ITEMS} bets can be submitted at once"
+        )
+    if not current_user.is_admin and any(
+        item.user_id not in (None, current_user.id) for item in bulk.bets
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return bulk_summary(ingest_bets(db, bulk.bets, current_user.id))
+
 @router.get("/user/{user_address}", response_model=List[UserBetsResponse])
 def get_user_bets(
     user_address: str,
@@ -80,6 +138,36 @@ def get_prediction_bets(
     
     return bets
 
+@router.get("/prediction/{prediction_id}/totals", response_model=PoolTotalsResponse)
+def get_prediction_pool_totals(
+    prediction_id: int,
+    db: Session = Depends(get_db)
+):
+    """특정 예측 이벤트의 전체/옵션별 베팅 합계 조회 (집계 행 조회)"""
+    totals = load_pool_totals(db, prediction_id)
+    if totals is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Prediction event not found"
+        )
+    
+    return totals
+
+@router.post("/totals/reconcile")
+def reconcile_pool_totals(
+    prediction_id: Optional[int] = Query(None, description="지정하면 해당 예측만 다시 계산"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """베팅 기록으로 예측별 베팅 합계 재계산 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return {"reconciled": rebuild_pool_totals(db, None if prediction_id is None else [prediction_id])}
+
 @router.get("/user-bets-summary/{user_id}")
 def get_user_bets_summary(
     user_id: int,
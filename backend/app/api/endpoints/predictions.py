@@ -1,18 +1,148 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import base64
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
-from typing import List
 
 from app.models.database import get_db, PredictionEvent, User
 from sqlalchemy.orm import joinedload
-from app.schemas.prediction import PredictionEventCreate, PredictionEventResponse, PredictionEventApproval, PredictionEventPoolUpdate
+from app.schemas.prediction import (
+    PredictionEventCreate,
+    PredictionEventResponse,
+    PredictionEventApproval,
+    PredictionEventPoolUpdate,
+    PredictionSimilarResponse,
+    PredictionOddsResponse
+)
 from pydantic import BaseModel
 from app.api.endpoints.auth import get_current_user
+from app.services.novelty_index import get_novelty_index, prediction_text, wait_novelty_index
+from app.services.pool_odds import get_pool_odds
+from app.services.realtime import publish_status
+from app.services.creator_stats import record_prediction_created, record_status_changes
+from app.services.expiry_scheduler import EXPIRABLE_STATUSES, get_expiry_scheduler, not_expired_condition
 
 router = APIRouter()
 
+# 목록 조회 시 제안자 username을 같은 쿼리(JOIN)로 함께 로드
+WITH_CREATOR = joinedload(PredictionEvent.creator_user).load_only(User.id, User.username)
+
 class PredictionEventStatusUpdate(BaseModel):
     status: str
 
+def _encode_prediction_cursor(created_at: datetime, prediction_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{prediction_id}".encode()).decode().rstrip("=")
+
+def _decode_prediction_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, prediction_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(prediction_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 cursor입니다"
+        )
+
+class PredictionListParams:
+    """예측 목록 공통 필터/페이지네이션 쿼리 파라미터"""
+    
+    def __init__(
+        self,
+        limit: int = Query(50, ge=1, le=200),
+        cursor: Optional[str] = Query(None, description="이전 페이지 응답의 X-Next-Cursor 헤더 값"),
+        prediction_status: Optional[str] = Query(None, alias="status"),
+        game_id: Optional[str] = Query(None),
+        creator_id: Optional[int] = Query(None),
+        creator: Optional[str] = Query(None, description="제안자 username"),
+        expires_after: Optional[datetime] = Query(None, description="베팅 마감(expires_at) 하한"),
+        expires_before: Optional[datetime] = Query(None, description="베팅 마감(expires_at) 상한"),
+        has_pool: Optional[bool] = Query(None, description="Sui Pool 생성 여부")
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.status = prediction_status
+        self.game_id = game_id
+        self.creator_id = creator_id
+        self.creator = creator
+        self.expires_after = expires_after
+        self.expires_before = expires_before
+        self.has_pool = has_pool
+
+def _list_predictions(
+    db: Session,
+    response: Response,
+    params: PredictionListParams,
+    statuses=None,
+    hide_expired: bool = False
+):
+    """
+    최신순(created_at DESC, id DESC) 키셋 페이지네이션으로 예측 목록 조회
+    다음 페이지가 있으면 X-Next-Cursor 헤더에 cursor를 담아 반환
+    hide_expired: 만료 스케줄러가 아직 반영하지 않은 마감 지난 approved/active 예측 제외
+    """
+    query = db.query(PredictionEvent).options(WITH_CREATOR)
+    
+    if params.status:
+        if statuses is not None and params.status not in statuses:
+            return []
+        statuses = [params.status]
+    if params.game_id:
+        query = query.filter(PredictionEvent.game_id == params.game_id)
+    if params.creator_id is not None:
+        query = query.filter(PredictionEvent.creator_id == params.creator_id)
+    if params.creator:
+        query = query.filter(PredictionEvent.creator_id == select(User.id).where(
+            User.username == params.creator
+        ).scalar_subquery())
+    if params.expires_after:
+        query = query.filter(PredictionEvent.expires_at >= params.expires_after)
+    if params.expires_before:
+        query = query.filter(PredictionEvent.expires_at < params.expires_before)
+    if params.has_pool is not None:
+        query = query.filter(
+            PredictionEvent.pool_id.isnot(None) if params.has_pool else PredictionEvent.pool_id.is_(None)
+        )
+    if params.cursor:
+        after_created_at, after_id = _decode_prediction_cursor(params.cursor)
+        query = query.filter(or_(
+            PredictionEvent.created_at < after_created_at,
+            and_(PredictionEvent.created_at == after_created_at, PredictionEvent.id < after_id)
+        ))
+    
+    def fetch_page(page_query):
+        return page_query.order_by(
+            PredictionEvent.created_at.desc(),
+            PredictionEvent.id.desc()
+        ).limit(params.limit + 1).all()
+    
+    if statuses is None:
+        predictions = fetch_page(query)
+    else:
+        # 상태마다 (status, created_at, id) 인덱스 순서대로 limit+1개씩 읽어 병합 (IN 조건은 별도 정렬이 필요함)
+        predictions = sorted(
+            (
+                prediction
+                for prediction_status in statuses
+                for prediction in fetch_page(
+                    query.filter(PredictionEvent.status == prediction_status, not_expired_condition())
+                    if hide_expired and prediction_status in EXPIRABLE_STATUSES
+                    else query.filter(PredictionEvent.status == prediction_status)
+                )
+            ),
+            key=lambda prediction: (prediction.created_at, prediction.id),
+            reverse=True
+        )[:params.limit + 1]
+    
+    if len(predictions) > params.limit:
+        predictions = predictions[:params.limit]
+        response.headers["X-Next-Cursor"] = _encode_prediction_cursor(
+            predictions[-1].created_at, predictions[-1].id
+        )
+    return predictions
+
 @router.post("/", response_model=PredictionEventResponse)
 async def create_prediction_event(
     prediction: PredictionEventCreate,
@@ -39,70 +169,137 @@ async def create_prediction_event(
     )
     
     db.add(db_prediction)
+    record_prediction_created(db, current_user.id)
     db.commit()
     db.refresh(db_prediction)
     
+    # 독창성 계산용 근접 중복 인덱스에 추가
+    get_novelty_index().add(
+        db_prediction.id,
+        prediction_text(db_prediction.game_id, db_prediction.prediction, db_prediction.option_a, db_prediction.option_b)
+    )
+    
     return db_prediction
 
 @router.get("/pending", response_model=List[PredictionEventResponse])
 async def get_pending_predictions(
+    response: Response,
+    params: PredictionListParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """대기 중인 예측 이벤트 조회 (Admin만)"""
+    """대기 중인 예측 이벤트 조회 (최신순, 키셋 페이지네이션, Admin만)"""
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin 권한이 필요합니다"
         )
     
-    predictions = db.query(PredictionEvent).filter(
-        PredictionEvent.status == "pending"
-    ).all()
-    
-    # creator 정보 추가
-    for prediction in predictions:
-        creator = db.query(User).filter(User.id == prediction.creator_id).first()
-        prediction.creator = creator.username if creator else "Unknown"
-    
-    return predictions
+    return _list_predictions(db, response, params, statuses=["pending"])
 
 @router.get("/", response_model=List[PredictionEventResponse])
 async def get_all_predictions(
+    response: Response,
+    params: PredictionListParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """모든 예측 이벤트 조회 (Admin만)"""
+    """모든 예측 이벤트 조회 (최신순, 키셋 페이지네이션, Admin만)"""
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin 권한이 필요합니다"
         )
     
-    predictions = db.query(PredictionEvent).all()
-    
-    # creator 정보 추가
-    for prediction in predictions:
-        creator = db.query(User).filter(User.id == prediction.creator_id).first()
-        prediction.creator = creator.username if creator else "Unknown"
-    
-    return predictions
+    return _list_predictions(db, response, params)
 
 @router.get("/approved", response_model=List[PredictionEventResponse])
 async def get_approved_predictions(
+    response: Response,
+    params: PredictionListParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    """승인된 및 완료된 예측 이벤트 조회 (최신순, 키셋 페이지네이션, 모든 사용자)"""
+    return _list_predictions(db, response, params, statuses=["approved", "completed"], hide_expired=True)
+
+def _load_odds(db: Session, prediction_ids: List[int]) -> List[dict]:
+    """메모리 배당 집계에서 조회 (시작 후 생성되어 아직 없는 예측만 DB에서 옵션을 읽어 등록)"""
+    pool_odds = get_pool_odds()
+    missing = pool_odds.missing(prediction_ids)
+    if missing:
+        for prediction_id, option_a, option_b in db.query(
+            PredictionEvent.id, PredictionEvent.option_a, PredictionEvent.option_b
+        ).filter(PredictionEvent.id.in_(missing)).all():
+            pool_odds.ensure(prediction_id, option_a, option_b)
+    return [odds for odds in map(pool_odds.odds, prediction_ids) if odds is not None]
+
+@router.get("/odds", response_model=List[PredictionOddsResponse])
+async def get_predictions_odds(
+    ids: List[int] = Query(..., description="조회할 예측 ID (여러 번 지정, 최대 200개)"),
+    db: Session = Depends(get_db)
+):
+    """여러 예측의 옵션별 베팅 합계/비율/배당 조회 (없는 ID는 제외, 모든 사용자)"""
+    if len(ids) > 200:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="한 번에 최대 200개까지 조회할 수 있습니다"
+        )
+    
+    return _load_odds(db, list(dict.fromkeys(ids)))
+
+@router.get("/{prediction_id}/odds", response_model=PredictionOddsResponse)
+async def get_prediction_odds(
+    prediction_id: int,
     db: Session = Depends(get_db)
 ):
-    """승인된 및 완료된 예측 이벤트 조회 (모든 사용자)"""
-    predictions = db.query(PredictionEvent).filter(
-        PredictionEvent.status.in_(["approved", "completed"])
-    ).all()
+    """예측의 옵션별 베팅 합계/비율/배당 조회 (Move claim과 같은 수수료/내림 계산, 모든 사용자)"""
+    odds = _load_odds(db, [prediction_id])
+    if not odds:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="예측 이벤트를 찾을 수 없습니다"
+        )
     
-    # creator 정보 추가
-    for prediction in predictions:
-        creator = db.query(User).filter(User.id == prediction.creator_id).first()
-        prediction.creator = creator.username if creator else "Unknown"
+    return odds[0]
+
+@router.get("/{prediction_id}/similar", response_model=PredictionSimilarResponse)
+async def get_similar_predictions(
+    prediction_id: int,
+    k: int = Query(5, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """근접 중복 예측 상위 k개와 독창성 점수 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
     
-    return predictions
+    prediction = db.query(PredictionEvent).filter(
+        PredictionEvent.id == prediction_id
+    ).first()
+    
+    if not prediction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="예측 이벤트를 찾을 수 없습니다"
+        )
+    
+    novelty_index = await wait_novelty_index()
+    novelty = novelty_index.novelty(
+        prediction_text(prediction.game_id, prediction.prediction, prediction.option_a, prediction.option_b),
+        prediction_id=prediction.id,
+        k=k
+    )
+    
+    return PredictionSimilarResponse(
+        prediction_id=prediction.id,
+        novelty_score=novelty['novelty_score'],
+        first_mover=novelty['novelty_details']['first_mover'],
+        uniqueness=novelty['novelty_details']['uniqueness'],
+        similar=novelty['novelty_details']['nearest']
+    )
 
 @router.put("/{prediction_id}/approve", response_model=PredictionEventResponse)
 async def approve_prediction(
@@ -128,10 +325,16 @@ async def approve_prediction(
             detail="예측 이벤트를 찾을 수 없습니다"
         )
     
+    record_status_changes(db, [(prediction.creator_id, prediction.status, approval.status)])
     prediction.status = approval.status
     db.commit()
     db.refresh(prediction)
     
+    # 승인되면 베팅 마감 시각에 expired로 바뀌도록 스케줄러 재무장
+    if prediction.status in EXPIRABLE_STATUSES:
+        get_expiry_scheduler().schedule(prediction.id, prediction.expires_at)
+    publish_status([prediction.id], prediction.status)
+    
     return prediction
 
 @router.put("/{prediction_id}/pool", response_model=PredictionEventResponse)
@@ -192,8 +395,13 @@ def update_prediction_status(
         )
     
     # 상태 업데이트
+    record_status_changes(db, [(prediction.creator_id, prediction.status, status_update.status)])
     prediction.status = status_update.status
     db.commit()
     db.refresh(prediction)
     
+    if prediction.status in EXPIRABLE_STATUSES:
+        get_expiry_scheduler().schedule(prediction.id, prediction.expires_at)
+    publish_status([prediction.id], prediction.status)
+    
     return {"message": f"Prediction status updated to {status_update.status}", "prediction": prediction}
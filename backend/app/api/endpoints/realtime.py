@@ -0,0 +1,167 @@
+import asyncio
+import json
+from typing import Iterable, List, Set
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.models.database import User
+from app.api.endpoints.auth import get_current_user
+from app.services.pool_odds import get_pool_odds
+from app.services.realtime import FEED_TOPIC, Subscription, get_broker, make_event, prediction_topic
+
+router = APIRouter()
+
+# 연결 하나가 구독할 수 있는 최대 예측 수
+MAX_TOPICS = 200
+
+
+def _topics(prediction_ids: Iterable[int], feed: bool) -> Set[str]:
+    topics = {prediction_topic(prediction_id) for prediction_id in prediction_ids}
+    if feed:
+        topics.add(FEED_TOPIC)
+    if len(topics) > MAX_TOPICS + 1:
+        raise ValueError(f"한 연결에서 최대 {MAX_TOPICS}개 예측까지 구독할 수 있습니다")
+    return topics
+
+
+def _command_ids(command: dict, key: str) -> List[int]:
+    """subscribe/unsubscribe 값 검증 (정수 목록이 아니면 ValueError)"""
+    prediction_ids = command.get(key, [])
+    if not isinstance(prediction_ids, list) or not all(
+        isinstance(prediction_id, int) and not isinstance(prediction_id, bool)
+        for prediction_id in prediction_ids
+    ):
+        raise ValueError(f"{key}는 예측 ID(정수) 목록이어야 합니다")
+    return prediction_ids
+
+
+def _offer_snapshot(subscription: Subscription, prediction_ids: Iterable[int]):
+    """구독 직후 현재 배당을 먼저 전달 (메모리 집계에 있는 예측만)"""
+    pool_odds = get_pool_odds()
+    for prediction_id in prediction_ids:
+        odds = pool_odds.odds(prediction_id)
+        if odds is not None:
+            subscription.offer(make_event("odds", prediction_id, odds))
+
+
+@router.websocket("/ws")
+async def realtime_websocket(
+    websocket: WebSocket,
+    predictions: List[int] = Query([]),
+    feed: bool = Query(False)
+):
+    """
+    실시간 알림 WebSocket
+    - predictions: 구독할 예측 ID (bet_placed, odds, status), feed=true면 전체 상태 변경도 수신
+    - 연결 후 {"subscribe": [id...]}, {"unsubscribe": [id...]}, {"feed": true|false}로 구독 변경
+    """
+    try:
+        topics = _topics(predictions, feed)
+    except ValueError:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    broker = get_broker()
+    subscription = broker.subscribe(topics)
+    _offer_snapshot(subscription, predictions)
+
+    async def receive_commands():
+        while True:
+            try:
+                command = json.loads(await websocket.receive_text())
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(command, dict):
+                continue
+            # 형식이 맞지 않는 명령은 잘못된 JSON처럼 무시
+            try:
+                added = _command_ids(command, "subscribe")
+                removed = _command_ids(command, "unsubscribe")
+            except ValueError:
+                continue
+            subscription.topics.update(prediction_topic(prediction_id) for prediction_id in added)
+            subscription.topics.difference_update(prediction_topic(prediction_id) for prediction_id in removed)
+            if "feed" in command:
+                if command["feed"]:
+                    subscription.topics.add(FEED_TOPIC)
+                else:
+                    subscription.topics.discard(FEED_TOPIC)
+            if len(subscription.topics) > MAX_TOPICS + 1:
+                await websocket.close(code=1008)
+                return
+            _offer_snapshot(subscription, added)
+
+    async def send_events():
+        while True:
+            events = await subscription.next_batch(settings.REALTIME_HEARTBEAT_SECONDS)
+            if not events:
+                await websocket.send_json({"type": "ping"})
+            for event in events:
+                await websocket.send_json(event)
+
+    tasks = [asyncio.create_task(receive_commands()), asyncio.create_task(send_events())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+                pass
+        broker.unsubscribe(subscription)
+
+
+@router.get("/sse")
+async def realtime_sse(
+    request: Request,
+    predictions: List[int] = Query([]),
+    feed: bool = Query(False)
+):
+    """실시간 알림 Server-Sent Events (WebSocket과 같은 이벤트, event 이름은 이벤트 type)"""
+    try:
+        topics = _topics(predictions, feed)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not topics:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="predictions 또는 feed=true 중 하나는 지정해야 합니다"
+        )
+
+    broker = get_broker()
+    subscription = broker.subscribe(topics)
+    _offer_snapshot(subscription, predictions)
+
+    async def stream():
+        try:
+            while not await request.is_disconnected():
+                events = await subscription.next_batch(settings.REALTIME_HEARTBEAT_SECONDS)
+                if not events:
+                    yield ": ping\n\n"
+                for event in events:
+                    yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/info")
+async def realtime_info(current_user: User = Depends(get_current_user)):
+    """실시간 브로커 상태 (구독자 수, 발행 수) 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+
+    return get_broker().info()
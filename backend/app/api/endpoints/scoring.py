@@ -1,19 +1,96 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import base64
+import json
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.models.database import get_db, PredictionEvent, PredictionScore, User
-from app.schemas.scoring import PredictionScore as PredictionScoreSchema, ScoringRequest
+from app.models.database import (
+    get_db,
+    SessionLocal,
+    PredictionEvent,
+    PredictionScore,
+    User,
+    ScoringJob,
+    ScoringJobItem,
+    ScoringWeightProfile
+)
+from app.schemas.scoring import (
+    PredictionScore as PredictionScoreSchema,
+    BatchScoringItem,
+    BatchScoringResponse,
+    BatchScoringSummary,
+    ScoreLeaderboardItem,
+    ScoringJobCreate,
+    ScoringJobResponse,
+    ScoringJobDetailResponse,
+    ScoringJobItemResponse,
+    WeightProfileCreate,
+    WeightProfileResponse,
+    WeightProfileActivateResponse,
+    WeightProfilePreviewItem
+)
 from app.api.endpoints.auth import get_current_user
-from app.services.ai_scoring import AIScoringService
+from app.services.ai_scoring import AIScoringService, get_ai_scoring_service
+from app.services.circuit_breaker import (
+    ScoringUnavailableError,
+    defer_predictions,
+    deferred_count,
+    get_circuit_breaker
+)
+from app.services.score_cache import get_score_cache
+from app.services.ai_output import parse_stats
+from app.services.ai_usage import flush_usage, get_usage_recorder, hourly_usage
+from app.services.creator_stats import load_creator_profiles, rebuild_creator_stats
+from app.services.novelty_index import wait_novelty_index
+from app.services.scoring_jobs import JOB_TYPES, RETRY_JOB_TYPE, create_scoring_job, get_scoring_worker, reset_failed_items
+from app.services.weight_profiles import (
+    CATEGORIES,
+    activate_weight_profile,
+    create_weight_profile,
+    preview_rerank,
+    profile_weights
+)
+from app.services.scoring_engine import (
+    ScoringEngine,
+    ScoringItemResult,
+    build_scoring_data,
+    build_score_row,
+    select_best_prediction,
+    snapshot_candidates
+)
 
 router = APIRouter()
 
+def _batch_item(item: ScoringItemResult) -> BatchScoringItem:
+    return BatchScoringItem(
+        prediction_id=item.prediction_id,
+        success=item.success,
+        total_score=item.total_score,
+        error=item.error,
+        latency_ms=round(item.latency_ms, 1),
+        cache_hit=item.cache_hit,
+        is_fallback=item.is_fallback,
+        deferred=item.deferred
+    )
+
+def _format_stream_event(event: str, data: dict, stream_format: str) -> str:
+    """NDJSON 한 줄 또는 SSE 이벤트 하나로 직렬화"""
+    payload = json.dumps(data, ensure_ascii=False)
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {payload}\n\n"
+    return json.dumps({"event": event, **data}, ensure_ascii=False) + "\n"
+
 @router.post("/calculate/{prediction_id}", response_model=PredictionScoreSchema)
 async def calculate_prediction_score(
     prediction_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    ai_service: AIScoringService = Depends(get_ai_scoring_service)
 ):
     """예측 이벤트에 대한 AI 점수 계산"""
     if not current_user.is_admin:
@@ -44,44 +121,385 @@ async def calculate_prediction_score(
             detail="이미 점수가 계산된 예측입니다"
         )
     
-    # AI 점수 계산
-    ai_service = AIScoringService()
-    
-    scoring_data = {
-        'game_id': prediction.game_id,
-        'prediction': prediction.prediction,
-        'option_a': prediction.option_a,
-        'option_b': prediction.option_b,
-        'creator_username': 'unknown',  # TODO: 사용자 정보 조회
-        'creator_activity_days': 0,
-        'creator_contribution_score': 0.0
-    }
+    # AI 점수 계산 (독창성 인덱스가 채워지는 중이면 완료 후 계산)
+    creator_profile = load_creator_profiles(db, [prediction.creator_id]).get(prediction.creator_id)
+    await wait_novelty_index()
+    try:
+        score_result = await ai_service.calculate_prediction_score(build_scoring_data(prediction, creator_profile))
+    except ScoringUnavailableError:
+        # queue 모드: 즉시 실패하고 서킷이 닫히면 워커가 다시 스코어링
+        defer_predictions([prediction_id])
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="스코어링 백엔드를 사용할 수 없어 나중에 다시 계산합니다",
+            headers={"Retry-After": str(int(get_circuit_breaker().info()["retry_in_seconds"]) or 1)}
+        )
     
-    score_result = ai_service.calculate_prediction_score(scoring_data)
+    if score_result.get('is_fallback'):
+        # provisional 모드: 임시 점수는 저장하지 않고 표시만 해서 반환
+        defer_predictions([prediction_id])
+        return PredictionScoreSchema(
+            prediction_id=prediction_id,
+            **{
+                field: score_result[field]
+                for field in PredictionScoreSchema.model_fields
+                if field in score_result
+            }
+        )
     
     # 데이터베이스에 점수 저장
-    db_score = PredictionScore(
-        prediction_id=prediction_id,
-        quality_score=score_result['quality_score'],
-        demand_score=score_result['demand_score'],
-        reputation_score=score_result['reputation_score'],
-        novelty_score=score_result['novelty_score'],
-        economic_score=score_result['economic_score'],
-        total_score=score_result['total_score'],
-        quality_details=score_result['quality_details'],
-        demand_details=score_result['demand_details'],
-        reputation_details=score_result['reputation_details'],
-        novelty_details=score_result['novelty_details'],
-        economic_details=score_result['economic_details'],
-        ai_reasoning=score_result['ai_reasoning']
-    )
+    db_score = build_score_row(prediction_id, score_result)
     
     db.add(db_score)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # 동시에 들어온 다른 요청이 먼저 저장한 경우 (prediction_id 유니크 인덱스)
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 점수가 계산된 예측입니다"
+        )
     db.refresh(db_score)
     
     return db_score
 
+@router.get("/cache/stats", response_model=dict)
+async def get_score_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """AI 점수 캐시 적중/미스 통계 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    return get_score_cache().info()
+
+@router.get("/parse/stats", response_model=dict)
+async def get_parse_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """AI 응답 파싱 성공/복구/재요청/실패 횟수 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    return parse_stats.info()
+
+@router.get("/usage", response_model=dict)
+def get_ai_usage(
+    window_minutes: int = Query(60, ge=1, le=7 * 24 * 60),
+    hours: int = Query(24, ge=1, le=24 * 90),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    AI 호출 사용량 조회 (Admin만)
+    - recent: 최근 window_minutes 동안의 호출 수, 지연 시간 p50/p95/p99, 토큰, 재시도, 캐시 적중, 추정 비용 (링 버퍼 기준)
+    - hourly: 최근 hours시간의 시간별 누적 집계
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    # 아직 반영되지 않은 집계까지 포함해서 조회 (DB 쓰기를 하므로 동기 핸들러로 스레드풀에서 실행)
+    # 반영에 실패해도 집계는 다음 flush로 남으므로 로그만 남기고 조회 결과는 반환
+    try:
+        flush_usage()
+    except Exception as e:
+        print(f"AI usage flush failed: {e}")
+    return {
+        "window_minutes": window_minutes,
+        "recent": get_usage_recorder().summary(window_minutes * 60),
+        "hourly": hourly_usage(db, hours)
+    }
+
+@router.get("/circuit", response_model=dict)
+async def get_scoring_circuit(
+    current_user: User = Depends(get_current_user)
+):
+    """스코어링 백엔드 서킷 브레이커 상태와 재스코어링 대기 수 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    return {**get_circuit_breaker().info(), "deferred": deferred_count()}
+
+@router.post("/circuit/reset", response_model=dict)
+async def reset_scoring_circuit(
+    current_user: User = Depends(get_current_user)
+):
+    """서킷 브레이커를 강제로 닫음 (백엔드 복구를 확인한 경우, Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    circuit_breaker = get_circuit_breaker()
+    circuit_breaker.reset()
+    return {**circuit_breaker.info(), "deferred": deferred_count()}
+
+@router.post("/creator-stats/rebuild", response_model=dict)
+async def rebuild_creator_reputation(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """예측/베팅 기록으로 제안자 평판 집계 재계산 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    return {"rebuilt": rebuild_creator_stats(db)}
+
+@router.get("/unscored", response_model=List[int])
+async def get_unscored_prediction_ids(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """점수가 아직 계산되지 않은 예측 ID 목록 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    rows = db.query(PredictionEvent.id).filter(
+        ~PredictionEvent.id.in_(
+            db.query(PredictionScore.prediction_id)
+        )
+    ).order_by(PredictionEvent.id).all()
+    return [prediction_id for (prediction_id,) in rows]
+
+@router.post("/jobs", response_model=ScoringJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_scoring_job(
+    job_request: ScoringJobCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """스코어링되지 않은 예측들에 대한 백그라운드 스코어링 작업 등록 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    if job_request.job_type not in JOB_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"job_type은 {', '.join(JOB_TYPES)} 중 하나여야 합니다"
+        )
+    
+    job = create_scoring_job(
+        db,
+        job_request.job_type,
+        {
+            "concurrency": job_request.concurrency,
+            "batch_size": job_request.batch_size,
+            "top_k": job_request.top_k
+        },
+        current_user.id
+    )
+    get_scoring_worker().submit(job.id)
+    
+    return job
+
+@router.get("/jobs", response_model=List[ScoringJobResponse])
+async def get_scoring_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """최근 스코어링 작업 목록 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    return db.query(ScoringJob).order_by(ScoringJob.id.desc()).limit(limit).all()
+
+@router.get("/jobs/{job_id}", response_model=ScoringJobDetailResponse)
+async def get_scoring_job(
+    job_id: int,
+    item_status: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """스코어링 작업 진행 상황 및 항목별 결과 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    job = db.query(ScoringJob).filter(ScoringJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="스코어링 작업을 찾을 수 없습니다"
+        )
+    
+    items_query = db.query(ScoringJobItem).filter(ScoringJobItem.job_id == job_id)
+    if item_status:
+        items_query = items_query.filter(ScoringJobItem.status == item_status)
+    
+    response = ScoringJobDetailResponse.model_validate(job)
+    response.items = [
+        ScoringJobItemResponse.model_validate(item)
+        for item in items_query.order_by(ScoringJobItem.id).all()
+    ]
+    return response
+
+@router.post("/jobs/{job_id}/resume", response_model=ScoringJobResponse)
+async def resume_scoring_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """중단되었거나 실패 항목이 있는 스코어링 작업 재개 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    job = db.query(ScoringJob).filter(ScoringJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="스코어링 작업을 찾을 수 없습니다"
+        )
+    
+    if job.status == "running":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 실행 중인 작업입니다"
+        )
+    
+    # 완료된 작업은 자동 선택이 끝나지 않은 일괄 계산/재스코어링 작업의 실패 항목만 재시도
+    if job.status == "completed" and (job.job_type not in ("batch_calculate", RETRY_JOB_TYPE) or job.failed == 0):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="재개할 항목이 없는 작업입니다"
+        )
+    
+    reset_failed_items(db, job)
+    get_scoring_worker().submit(job.id)
+    
+    return job
+
+def _get_weight_profile_or_404(db: Session, profile_id: int) -> ScoringWeightProfile:
+    profile = db.query(ScoringWeightProfile).filter(ScoringWeightProfile.id == profile_id).first()
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="가중치 프로필을 찾을 수 없습니다"
+        )
+    return profile
+
+@router.get("/weight-profiles", response_model=List[WeightProfileResponse])
+async def list_weight_profiles(
+    name: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """총점 가중치 프로필 목록 조회 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    query = db.query(ScoringWeightProfile)
+    if name:
+        query = query.filter(ScoringWeightProfile.name == name)
+    return query.order_by(ScoringWeightProfile.name, ScoringWeightProfile.version.desc()).all()
+
+@router.post("/weight-profiles", response_model=WeightProfileResponse)
+async def create_scoring_weight_profile(
+    profile_request: WeightProfileCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """총점 가중치 프로필 생성 - 같은 이름이 있으면 다음 버전으로 저장 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    try:
+        profile = create_weight_profile(
+            db,
+            profile_request.name,
+            {category: getattr(profile_request, f"{category}_weight") for category in CATEGORIES},
+            description=profile_request.description,
+            created_by=current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    if profile_request.activate:
+        activate_weight_profile(db, profile)
+        db.refresh(profile)
+    return profile
+
+@router.post("/weight-profiles/{profile_id}/activate", response_model=WeightProfileActivateResponse)
+async def activate_scoring_weight_profile(
+    profile_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """가중치 프로필을 활성화하고 저장된 모든 점수의 총점을 AI 호출 없이 재계산 (Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    profile = _get_weight_profile_or_404(db, profile_id)
+    started = time.perf_counter()
+    rescored = activate_weight_profile(db, profile)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    db.refresh(profile)
+    
+    return WeightProfileActivateResponse(
+        profile=WeightProfileResponse.model_validate(profile),
+        rescored=rescored,
+        elapsed_ms=elapsed_ms
+    )
+
+@router.get("/weight-profiles/{profile_id}/preview", response_model=List[WeightProfilePreviewItem])
+async def preview_scoring_weight_profile(
+    profile_id: int,
+    limit: int = Query(20, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """가중치 프로필 적용 시 상위 예측과 현재 총점 비교 (저장하지 않음, Admin만)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    profile = _get_weight_profile_or_404(db, profile_id)
+    return preview_rerank(db, profile_weights(profile), limit=limit)
+
 @router.get("/{prediction_id}", response_model=PredictionScoreSchema)
 async def get_prediction_score(
     prediction_id: int,
@@ -107,8 +525,10 @@ async def get_prediction_score(
     
     return score
 
-@router.post("/batch-calculate", response_model=List[PredictionScoreSchema])
+@router.post("/batch-calculate", response_model=BatchScoringResponse)
 async def batch_calculate_scores(
+    concurrency: Optional[int] = Query(None, ge=1, le=64),
+    batch_size: Optional[int] = Query(None, ge=1, le=50),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -126,64 +546,98 @@ async def batch_calculate_scores(
         )
     ).all()
     
-    if not unscored_predictions:
-        return []
+    scoring_engine = ScoringEngine(concurrency=concurrency, batch_size=batch_size)
+    results = await scoring_engine.score_predictions(db, unscored_predictions)
+    
+    # 저장된 점수들을 새로고침하여 반환
+    scores = []
+    for item in results:
+        if item.success:
+            db.refresh(item.score)
+            scores.append(PredictionScoreSchema.model_validate(item.score))
     
-    ai_service = AIScoringService()
-    calculated_scores = []
+    return BatchScoringResponse(
+        total=len(results),
+        succeeded=len(scores),
+        failed=len(results) - len(scores),
+        scores=scores,
+        results=[_batch_item(item) for item in results]
+    )
+
+@router.post("/batch-calculate/stream")
+async def batch_calculate_scores_stream(
+    concurrency: Optional[int] = Query(None, ge=1, le=64),
+    batch_size: Optional[int] = Query(None, ge=1, le=50),
+    commit_batch_size: Optional[int] = Query(None, ge=1, le=500),
+    stream_format: str = Query("ndjson", alias="format", pattern="^(ndjson|sse)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    스코어링되지 않은 모든 예측 이벤트에 대해 일괄 AI 점수 계산 후 결과를 스트리밍 (Admin만)
+    - 커밋된 예측마다 score 이벤트 하나, 마지막에 summary 이벤트 전송
+    - format=ndjson(기본)이면 한 줄당 JSON 하나, format=sse면 Server-Sent Events
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin 권한이 필요합니다"
+        )
+    
+    scoring_engine = ScoringEngine(
+        concurrency=concurrency,
+        batch_size=batch_size,
+        commit_batch_size=commit_batch_size or batch_size or 1
+    )
     
-    for prediction in unscored_predictions:
+    async def event_stream():
+        # 응답 전송이 끝날 때까지 쓰는 별도 세션
+        stream_db = SessionLocal()
+        started = time.perf_counter()
+        counts = {"total": 0, "succeeded": 0, "failed": 0, "cache_hits": 0, "fallbacks": 0, "deferred": 0}
         try:
-            scoring_data = {
-                'game_id': prediction.game_id,
-                'prediction': prediction.prediction,
-                'option_a': prediction.option_a,
-                'option_b': prediction.option_b,
-                'creator_username': 'unknown',  # TODO: 사용자 정보 조회
-                'creator_activity_days': 0,
-                'creator_contribution_score': 0.0
-            }
+            unscored_predictions = stream_db.query(PredictionEvent).filter(
+                ~PredictionEvent.id.in_(
+                    stream_db.query(PredictionScore.prediction_id)
+                )
+            ).order_by(PredictionEvent.id).all()
+            yield _format_stream_event("start", {"total": len(unscored_predictions)}, stream_format)
             
-            score_result = ai_service.calculate_prediction_score(scoring_data)
+            async for batch in scoring_engine.iter_score_batches(stream_db, unscored_predictions):
+                for item in batch:
+                    counts["total"] += 1
+                    counts["succeeded" if item.success else "failed"] += 1
+                    counts["cache_hits"] += item.cache_hit
+                    counts["fallbacks"] += item.is_fallback
+                    counts["deferred"] += item.deferred
+                    yield _format_stream_event("score", _batch_item(item).model_dump(), stream_format)
+                # 커밋된 점수 객체는 더 이상 필요 없으므로 세션에서 분리
+                stream_db.expunge_all()
             
-            # 데이터베이스에 점수 저장
-            db_score = PredictionScore(
-                prediction_id=prediction.id,
-                quality_score=score_result['quality_score'],
-                demand_score=score_result['demand_score'],
-                reputation_score=score_result['reputation_score'],
-                novelty_score=score_result['novelty_score'],
-                economic_score=score_result['economic_score'],
-                total_score=score_result['total_score'],
-                quality_details=score_result['quality_details'],
-                demand_details=score_result['demand_details'],
-                reputation_details=score_result['reputation_details'],
-                novelty_details=score_result['novelty_details'],
-                economic_details=score_result['economic_details'],
-                ai_reasoning=score_result['ai_reasoning']
+            summary = BatchScoringSummary(
+                elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+                **counts
             )
-            
-            db.add(db_score)
-            calculated_scores.append(db_score)
-            time.sleep(1)
-        except Exception as e:
-            print(f"Error calculating score for prediction {prediction.id}: {e}")
-            continue
-    
-    db.commit()
-    
-    # 저장된 점수들을 새로고침하여 반환
-    for score in calculated_scores:
-        db.refresh(score)
+            yield _format_stream_event("summary", summary.model_dump(), stream_format)
+        finally:
+            stream_db.close()
     
-    return calculated_scores
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        event_stream(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.post("/batch-calculate-and-select", response_model=dict)
 async def batch_calculate_and_select_best(
+    concurrency: Optional[int] = Query(None, ge=1, le=64),
+    batch_size: Optional[int] = Query(None, ge=1, le=50),
+    top_k: int = Query(1, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """스코어링되지 않은 모든 예측 이벤트에 대해 일괄 AI 점수 계산 후 가장 높은 점수의 예측을 자동 선택하여 승인"""
+    """스코어링되지 않은 모든 예측 이벤트에 대해 일괄 AI 점수 계산 후 가장 높은 점수의 예측(top_k개)을 자동 선택하여 승인"""
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -201,121 +655,101 @@ async def batch_calculate_and_select_best(
         return {
             "message": "No unscored predictions found",
             "selected_prediction": None,
+            "selected_predictions": [],
             "calculated_scores": []
         }
     
-    ai_service = AIScoringService()
-    calculated_scores = []
+    # 스코어링 커밋으로 예측 객체가 만료되기 전에 후보 값 복사
+    candidates = snapshot_candidates(unscored_predictions)
     
     # 모든 예측에 대해 스코어링 수행
-    for prediction in unscored_predictions:
-        try:
-            scoring_data = {
-                'game_id': prediction.game_id,
-                'prediction': prediction.prediction,
-                'option_a': prediction.option_a,
-                'option_b': prediction.option_b,
-                'creator_username': 'unknown',
-                'creator_activity_days': 0,
-                'creator_contribution_score': 0.0
-            }
-            
-            score_result = ai_service.calculate_prediction_score(scoring_data)
-            
-            # 데이터베이스에 점수 저장
-            db_score = PredictionScore(
-                prediction_id=prediction.id,
-                quality_score=score_result['quality_score'],
-                demand_score=score_result['demand_score'],
-                reputation_score=score_result['reputation_score'],
-                novelty_score=score_result['novelty_score'],
-                economic_score=score_result['economic_score'],
-                total_score=score_result['total_score'],
-                quality_details=score_result['quality_details'],
-                demand_details=score_result['demand_details'],
-                reputation_details=score_result['reputation_details'],
-                novelty_details=score_result['novelty_details'],
-                economic_details=score_result['economic_details'],
-                ai_reasoning=score_result['ai_reasoning']
-            )
-            
-            db.add(db_score)
-            calculated_scores.append({
-                'prediction_id': prediction.id,
-                'game_id': prediction.game_id,
-                'prediction': prediction.prediction,
-                'total_score': score_result['total_score']
-            })
-            
-        except Exception as e:
-            print(f"Error calculating score for prediction {prediction.id}: {e}")
-            continue
-    
-    db.commit()
-    
-    # 가장 높은 점수의 예측 찾기
-    if calculated_scores:
-        best_score = max(calculated_scores, key=lambda x: x['total_score'])
-        best_prediction_id = best_score['prediction_id']
-        
-        # 가장 높은 점수의 예측을 승인 상태로 변경
-        best_prediction = db.query(PredictionEvent).filter(
-            PredictionEvent.id == best_prediction_id
-        ).first()
-        
-        if best_prediction:
-            # 1위 예측을 승인
-            best_prediction.status = "approved"
-            
-            # 나머지 모든 pending 예측들을 삭제
-            deleted_count = 0
-            for prediction in unscored_predictions:
-                if prediction.id != best_prediction_id:
-                    # 관련된 점수도 함께 삭제
-                    db.query(PredictionScore).filter(
-                        PredictionScore.prediction_id == prediction.id
-                    ).delete()
-                    # 예측 이벤트 삭제
-                    db.delete(prediction)
-                    deleted_count += 1
-            
-            db.commit()
-            
-            return {
-                "message": f"Batch scoring completed. Selected prediction with highest score: {best_score['total_score']:.2f}. Deleted {deleted_count} other pending predictions.",
-                "selected_prediction": {
-                    "id": best_prediction.id,
-                    "game_id": best_prediction.game_id,
-                    "prediction": best_prediction.prediction,
-                    "option_a": best_prediction.option_a,
-                    "option_b": best_prediction.option_b,
-                    "deadline": best_prediction.deadline,
-                    "expires_at": best_prediction.expires_at,
-                    "user_address": best_prediction.user_address,
-                    "total_score": best_score['total_score'],
-                    "status": "approved"
-                },
-                "deleted_count": deleted_count,
-                "calculated_scores": calculated_scores
-            }
+    scoring_engine = ScoringEngine(concurrency=concurrency, batch_size=batch_size)
+    results = await scoring_engine.score_predictions(db, unscored_predictions)
     
-    return {
-        "message": "Batch scoring completed but no prediction was selected",
-        "selected_prediction": None,
-        "calculated_scores": calculated_scores
-    }
+    return select_best_prediction(db, candidates, results, top_k=top_k)
 
-@router.get("/", response_model=List[PredictionScoreSchema])
+def _encode_score_cursor(total_score: float, score_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{total_score!r}:{score_id}".encode()).decode().rstrip("=")
+
+def _decode_score_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        total_score, score_id = base64.urlsafe_b64decode(padded.encode()).decode().split(":")
+        return float(total_score), int(score_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 cursor입니다"
+        )
+
+SCORE_SUMMARY_COLUMNS = (
+    PredictionScore.id,
+    PredictionScore.prediction_id,
+    PredictionScore.quality_score,
+    PredictionScore.demand_score,
+    PredictionScore.reputation_score,
+    PredictionScore.novelty_score,
+    PredictionScore.economic_score,
+    PredictionScore.total_score,
+    PredictionScore.created_at
+)
+SCORE_DETAIL_COLUMNS = (
+    PredictionScore.quality_details,
+    PredictionScore.demand_details,
+    PredictionScore.reputation_details,
+    PredictionScore.novelty_details,
+    PredictionScore.economic_details,
+    PredictionScore.ai_reasoning
+)
+
+@router.get("/", response_model=List[ScoreLeaderboardItem], response_model_exclude_unset=True)
 async def get_all_scores(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="이전 페이지 응답의 X-Next-Cursor 헤더 값"),
+    prediction_status: Optional[str] = Query(None, alias="status"),
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    max_score: Optional[float] = Query(None, ge=0, le=100),
+    include_details: bool = Query(False),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """모든 예측 이벤트의 AI 점수 조회 (총점 순으로 정렬)"""
+    """
+    예측 이벤트 AI 점수 순위 조회 (총점 내림차순, Admin만)
+    (total_score DESC, id) 인덱스를 따라 키셋 페이지네이션하므로 전체 점수 수와 무관하게 페이지당 limit개만 읽음
+    다음 페이지가 있으면 예측 목록과 같이 X-Next-Cursor 헤더에 cursor를 담아 반환
+    """
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin 권한이 필요합니다"
         )
     
-    scores = db.query(PredictionScore).order_by(PredictionScore.total_score.desc()).all()
-    return scores
+    columns = SCORE_SUMMARY_COLUMNS + (SCORE_DETAIL_COLUMNS if include_details else ())
+    query = db.query(*columns, PredictionEvent.status.label("prediction_status")).join(
+        PredictionEvent, PredictionEvent.id == PredictionScore.prediction_id
+    )
+    
+    if prediction_status:
+        query = query.filter(PredictionEvent.status == prediction_status)
+    if min_score is not None:
+        query = query.filter(PredictionScore.total_score >= min_score)
+    if max_score is not None:
+        query = query.filter(PredictionScore.total_score <= max_score)
+    if cursor:
+        after_score, after_id = _decode_score_cursor(cursor)
+        query = query.filter(or_(
+            PredictionScore.total_score < after_score,
+            and_(PredictionScore.total_score == after_score, PredictionScore.id > after_id)
+        ))
+    
+    rows = query.order_by(
+        PredictionScore.total_score.desc(),
+        PredictionScore.id
+    ).limit(limit + 1).all()
+    
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = _encode_score_cursor(rows[-1].total_score, rows[-1].id)
+    
+    return [ScoreLeaderboardItem(**row._asdict()) for row in rows]
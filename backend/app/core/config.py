@@ -30,6 +30,60 @@ class Settings(BaseSettings):
     
     # AI 설정
     GEMINI_API_KEY: str = "your-gemini-api-key-here"
+    GEMINI_API_BASE_URL: str = "https://generativelanguage.googleapis.com/v1beta"  # 로컬 스텁(gemini_stub.py) 사용 시 변경
+    GEMINI_REQUESTS_PER_MINUTE: int = 15  # Gemini 할당량 (RPM)
+    GEMINI_TOKENS_PER_MINUTE: int = 1000000  # Gemini 할당량 (TPM)
+    GEMINI_MAX_RETRIES: int = 5  # 429/5xx/연결 오류 재시도 횟수
+    GEMINI_RETRY_BASE_SECONDS: float = 1.0  # 지수 백오프 기본 간격
+    GEMINI_RETRY_MAX_SECONDS: float = 60.0  # 재시도 대기 최대값
+    
+    # 외부 HTTP 클라이언트 설정 (Gemini 등)
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_READ_TIMEOUT_SECONDS: float = 60.0
+    HTTP_MAX_CONNECTIONS: int = 50
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    
+    # AI 점수 캐시 설정
+    SCORE_CACHE_BACKEND: str = "memory"  # memory, redis, none
+    SCORE_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    SCORE_CACHE_MAX_ENTRIES: int = 10000  # memory 백엔드 LRU 최대 항목 수
+    
+    # 일괄 스코어링 설정
+    SCORING_CONCURRENCY: int = 8  # 동시 AI 호출 수
+    SCORING_MIN_INTERVAL_SECONDS: float = 0.1  # AI 호출 시작 간 최소 간격
+    SCORING_COMMIT_BATCH_SIZE: int = 25  # 한 번에 커밋할 점수 수
+    SCORING_BATCH_SIZE: int = 10  # 프롬프트 하나에 묶을 예측 수 (1이면 단건 호출)
+    SCORING_BATCH_ITEM_RETRIES: int = 1  # 배치 응답 누락 항목 재요청 횟수
+    SCORING_JOB_STALE_SECONDS: float = 600.0  # running 작업의 진행 기록이 이 시간 동안 없으면 다른 워커가 이어받음
+    SCORING_WEIGHTS_TTL_SECONDS: float = 5.0  # 다른 프로세스에서 활성화한 가중치 프로필 반영을 위해 DB에서 다시 읽는 주기
+    
+    # AI 호출 사용량 기록 설정
+    AI_USAGE_RING_SIZE: int = 5000  # 최근 호출 기록을 보관할 링 버퍼 크기
+    AI_USAGE_FLUSH_SECONDS: float = 30.0  # 시간별 집계 테이블 반영 주기
+    GEMINI_INPUT_PRICE_PER_MTOK: float = 0.075  # 입력 100만 토큰당 USD (비용 추정용)
+    GEMINI_OUTPUT_PRICE_PER_MTOK: float = 0.30  # 출력 100만 토큰당 USD
+    
+    # 스코어링 백엔드 서킷 브레이커 설정
+    SCORING_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패가 이 횟수에 도달하면 서킷 open
+    SCORING_CIRCUIT_RECOVERY_SECONDS: float = 30.0  # open 후 half-open 시험 호출까지 대기
+    SCORING_CIRCUIT_HALF_OPEN_MAX_CALLS: int = 1  # half-open 상태에서 허용할 시험 호출 수
+    SCORING_FALLBACK_MODE: str = "provisional"  # 백엔드 장애 시 provisional(임시 점수 반환) 또는 queue(즉시 실패)
+    
+    # 베팅 풀 배당 계산 (컨트랙트 create_pool 파라미터와 같게 유지)
+    POOL_FEE_BPS: int = 200  # 정산 수수료 (bps, 200 = 2%)
+    USDC_DECIMALS: int = 6
+    
+    # 베팅 일괄 등록
+    BET_BULK_MAX_ITEMS: int = 500  # 한 번에 등록할 수 있는 최대 베팅 수
+    
+    # 실시간 알림 (WebSocket/SSE)
+    REALTIME_BACKEND: str = "memory"  # memory(프로세스 내), redis(여러 워커 공유)
+    REALTIME_REDIS_CHANNEL: str = "suiports:realtime"
+    REALTIME_QUEUE_SIZE: int = 100  # 구독자별 전송 대기 이벤트 최대 수 (넘으면 오래된 것부터 버림)
+    REALTIME_HEARTBEAT_SECONDS: float = 15.0  # 이벤트가 없을 때 연결 유지 메시지 간격
+    
+    # 예측 만료 스케줄러
+    EXPIRY_RESYNC_SECONDS: float = 300.0  # 다른 프로세스에서 승인된 예측 반영을 위해 DB에서 다시 읽는 주기
     
     class Config:
         env_file = ".env"
@@ -1,6 +1,6 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, Float
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, Float, UniqueConstraint, Index, func, inspect, select, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
 import json
 
@@ -87,6 +87,15 @@ class User(Base):
 # 예측 이벤트 모델
 class PredictionEvent(Base):
     __tablename__ = "prediction_events"
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (created_at DESC, id DESC)과 필터별 복합 인덱스
+        Index("ix_prediction_events_created_at_id", "created_at", "id"),
+        Index("ix_prediction_events_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_prediction_events_game_id_created_at_id", "game_id", "created_at", "id"),
+        Index("ix_prediction_events_creator_id_created_at_id", "creator_id", "created_at", "id"),
+        # 만료 스케줄러의 일괄 UPDATE (status IN (...) AND expires_at <= now)
+        Index("ix_prediction_events_status_expires_at", "status", "expires_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(String(100), nullable=False)
@@ -99,17 +108,25 @@ class PredictionEvent(Base):
     status = Column(String(20), default="pending")  # pending, approved, rejected, active, expired
     created_at = Column(DateTime, default=datetime.utcnow)
     expires_at = Column(DateTime)
-    total_bets = Column(Integer, default=0)
-    total_amount = Column(Integer, default=0)
+    total_bets = Column(Integer, default=0)  # 베팅 생성 시 같은 트랜잭션에서 증분 갱신
+    total_amount = Column(Float, default=0)
     user_address = Column(String(100), nullable=True)  # 지갑 주소
     pool_id = Column(String(100), nullable=True)  # Sui 컨트랙트 Pool ID
+    
+    # 제안자 (목록 조회에서는 joinedload로 한 번에 로드)
+    creator_user = relationship("User")
+    
+    @property
+    def creator(self):
+        """응답용 제안자 username"""
+        return self.creator_user.username if self.creator_user else "Unknown"
 
 # 예측 점수 모델
 class PredictionScore(Base):
     __tablename__ = "prediction_scores"
     
     id = Column(Integer, primary_key=True, index=True)
-    prediction_id = Column(Integer, ForeignKey("prediction_events.id"), nullable=False)
+    prediction_id = Column(Integer, ForeignKey("prediction_events.id"), nullable=False, unique=True, index=True)
     quality_score = Column(Float, nullable=False)  # 품질/해결 가능성 (35%)
     demand_score = Column(Float, nullable=False)   # 수요/트렌드 신호 (25%)
     reputation_score = Column(Float, nullable=False)  # 제안자 신뢰/기여 (20%)
@@ -124,9 +141,18 @@ class PredictionScore(Base):
     ai_reasoning = Column(Text)     # AI 추론 과정
     created_at = Column(DateTime, default=datetime.utcnow)
 
+# 총점 순위 조회(키셋 페이지네이션)용 인덱스
+Index("ix_prediction_scores_total_score_id", PredictionScore.total_score.desc(), PredictionScore.id)
+
 # 베팅 모델
 class Bet(Base):
     __tablename__ = "bets"
+    __table_args__ = (
+        # 예측별 베팅 조회와 옵션별 합계 재계산
+        Index("ix_bets_prediction_id_option", "prediction_id", "option"),
+        # 같은 트랜잭션의 중복 저장 방지 (일괄 등록의 ON CONFLICT 대상, NULL은 중복 허용)
+        Index("uq_bets_transaction_hash", "transaction_hash", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     prediction_id = Column(Integer, ForeignKey("prediction_events.id"), nullable=False)
@@ -138,9 +164,207 @@ class Bet(Base):
     pool_id = Column(String(100), nullable=True)  # Sui Pool ID
     created_at = Column(DateTime, default=datetime.utcnow)
 
+# 예측별 옵션 베팅 집계 모델 (베팅 생성 시 증분 갱신, 전체 합계는 prediction_events에 저장)
+class PredictionPoolStats(Base):
+    __tablename__ = "prediction_pool_stats"
+    
+    prediction_id = Column(Integer, ForeignKey("prediction_events.id"), primary_key=True)
+    option_a_bets = Column(Integer, default=0, nullable=False)
+    option_a_amount = Column(Float, default=0.0, nullable=False)
+    option_b_bets = Column(Integer, default=0, nullable=False)
+    option_b_amount = Column(Float, default=0.0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# 제안자 평판 집계 모델 (예측/베팅 발생 시 증분 갱신)
+class CreatorStats(Base):
+    __tablename__ = "creator_stats"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    activity_days = Column(Integer, default=0, nullable=False)  # 활동한 날짜 수
+    last_active_date = Column(String(10))  # 마지막 활동일 (YYYY-MM-DD)
+    predictions_created = Column(Integer, default=0, nullable=False)
+    approved_count = Column(Integer, default=0, nullable=False)
+    rejected_count = Column(Integer, default=0, nullable=False)
+    bets_attracted = Column(Integer, default=0, nullable=False)  # 제안한 예측에 들어온 베팅 수
+    bet_volume_attracted = Column(Float, default=0.0, nullable=False)  # 제안한 예측에 들어온 베팅 금액
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# 자동 선택에서 선택되지 않아 삭제된 예측 기록 (제안자 거절 이력 보존용)
+class DiscardedPrediction(Base):
+    __tablename__ = "discarded_predictions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    prediction_id = Column(Integer, nullable=False)  # 삭제된 예측 ID (행이 없으므로 FK 없음)
+    creator_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    discarded_at = Column(DateTime, default=datetime.utcnow)
+
+# AI 스코어링 작업 모델
+class ScoringJob(Base):
+    __tablename__ = "scoring_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String(50), nullable=False)  # batch_calculate, batch_calculate_and_select, retry_deferred
+    status = Column(String(20), default="queued", index=True)  # queued, running, completed, failed
+    params = Column(JSON)  # concurrency, batch_size 등 실행 옵션
+    total = Column(Integer, default=0)
+    processed = Column(Integer, default=0)
+    succeeded = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+    result = Column(JSON)  # 작업 결과 요약 (자동 선택 결과 등)
+    error = Column(Text)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)  # 작업을 맡은 워커의 마지막 진행 기록 (오래되면 다른 워커가 이어받음)
+
+# AI 스코어링 작업 항목 모델
+class ScoringJobItem(Base):
+    __tablename__ = "scoring_job_items"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("scoring_jobs.id"), nullable=False, index=True)
+    prediction_id = Column(Integer, nullable=False)
+    status = Column(String(20), default="pending")  # pending, succeeded, failed
+    total_score = Column(Float)
+    error = Column(Text)
+    latency_ms = Column(Float)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# 총점 가중치 프로필 모델 (이름별 버전 관리, 활성 프로필 하나로 total_score 계산)
+class ScoringWeightProfile(Base):
+    __tablename__ = "scoring_weight_profiles"
+    __table_args__ = (UniqueConstraint("name", "version", name="uq_scoring_weight_profile_version"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    version = Column(Integer, nullable=False, default=1)
+    quality_weight = Column(Float, nullable=False)
+    demand_weight = Column(Float, nullable=False)
+    reputation_weight = Column(Float, nullable=False)
+    novelty_weight = Column(Float, nullable=False)
+    economic_weight = Column(Float, nullable=False)
+    description = Column(Text)
+    is_active = Column(Boolean, default=False, index=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    activated_at = Column(DateTime)
+
+# AI 호출 사용량 집계 모델 (시간 단위 버킷 x 모델 x 호출 종류별 누적)
+class AIUsageStat(Base):
+    __tablename__ = "ai_usage_stats"
+    __table_args__ = (UniqueConstraint("bucket_start", "model", "call_kind", name="uq_ai_usage_stat_bucket"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    bucket_start = Column(DateTime, nullable=False, index=True)  # 집계 구간 시작 (UTC, 정시)
+    model = Column(String(100), nullable=False)
+    call_kind = Column(String(20), nullable=False)  # single, batch, fields
+    calls = Column(Integer, default=0, nullable=False)  # 캐시 적중 포함
+    errors = Column(Integer, default=0, nullable=False)
+    cache_hits = Column(Integer, default=0, nullable=False)
+    retries = Column(Integer, default=0, nullable=False)
+    prompt_tokens = Column(Integer, default=0, nullable=False)
+    output_tokens = Column(Integer, default=0, nullable=False)
+    total_tokens = Column(Integer, default=0, nullable=False)
+    latency_ms_sum = Column(Float, default=0.0, nullable=False)
+    latency_ms_max = Column(Float, default=0.0, nullable=False)
+    cost_usd = Column(Float, default=0.0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# DB 종류에 맞는 INSERT 구문 (ON CONFLICT 지원)
+def dialect_insert(db, model):
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
+
 # 데이터베이스 테이블 생성
 def create_tables():
     Base.metadata.create_all(bind=engine)
+    add_missing_columns()
+    upgrade_column_types()
+    create_missing_indexes()
+
+# 이미 있던 테이블에 나중에 추가된 nullable 컬럼 (create_all은 기존 테이블에 컬럼을 추가하지 않음)
+ADDED_COLUMNS = [("scoring_jobs", "heartbeat_at")]
+
+def add_missing_columns(bind=None):
+    """기존 DB에 없는 ADDED_COLUMNS 컬럼을 ALTER TABLE ... ADD COLUMN으로 추가"""
+    bind = bind or engine
+    inspector = inspect(bind)
+    for table_name, column_name in ADDED_COLUMNS:
+        if not inspector.has_table(table_name):
+            continue
+        if any(c["name"] == column_name for c in inspector.get_columns(table_name)):
+            continue
+        column_type = Base.metadata.tables[table_name].c[column_name].type.compile(dialect=bind.dialect)
+        with bind.begin() as connection:
+            connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"))
+        print(f"{table_name}.{column_name} 컬럼을 추가했습니다.")
+
+# 나중에 Integer에서 Float로 바뀐 컬럼 (create_all은 기존 테이블의 컬럼 타입을 바꾸지 않음)
+FLOAT_UPGRADED_COLUMNS = [("prediction_events", "total_amount")]
+
+def upgrade_column_types(bind=None):
+    """
+    기존 DB에 INTEGER로 남아 있는 컬럼을 실수형으로 변경 (소수 USDC 금액이 잘리지 않도록)
+    SQLite는 INTEGER 컬럼에도 소수 값을 REAL로 그대로 저장하므로 변경하지 않음
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+    for table_name, column_name in FLOAT_UPGRADED_COLUMNS:
+        if not inspector.has_table(table_name):
+            continue
+        column = next((c for c in inspector.get_columns(table_name) if c["name"] == column_name), None)
+        if column is None or not isinstance(column["type"], Integer) or bind.dialect.name == "sqlite":
+            continue
+        if bind.dialect.name != "postgresql":
+            print(f"{table_name}.{column_name} 컬럼을 실수형으로 직접 변경해야 합니다.")
+            continue
+        with bind.begin() as connection:
+            connection.execute(text(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE DOUBLE PRECISION"
+            ))
+        print(f"{table_name}.{column_name} 컬럼을 DOUBLE PRECISION으로 변경했습니다.")
+
+class DuplicateKeyError(RuntimeError):
+    """기존 데이터의 중복 때문에 유니크 인덱스를 만들 수 없는 경우"""
+
+def _duplicate_keys(bind, index, limit: int = 5):
+    """유니크 인덱스 컬럼 값이 중복된 (값..., 개수) 행 목록 (최대 limit개, NULL은 중복 허용)"""
+    columns = list(index.columns)
+    query = select(*columns, func.count()).where(
+        *(column.isnot(None) for column in columns)
+    ).group_by(*columns).having(func.count() > 1).limit(limit)
+    with bind.connect() as connection:
+        return [tuple(row) for row in connection.execute(query)]
+
+# 이미 있던 테이블에 나중에 추가된 인덱스 생성 (create_all은 새 테이블의 인덱스만 만듦)
+def create_missing_indexes(bind=None):
+    """
+    없는 인덱스를 생성하고, 인덱스를 만들 수 없으면 서버 시작을 중단
+    유니크 인덱스(bets.transaction_hash 등)가 없으면 ON CONFLICT 저장이 모든 요청에서 실패하므로
+    기존 데이터에 중복이 있으면 중복 값을 보여 주고 DuplicateKeyError 발생
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.unique:
+                duplicates = _duplicate_keys(bind, index)
+                if duplicates:
+                    raise DuplicateKeyError(
+                        f"{table.name}에 중복 값이 있어 유니크 인덱스 {index.name}을 만들 수 없습니다. "
+                        f"중복 행을 정리한 뒤 다시 시작하세요. (값, 개수): {duplicates}"
+                    )
+            index.create(bind=bind)
+            print(f"인덱스 {index.name}을 생성했습니다.")
 
 # 데이터베이스 세션 의존성
 def get_db():
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class BetCreate(BaseModel):
@@ -33,3 +33,32 @@ class UserBetsResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+class PoolTotalsResponse(BaseModel):
+    prediction_id: int
+    total_bets: int
+    total_amount: float
+    option_a_bets: int
+    option_a_amount: float
+    option_b_bets: int
+    option_b_amount: float
+
+class BetBulkItem(BetCreate):
+    transaction_hash: str  # 중복 판단 기준 (필수)
+    user_id: Optional[int] = None  # Admin이 다른 사용자 베팅을 등록할 때만 지정
+
+class BetBulkCreate(BaseModel):
+    bets: List[BetBulkItem]
+
+class BetBulkItemResult(BaseModel):
+    index: int
+    transaction_hash: str
+    status: str  # accepted, duplicate, rejected
+    bet_id: Optional[int] = None
+    detail: Optional[str] = None
+
+class BetBulkResponse(BaseModel):
+    accepted: int
+    duplicates: int
+    rejected: int
+    items: List[BetBulkItemResult]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 # 예측 이벤트 생성 스키마
@@ -27,7 +27,7 @@ class PredictionEventResponse(BaseModel):
     created_at: datetime
     expires_at: Optional[datetime]
     total_bets: int
-    total_amount: int
+    total_amount: float
     user_address: Optional[str] = None
     pool_id: Optional[str] = None  # Sui 컨트랙트 Pool ID
     creator: Optional[str] = None
@@ -42,3 +42,35 @@ class PredictionEventApproval(BaseModel):
 # Pool ID 업데이트 스키마
 class PredictionEventPoolUpdate(BaseModel):
     pool_id: str  # Sui 컨트랙트 Pool ID
+
+# 근접 중복 예측 항목 스키마
+class SimilarPrediction(BaseModel):
+    prediction_id: int
+    similarity: float  # MinHash 기반 Jaccard 유사도 추정치 (0-1)
+
+# 근접 중복 조회 응답 스키마
+class PredictionSimilarResponse(BaseModel):
+    prediction_id: int
+    novelty_score: float
+    first_mover: int
+    uniqueness: int
+    similar: List[SimilarPrediction]
+
+# 예측 옵션별 배당 스키마 (payout_multiplier: 이 옵션이 이기면 1 USDC당 지급액, 수수료 차감 후)
+class PredictionOptionOdds(BaseModel):
+    side: str  # a, b
+    label: str
+    total_amount: float
+    bettors: int
+    share: float
+    payout_multiplier: Optional[float] = None
+
+# 예측 배당 응답 스키마
+class PredictionOddsResponse(BaseModel):
+    prediction_id: int
+    total_amount: float
+    total_bettors: int
+    fee_bps: int
+    fee_amount: float
+    net_pot: float
+    options: List[PredictionOptionOdds]
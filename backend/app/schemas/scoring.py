@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field
+from typing import Annotated, Optional, Dict, Any, List
 from datetime import datetime
 
 # AI 평가 점수 스키마
@@ -19,10 +19,49 @@ class PredictionScore(BaseModel):
     economic_details: Dict[str, Any]  # 경제성 세부 점수
     ai_reasoning: str     # AI 추론 과정
     created_at: Optional[datetime] = None
+    is_provisional: bool = False  # 백엔드 장애 시 저장하지 않은 임시 점수
     
     class Config:
         from_attributes = True
 
+# 점수 순위 목록 항목 스키마 (세부 점수 JSON은 include_details일 때만 포함)
+class ScoreLeaderboardItem(BaseModel):
+    id: int
+    prediction_id: int
+    prediction_status: Optional[str] = None
+    quality_score: float
+    demand_score: float
+    reputation_score: float
+    novelty_score: float
+    economic_score: float
+    total_score: float
+    created_at: Optional[datetime] = None
+    quality_details: Optional[Dict[str, Any]] = None
+    demand_details: Optional[Dict[str, Any]] = None
+    reputation_details: Optional[Dict[str, Any]] = None
+    novelty_details: Optional[Dict[str, Any]] = None
+    economic_details: Optional[Dict[str, Any]] = None
+    ai_reasoning: Optional[str] = None
+
+# Gemini 출력 카테고리 점수 (bool/문자열은 허용하지 않고 복구 단계에서 처리)
+AIScoreValue = Annotated[float, Field(ge=0, le=100, strict=True)]
+
+# Gemini 단건 평가 출력 스키마 (독창성은 서버에서 계산하므로 제외)
+class AIScoreOutput(BaseModel):
+    quality_score: AIScoreValue
+    demand_score: AIScoreValue
+    reputation_score: AIScoreValue
+    economic_score: AIScoreValue
+    quality_details: Dict[str, float] = {}
+    demand_details: Dict[str, float] = {}
+    reputation_details: Dict[str, float] = {}
+    economic_details: Dict[str, float] = {}
+    ai_reasoning: str = ""
+
+# Gemini 배치 평가 출력 원소 스키마
+class AIBatchScoreOutput(AIScoreOutput):
+    id: str
+
 # AI 평가 요청 스키마
 class ScoringRequest(BaseModel):
     prediction_id: int
@@ -33,3 +72,114 @@ class ScoringRequest(BaseModel):
     creator_username: str
     creator_activity_days: Optional[int] = 0
     creator_contribution_score: Optional[float] = 0.0
+
+# 일괄 스코어링 개별 결과 스키마
+class BatchScoringItem(BaseModel):
+    prediction_id: int
+    success: bool
+    total_score: Optional[float] = None
+    error: Optional[str] = None
+    latency_ms: float = 0.0
+    cache_hit: bool = False
+    is_fallback: bool = False
+    deferred: bool = False  # 재스코어링 대기열에 추가됨
+
+# 스트리밍 일괄 스코어링 종료 요약 스키마
+class BatchScoringSummary(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    cache_hits: int
+    fallbacks: int
+    deferred: int
+    elapsed_ms: float
+
+# 일괄 스코어링 응답 스키마
+class BatchScoringResponse(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    scores: List[PredictionScore]
+    results: List[BatchScoringItem]
+
+# 스코어링 작업 생성 스키마
+class ScoringJobCreate(BaseModel):
+    job_type: str = "batch_calculate"  # batch_calculate, batch_calculate_and_select
+    concurrency: Optional[int] = None
+    batch_size: Optional[int] = None
+    top_k: int = 1  # batch_calculate_and_select에서 승인할 상위 예측 수
+
+# 스코어링 작업 항목 스키마
+class ScoringJobItemResponse(BaseModel):
+    prediction_id: int
+    status: str  # pending, succeeded, failed
+    total_score: Optional[float] = None
+    error: Optional[str] = None
+    latency_ms: Optional[float] = None
+    
+    class Config:
+        from_attributes = True
+
+# 스코어링 작업 응답 스키마
+class ScoringJobResponse(BaseModel):
+    id: int
+    job_type: str
+    status: str  # queued, running, completed, failed
+    params: Optional[Dict[str, Any]] = None
+    total: int
+    processed: int
+    succeeded: int
+    failed: int
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+# 스코어링 작업 상세 응답 스키마 (항목별 결과 포함)
+class ScoringJobDetailResponse(ScoringJobResponse):
+    items: List[ScoringJobItemResponse] = []
+
+# 총점 가중치 프로필 생성 스키마 (합이 1이 아니면 비율로 정규화)
+class WeightProfileCreate(BaseModel):
+    name: str
+    quality_weight: float
+    demand_weight: float
+    reputation_weight: float
+    novelty_weight: float
+    economic_weight: float
+    description: Optional[str] = None
+    activate: bool = False  # 생성 후 바로 활성화하고 전체 총점 재계산
+
+# 총점 가중치 프로필 응답 스키마
+class WeightProfileResponse(BaseModel):
+    id: int
+    name: str
+    version: int
+    quality_weight: float
+    demand_weight: float
+    reputation_weight: float
+    novelty_weight: float
+    economic_weight: float
+    description: Optional[str] = None
+    is_active: bool
+    created_at: datetime
+    activated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+# 가중치 프로필 활성화(재계산) 결과 스키마
+class WeightProfileActivateResponse(BaseModel):
+    profile: WeightProfileResponse
+    rescored: int
+    elapsed_ms: float
+
+# 가중치 프로필 미리보기 항목 스키마
+class WeightProfilePreviewItem(BaseModel):
+    prediction_id: int
+    total_score: Optional[float] = None
+    new_total_score: Optional[float] = None
@@ -0,0 +1,161 @@
+import json
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.scoring import AIBatchScoreOutput, AIScoreOutput
+
+SCORE_FIELDS = ('quality_score', 'demand_score', 'reputation_score', 'economic_score')
+DETAIL_KEYS = {
+    'quality_details': ('clarity', 'data_source', 'timeframe', 'compliance'),
+    'demand_details': ('trend_indicators', 'topic_popularity', 'timing'),
+    'reputation_details': ('loyalty', 'success_history', 'bond_size'),
+    'economic_details': ('liquidity', 'volatility', 'oracle_cost'),
+}
+
+# 한 번만 만들어 재사용하는 검증기
+_SCORE_ADAPTER = TypeAdapter(AIScoreOutput)
+_BATCH_ITEM_ADAPTER = TypeAdapter(AIBatchScoreOutput)
+
+_FENCE_PATTERN = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+_decoder = json.JSONDecoder()
+_MISSING = object()
+
+
+def _object_schema(include_id: bool = False) -> Dict[str, Any]:
+    properties: Dict[str, Any] = {'id': {'type': 'STRING'}} if include_id else {}
+    properties.update({field: {'type': 'NUMBER'} for field in SCORE_FIELDS})
+    properties.update({
+        field: {'type': 'OBJECT', 'properties': {key: {'type': 'NUMBER'} for key in keys}}
+        for field, keys in DETAIL_KEYS.items()
+    })
+    properties['ai_reasoning'] = {'type': 'STRING'}
+    return {
+        'type': 'OBJECT',
+        'properties': properties,
+        'required': (['id'] if include_id else []) + list(SCORE_FIELDS)
+    }
+
+
+# Gemini generationConfig.responseSchema (OpenAPI 스키마 부분집합)
+SCORE_RESPONSE_SCHEMA = _object_schema()
+BATCH_RESPONSE_SCHEMA = {'type': 'ARRAY', 'items': _object_schema(include_id=True)}
+
+
+def fields_response_schema(fields: List[str]) -> Dict[str, Any]:
+    """일부 필드만 다시 요청할 때 쓰는 스키마"""
+    return {
+        'type': 'OBJECT',
+        'properties': {field: SCORE_RESPONSE_SCHEMA['properties'][field] for field in fields},
+        'required': list(fields)
+    }
+
+
+class ParseStats:
+    """AI 응답 파싱 결과 카운터 (메트릭 조회용)"""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1):
+        if amount:
+            with self._lock:
+                self._counts[name] += amount
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+parse_stats = ParseStats()
+
+
+def load_json(text: str) -> Any:
+    """
+    JSON 모드 응답은 그대로 파싱하고, 실패하면 코드 펜스를 벗긴 뒤
+    처음 나오는 JSON 값 하나만 읽음 (앞뒤 설명 문장/중괄호 무시)
+    """
+    try:
+        return json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        pass
+    if not isinstance(text, str):
+        return None
+    text = _FENCE_PATTERN.sub("", text.strip())
+    for index, char in enumerate(text):
+        if char in "{[":
+            try:
+                return _decoder.raw_decode(text, index)[0]
+            except json.JSONDecodeError:
+                continue
+    return None
+
+
+def _repair_field(field: str, value: Any) -> Any:
+    """검증에 실패한 필드 하나를 가능한 범위에서 복구, 불가능하면 _MISSING"""
+    if field in SCORE_FIELDS:
+        if isinstance(value, bool) or value is None:
+            return _MISSING
+        if isinstance(value, str):
+            try:
+                value = float(value.strip().rstrip("점%").strip())
+            except ValueError:
+                return _MISSING
+        if isinstance(value, (int, float)):
+            return min(100.0, max(0.0, float(value)))
+        return _MISSING
+    if field in DETAIL_KEYS:
+        if not isinstance(value, dict):
+            return {}
+        repaired = {}
+        for key, item in value.items():
+            item = _repair_field(SCORE_FIELDS[0], item)
+            if item is not _MISSING:
+                repaired[str(key)] = item
+        return repaired
+    if field == 'ai_reasoning':
+        return "" if value is None else str(value)
+    if field == 'id':
+        return _MISSING if value is None else str(value)
+    return _MISSING
+
+
+def validate_scores(data: Any, batch_item: bool = False) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    점수 객체 검증 후 (점수 dict, 복구하지 못한 필수 필드 목록) 반환
+    실패한 필드만 복구하고, 필수 필드가 남으면 dict는 부분 결과(검증 전)로 반환
+    """
+    if not isinstance(data, dict):
+        return {}, list(SCORE_FIELDS) + (['id'] if batch_item else [])
+    adapter = _BATCH_ITEM_ADAPTER if batch_item else _SCORE_ADAPTER
+    try:
+        return adapter.validate_python(data).model_dump(), []
+    except ValidationError as e:
+        failed_fields = {str(error['loc'][0]) for error in e.errors() if error['loc']}
+
+    repaired = dict(data)
+    for field in failed_fields:
+        value = _repair_field(field, data.get(field))
+        if value is _MISSING:
+            repaired.pop(field, None)
+        else:
+            repaired[field] = value
+    parse_stats.incr('invalid_fields', len(failed_fields))
+
+    try:
+        return adapter.validate_python(repaired).model_dump(), []
+    except ValidationError as e:
+        missing = sorted({str(error['loc'][0]) for error in e.errors() if error['loc']})
+        return repaired, missing
+
+
+def merge_fields(partial: Dict[str, Any], patch: Any, fields: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+    """다시 요청해 받은 필드로 부분 결과를 채운 뒤 재검증"""
+    merged = dict(partial)
+    if isinstance(patch, dict):
+        merged.update({field: patch[field] for field in fields if field in patch})
+    return validate_scores(merged)
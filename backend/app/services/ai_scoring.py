@@ -1,38 +1,312 @@
-import json
-import requests
-from typing import Dict, Any, Tuple
+import asyncio
+import random
+import time
+import httpx
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Optional
 from app.core.config import settings
+from app.services.ai_usage import AICallRecord, get_usage_recorder
+from app.services.circuit_breaker import ScoringUnavailableError, get_circuit_breaker
+from app.services.heuristic_scoring import HeuristicScoringService
+from app.services.http_client import get_http_client
+from app.services.rate_limiter import estimate_tokens, get_rate_limiter
+from app.services.ai_output import (
+    BATCH_RESPONSE_SCHEMA,
+    SCORE_RESPONSE_SCHEMA,
+    fields_response_schema,
+    load_json,
+    merge_fields,
+    parse_stats,
+    validate_scores
+)
+from app.services.score_cache import get_score_cache, make_cache_key
+from app.services.weight_profiles import weighted_total
+
+# 재시도 대상 HTTP 상태 코드 (할당량 초과, 일시적 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 배치 프롬프트에서 예측 1건당 예상 출력 토큰 수
+BATCH_OUTPUT_TOKENS_PER_ITEM = 512
+GEMINI_MAX_OUTPUT_TOKENS = 8192
+
+SCORING_CRITERIA = """[평가 기준]
+1.  **품질**: 명확성, 판정 근거의 신뢰성, 명확한 종료 시점
+2.  **수요**: 주제의 인기도, 트렌드, 시의성
+3.  **평판**: 제안자의 활동 이력, 과거 기여도 및 성공률
+4.  **경제성**: 예상 참여도, 판정(오라클) 비용 및 리스크"""
+
+SCORE_OUTPUT_FIELDS = '''    "quality_score": 0,
+    "demand_score": 0,
+    "reputation_score": 0,
+    "economic_score": 0,
+    "quality_details": {"clarity": 0, "data_source": 0, "timeframe": 0, "compliance": 0},
+    "demand_details": {"trend_indicators": 0, "topic_popularity": 0, "timing": 0},
+    "reputation_details": {"loyalty": 0, "success_history": 0, "bond_size": 0},
+    "economic_details": {"liquidity": 0, "volatility": 0, "oracle_cost": 0},
+    "ai_reasoning": "평가에 대한 핵심 근거를 한 문장으로 요약합니다."'''
+
+def _format_prediction_info(prediction_data: Dict[str, Any]) -> str:
+    """프롬프트에 들어갈 예측 정보 블록"""
+    success_rate = prediction_data.get('creator_success_rate')
+    return f"""- 게임 ID: {prediction_data.get('game_id', '')}
+- 예측 내용: {prediction_data.get('prediction', '')}
+- 옵션 A: {prediction_data.get('option_a', '')}
+- 옵션 B: {prediction_data.get('option_b', '')}
+- 제안자: {prediction_data.get('creator_username', '')}
+- 제안자 활동일수: {prediction_data.get('creator_activity_days', 0)}
+- 제안자 기여도: {prediction_data.get('creator_contribution_score', 0.0)}
+- 제안자 승인/거절 이력: {prediction_data.get('creator_approved_count', 0)}건 / {prediction_data.get('creator_rejected_count', 0)}건 (승인률 {f'{success_rate:.0%}' if success_rate is not None else '없음'})
+- 제안자 예측이 유치한 베팅: {prediction_data.get('creator_bets_attracted', 0)}건, {prediction_data.get('creator_bet_volume', 0.0):.2f} USDC"""
+
+def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜) 또는 Gemini 오류 본문의 retryDelay 파싱"""
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(header)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    try:
+        for detail in response.json().get("error", {}).get("details", []):
+            if "retryDelay" in detail:
+                return max(0.0, float(str(detail["retryDelay"]).rstrip("s")))
+    except Exception:
+        pass
+    return None
 
 class AIScoringService:
-    def __init__(self):
-        self.gemini_api_key = getattr(settings, 'GEMINI_API_KEY', 'your-gemini-api-key')
-        self.gemini_url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent"
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        cache=None,
+        rate_limiter=None,
+        circuit_breaker=None,
+        usage_recorder=None,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None
+    ):
+        self.gemini_api_key = api_key or getattr(settings, 'GEMINI_API_KEY', 'your-gemini-api-key')
+        self.gemini_model = model or "gemini-1.5-flash"
+        base_url = base_url or settings.GEMINI_API_BASE_URL
+        self.gemini_url = f"{base_url.rstrip('/')}/models/{self.gemini_model}:generateContent"
+        self._client = client
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._usage_recorder = usage_recorder
+        self._heuristic = HeuristicScoringService()
+        # 누적 호출/토큰 사용량 (usageMetadata 기준)
+        self.usage = Counter()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """주입된 클라이언트가 없으면 앱 공유 클라이언트 사용"""
+        return self._client or get_http_client()
+    
+    @property
+    def rate_limiter(self):
+        """주입된 limiter가 없으면 앱 공유 rate limiter 사용"""
+        return self._rate_limiter or get_rate_limiter()
     
-    def calculate_prediction_score(self, prediction_data: Dict[str, Any]) -> Dict[str, Any]:
+    @property
+    def circuit_breaker(self):
+        """주입된 서킷 브레이커가 없으면 앱 공유 서킷 브레이커 사용"""
+        return self._circuit_breaker or get_circuit_breaker()
+    
+    @property
+    def usage_recorder(self):
+        """주입된 기록기가 없으면 앱 공유 AI 호출 기록기 사용"""
+        return self._usage_recorder or get_usage_recorder()
+    
+    def _record_cache_hit(self, call_kind: str):
+        self.usage_recorder.record(AICallRecord(
+            timestamp=time.time(), model=self.gemini_model, call_kind=call_kind, status="cache_hit"
+        ))
+    
+    @property
+    def cache(self):
+        """주입된 캐시가 없으면 앱 공유 점수 캐시 사용"""
+        return self._cache or get_score_cache()
+    
+    async def calculate_prediction_score(self, prediction_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         예측 이벤트에 대한 AI 점수 계산
         """
+        scores = await self._score_with_ai(prediction_data)
+        return self._apply_local_scores(scores, prediction_data)
+    
+    async def _score_with_ai(self, prediction_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Gemini(또는 캐시)로 AI 평가 카테고리 점수 계산
+        """
         try:
-            # Gemini API를 사용한 점수 계산
-            score_result = self._call_gemini_api(prediction_data)
+            prompt = self._create_scoring_prompt(prediction_data)
             
-            # 점수 정규화 및 검증
-            normalized_scores = self._normalize_scores(score_result)
+            # 동일한 프롬프트(정규화 기준)는 캐시된 점수 재사용
+            cache_key = make_cache_key(prompt, self.gemini_model)
+            cached_scores = await self.cache.get(cache_key)
+            if cached_scores is not None:
+                cached_scores['cache_hit'] = True
+                self._record_cache_hit("single")
+                return cached_scores
             
-            return normalized_scores
+            # Gemini API를 사용한 점수 계산
+            score_result = await self._call_gemini_api(prompt)
             
+        except ScoringUnavailableError:
+            score_result = None
         except Exception as e:
             print(f"AI scoring error: {e}")
-            print("API 오류로 인해 더미 점수를 사용합니다.")
-            # 오류 시에만 더미 점수 반환
-            return self._get_default_scores()
+            score_result = None
+        
+        if score_result is None:
+            return self._provisional_scores(prediction_data)
+        
+        # 점수 정규화 및 검증
+        normalized_scores = self._normalize_scores(score_result)
+        await self.cache.set(cache_key, normalized_scores)
+        return normalized_scores
+    
+    async def calculate_batch_scores(self, items: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 예측을 배치 프롬프트로 한 번에 점수 계산
+        - 캐시 적중 항목은 제외하고 나머지만 하나의 프롬프트로 묶어 호출
+        - 누락/형식 오류 항목만 재요청하고, 끝까지 실패한 항목은 단건 계산으로 처리
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        cache_keys: Dict[str, str] = {}
+        
+        for item_id, prediction_data in items.items():
+            cache_key = make_cache_key(self._create_scoring_prompt(prediction_data), self.gemini_model)
+            cached_scores = await self.cache.get(cache_key)
+            if cached_scores is not None:
+                cached_scores['cache_hit'] = True
+                self._record_cache_hit("batch")
+                results[item_id] = cached_scores
+            else:
+                cache_keys[item_id] = cache_key
+        
+        remaining = {item_id: items[item_id] for item_id in cache_keys}
+        for _ in range(settings.SCORING_BATCH_ITEM_RETRIES + 1):
+            if not remaining:
+                break
+            try:
+                parsed_items = await self._call_gemini_batch_api(remaining)
+            except ScoringUnavailableError:
+                # 서킷이 열려 있으면 남은 항목은 아래 단건 처리에서 바로 임시 점수/실패 처리
+                break
+            for item_id, scores in parsed_items.items():
+                normalized_scores = self._normalize_scores(scores)
+                await self.cache.set(cache_keys[item_id], normalized_scores)
+                results[item_id] = normalized_scores
+            remaining = {
+                item_id: prediction_data
+                for item_id, prediction_data in remaining.items()
+                if item_id not in parsed_items
+            }
+        
+        # 배치 응답에서 끝내 빠진 항목은 단건 호출로 처리
+        unavailable = []
+        for item_id, prediction_data in remaining.items():
+            try:
+                results[item_id] = await self._score_with_ai(prediction_data)
+            except ScoringUnavailableError:
+                unavailable.append(item_id)
+        
+        scored = {
+            item_id: self._apply_local_scores(scores, items[item_id])
+            for item_id, scores in results.items()
+        }
+        if unavailable:
+            # queue 모드: 계산된 항목은 함께 넘기고 나머지는 호출한 쪽에서 대기열에 추가
+            raise ScoringUnavailableError(f"스코어링 백엔드를 사용할 수 없습니다 ({len(unavailable)}건)", partial=scored)
+        return scored
     
-    def _call_gemini_api(self, prediction_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _call_gemini_batch_api(self, items: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """
-        Gemini API 호출하여 점수 계산
+        배치 프롬프트 호출 후 유효한 항목만 {id: 점수} 형태로 반환
         """
-        prompt = self._create_scoring_prompt(prediction_data)
+        prompt = self._create_batch_scoring_prompt(items)
+        max_output_tokens = min(GEMINI_MAX_OUTPUT_TOKENS, BATCH_OUTPUT_TOKENS_PER_ITEM * len(items))
+        ai_response = await self._request_gemini_text(
+            prompt, max_output_tokens, BATCH_RESPONSE_SCHEMA, call_kind="batch", items=len(items)
+        )
+        if ai_response is None:
+            return {}
+        
+        elements = load_json(ai_response)
+        if not isinstance(elements, list):
+            parse_stats.incr('batch_unparseable')
+            elements = []
         
+        # 항목별로 검증/복구하고, 복구하지 못한 항목은 호출한 쪽에서 재요청
+        parsed_items = {}
+        for element in elements:
+            scores, invalid_fields = validate_scores(element, batch_item=True)
+            item_id = scores.get('id') if scores else None
+            if invalid_fields or item_id not in items or item_id in parsed_items:
+                parse_stats.incr('batch_invalid_items')
+                continue
+            parsed_items[item_id] = scores
+        parse_stats.incr('batch_parsed_items', len(parsed_items))
+        
+        missing = len(items) - len(parsed_items)
+        if missing:
+            print(f"배치 응답에서 {missing}/{len(items)}개 항목이 누락되었거나 형식이 잘못되었습니다.")
+        return parsed_items
+    
+    async def _call_gemini_api(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Gemini API 호출하여 점수 계산, 호출/파싱 실패 시 None 반환
+        """
+        ai_response = await self._request_gemini_text(prompt, response_schema=SCORE_RESPONSE_SCHEMA)
+        if ai_response is None:
+            return None
+        
+        # 스키마 검증, 실패한 필드만 복구
+        scores, missing_fields = validate_scores(load_json(ai_response))
+        if missing_fields:
+            # 복구하지 못한 필수 필드만 다시 요청
+            parse_stats.incr('rerequested')
+            patch_response = await self._request_gemini_text(
+                self._create_fields_prompt(prompt, missing_fields),
+                512,
+                fields_response_schema(missing_fields),
+                call_kind="fields"
+            )
+            scores, missing_fields = merge_fields(
+                scores, load_json(patch_response) if patch_response else None, missing_fields
+            )
+        
+        if missing_fields:
+            parse_stats.incr('failed')
+            print(f"AI 응답 파싱 실패 (필드: {', '.join(missing_fields)})")
+            return None
+        
+        parse_stats.incr('parsed')
+        return scores
+    
+    async def _request_gemini_text(
+        self,
+        prompt: str,
+        max_output_tokens: int = 2048,
+        response_schema: Optional[Dict[str, Any]] = None,
+        call_kind: str = "single",
+        items: int = 1
+    ) -> Optional[str]:
+        """
+        Gemini generateContent 호출 (rate limit + 재시도), 실패 시 None 반환
+        response_schema가 있으면 JSON 모드로 해당 스키마에 맞는 출력을 요청
+        서킷이 열려 있으면 호출하지 않고 ScoringUnavailableError 발생
+        호출마다 토큰/소요 시간/HTTP 상태/재시도 횟수를 사용량 기록기에 남김
+        """
         payload = {
             "contents": [{
                 "parts": [{
@@ -43,98 +317,177 @@ class AIScoringService:
                 "temperature": 0.3,
                 "topK": 40,
                 "topP": 0.95,
-                "maxOutputTokens": 2048,
+                "maxOutputTokens": max_output_tokens,
             }
         }
+        if response_schema is not None:
+            payload["generationConfig"]["responseMimeType"] = "application/json"
+            payload["generationConfig"]["responseSchema"] = response_schema
         
         headers = {
             "Content-Type": "application/json",
         }
         
         url = f"{self.gemini_url}?key={self.gemini_api_key}"
+        estimated_tokens = estimate_tokens(prompt, payload["generationConfig"]["maxOutputTokens"])
+        max_retries = settings.GEMINI_MAX_RETRIES
         
+        call = AICallRecord(
+            timestamp=time.time(),
+            model=self.gemini_model,
+            call_kind=call_kind,
+            status="error",
+            items=items
+        )
+        started = time.perf_counter()
         try:
-            response = requests.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            
-            result = response.json()
-            ai_response = result['candidates'][0]['content']['parts'][0]['text']
-            
-            # JSON 파싱
-            return self._parse_ai_response(ai_response)
+            for attempt in range(max_retries + 1):
+                call.retries = attempt
+                if not self.circuit_breaker.allow_request():
+                    call.status = "circuit_open"
+                    raise ScoringUnavailableError("스코어링 백엔드 서킷이 열려 있습니다")
+                # 할당량(RPM/TPM) 안에서만 호출
+                await self.rate_limiter.acquire(estimated_tokens)
+                try:
+                    response = await self.client.post(url, json=payload, headers=headers)
+                    call.http_status = response.status_code
+                    response.raise_for_status()
+                
+                    result = response.json()
+                    usage_metadata = result.get('usageMetadata', {})
+                    total_tokens = usage_metadata.get('totalTokenCount')
+                    if total_tokens:
+                        self.rate_limiter.record_usage(estimated_tokens, total_tokens)
+                    call.prompt_tokens = usage_metadata.get('promptTokenCount', 0)
+                    call.output_tokens = usage_metadata.get('candidatesTokenCount', 0)
+                    call.total_tokens = total_tokens or 0
+                    self.usage['requests'] += 1
+                    self.usage['prompt_tokens'] += call.prompt_tokens
+                    self.usage['output_tokens'] += call.output_tokens
+                    self.usage['total_tokens'] += call.total_tokens
+                    # 후보가 없는(차단/형식 오류) 응답은 아래 except에서 실패로 집계
+                    text = result['candidates'][0]['content']['parts'][0]['text']
+                    self.circuit_breaker.record_success()
+                    call.status = "ok"
+                    return text
+                
+                except httpx.HTTPStatusError as e:
+                    status_code = e.response.status_code
+                    if status_code in RETRYABLE_STATUS_CODES and attempt < max_retries:
+                        delay = self._retry_delay(attempt, e.response)
+                        if status_code == 429:
+                            # 다른 동시 호출도 함께 대기하도록 limiter 일시 정지
+                            self.rate_limiter.pause(delay)
+                            print(f"API 할당량을 초과했습니다. {delay:.1f}초 후 재시도합니다. ({attempt + 1}/{max_retries})")
+                        else:
+                            print(f"Gemini API {status_code} 오류, {delay:.1f}초 후 재시도합니다. ({attempt + 1}/{max_retries})")
+                        await asyncio.sleep(delay)
+                        continue
+                
+                    print(f"Gemini API HTTP error: {e}")
+                    call.status = "http_error"
+                    # 재시도 대상 오류만 백엔드 장애로 집계 (4xx 요청 오류는 응답이 온 것으로 봄)
+                    if status_code in RETRYABLE_STATUS_CODES:
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+                    if status_code == 404:
+                        print("API 엔드포인트를 확인해주세요. Gemini API 키가 유효한지 확인하세요.")
+                    elif status_code == 403:
+                        print("API 키가 유효하지 않거나 권한이 없습니다.")
+                    elif status_code == 400:
+                        print("API 요청 형식이 잘못되었습니다.")
+                    elif status_code == 429:
+                        print("API 할당량을 초과했습니다.")
+                    return None
+                except httpx.TransportError as e:
+                    # 타임아웃/연결 오류는 재시도
+                    if attempt < max_retries:
+                        delay = self._retry_delay(attempt)
+                        print(f"Gemini API 연결 오류({e!r}), {delay:.1f}초 후 재시도합니다. ({attempt + 1}/{max_retries})")
+                        await asyncio.sleep(delay)
+                        continue
+                    print(f"Gemini API error: {e!r}")
+                    call.status = "transport_error"
+                    self.circuit_breaker.record_failure()
+                    return None
+                except Exception as e:
+                    print(f"Gemini API error: {e!r}")
+                    call.status = "bad_response"
+                    self.circuit_breaker.record_failure()
+                    return None
             
-        except requests.exceptions.HTTPError as e:
-            print(f"Gemini API HTTP error: {e}")
-            if e.response.status_code == 404:
-                print("API 엔드포인트를 확인해주세요. Gemini API 키가 유효한지 확인하세요.")
-            elif e.response.status_code == 403:
-                print("API 키가 유효하지 않거나 권한이 없습니다.")
-            elif e.response.status_code == 400:
-                print("API 요청 형식이 잘못되었습니다.")
-            elif e.response.status_code == 429:
-                print("API 할당량을 초과했습니다. 더미 데이터를 사용합니다.")
-            return self._get_default_scores()
-        except Exception as e:
-            print(f"Gemini API error: {e}")
-            return self._get_default_scores()
+            return None
+        finally:
+            # 재시도/대기 시간을 포함한 전체 소요 시간 기록
+            call.latency_ms = (time.perf_counter() - started) * 1000
+            self.usage_recorder.record(call)
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        재시도 대기 시간 계산
+        Retry-After 헤더(또는 Gemini RetryInfo)가 있으면 따르고, 없으면 full jitter 지수 백오프
+        """
+        max_delay = settings.GEMINI_RETRY_MAX_SECONDS
+        if response is not None:
+            retry_after = _parse_retry_after(response)
+            if retry_after is not None:
+                return min(max_delay, retry_after + random.uniform(0, 1))
+        backoff = min(max_delay, settings.GEMINI_RETRY_BASE_SECONDS * (2 ** attempt))
+        return random.uniform(0, backoff)
     
     def _create_scoring_prompt(self, prediction_data: Dict[str, Any]) -> str:
         """
         AI 점수 계산을 위한 프롬프트 생성
         """
         prompt = f"""
-당신은 스포츠 예측 이벤트 평가 AI입니다. 다음 예측 정보를 5개 기준에 따라 0-100점으로 평가하고, 지정된 JSON 형식으로 결과를 출력하세요.
+당신은 스포츠 예측 이벤트 평가 AI입니다. 다음 예측 정보를 4개 기준에 따라 0-100점으로 평가하고, 지정된 JSON 형식으로 결과를 출력하세요.
 
 [예측 정보]
-- 게임 ID: {prediction_data.get('game_id', '')}
-- 예측 내용: {prediction_data.get('prediction', '')}
-- 옵션 A: {prediction_data.get('option_a', '')}
-- 옵션 B: {prediction_data.get('option_b', '')}
-- 제안자: {prediction_data.get('creator_username', '')}
-- 제안자 활동일수: {prediction_data.get('creator_activity_days', 0)}
-- 제안자 기여도: {prediction_data.get('creator_contribution_score', 0.0)}
+{_format_prediction_info(prediction_data)}
 
-[평가 기준]
-1.  **품질**: 명확성, 판정 근거의 신뢰성, 명확한 종료 시점
-2.  **수요**: 주제의 인기도, 트렌드, 시의성
-3.  **평판**: 제안자의 활동 이력, 과거 기여도 및 성공률
-4.  **독창성**: 기존 예측과의 중복 여부, 선점 우위
-5.  **경제성**: 예상 참여도, 판정(오라클) 비용 및 리스크
+{SCORING_CRITERIA}
 
 [출력 형식]
 {{
-    "quality_score": 0,
-    "demand_score": 0,
-    "reputation_score": 0,
-    "novelty_score": 0,
-    "economic_score": 0,
-    "quality_details": {{"clarity": 0, "data_source": 0, "timeframe": 0, "compliance": 0}},
-    "demand_details": {{"trend_indicators": 0, "topic_popularity": 0, "timing": 0}},
-    "reputation_details": {{"loyalty": 0, "success_history": 0, "bond_size": 0}},
-    "novelty_details": {{"first_mover": 0, "uniqueness": 0}},
-    "economic_details": {{"liquidity": 0, "volatility": 0, "oracle_cost": 0}},
-    "ai_reasoning": "평가에 대한 핵심 근거를 한 문장으로 요약합니다."
+{SCORE_OUTPUT_FIELDS}
 }}
 """
         return prompt
     
-    def _parse_ai_response(self, ai_response: str) -> Dict[str, Any]:
+    def _create_batch_scoring_prompt(self, items: Dict[str, Dict[str, Any]]) -> str:
         """
-        AI 응답을 파싱하여 점수 추출
+        여러 예측을 한 번에 평가하는 배치 프롬프트 생성 (평가 기준은 한 번만 전송)
         """
-        try:
-            # JSON 부분만 추출
-            start_idx = ai_response.find('{')
-            end_idx = ai_response.rfind('}') + 1
-            
-            if start_idx != -1 and end_idx != -1:
-                json_str = ai_response[start_idx:end_idx]
-                return json.loads(json_str)
-            else:
-                return self._get_default_scores()
-                
-        except json.JSONDecodeError:
-            return self._get_default_scores()
+        prediction_blocks = "\n\n".join(
+            f"[예측 id: {item_id}]\n{_format_prediction_info(prediction_data)}"
+            for item_id, prediction_data in items.items()
+        )
+        prompt = f"""
+당신은 스포츠 예측 이벤트 평가 AI입니다. 다음 {len(items)}개의 예측을 각각 4개 기준에 따라 0-100점으로 평가하고, 지정된 JSON 배열 형식으로 결과를 출력하세요. 배열의 각 원소에는 해당 예측의 id를 문자열로 그대로 포함하고, 모든 예측에 대해 정확히 하나씩 출력하세요.
+
+{prediction_blocks}
+
+{SCORING_CRITERIA}
+
+[출력 형식]
+[
+  {{
+    "id": "예측 id",
+{SCORE_OUTPUT_FIELDS}
+  }}
+]
+"""
+        return prompt
+    
+    def _create_fields_prompt(self, prompt: str, fields: List[str]) -> str:
+        """
+        이전 응답에서 빠졌거나 형식이 잘못된 필드만 다시 요청하는 프롬프트
+        """
+        return f"""{prompt}
+이전 응답에서 다음 필드가 누락되었거나 형식이 잘못되었습니다: {', '.join(fields)}
+이 필드만 0-100 사이 숫자로 JSON 객체에 담아 출력하세요.
+"""
     
     def _normalize_scores(self, scores: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -148,12 +501,8 @@ class AIScoringService:
         economic_score = min(100, max(0, scores.get('economic_score', 65)))
         
         # 가중치 적용하여 총점 계산
-        total_score = (
-            quality_score * 0.35 +
-            demand_score * 0.25 +
-            reputation_score * 0.20 +
-            novelty_score * 0.10 +
-            economic_score * 0.10
+        total_score = weighted_total(
+            quality_score, demand_score, reputation_score, novelty_score, economic_score
         )
         
         return {
@@ -168,57 +517,51 @@ class AIScoringService:
             'reputation_details': scores.get('reputation_details', {}),
             'novelty_details': scores.get('novelty_details', {}),
             'economic_details': scores.get('economic_details', {}),
-            'ai_reasoning': scores.get('ai_reasoning', 'AI 평가 완료')
+            'ai_reasoning': scores.get('ai_reasoning', 'AI 평가 완료'),
+            'is_fallback': scores.get('is_fallback', False),
+            'cache_hit': False
         }
     
-    def _get_default_scores(self) -> Dict[str, Any]:
+    def _apply_local_scores(self, scores: Dict[str, Any], prediction_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        기본 점수 반환 (API 오류 시) - 더미 데이터로 테스트
+        서버에서 직접 계산한 카테고리 점수(독창성)로 덮어쓰고 총점 재계산
         """
-        import random
+        if 'novelty_score' not in prediction_data:
+            return scores
         
-        # 랜덤 점수 생성 (60-90 범위)
-        quality_score = random.randint(60, 90)
-        demand_score = random.randint(60, 90)
-        reputation_score = random.randint(60, 90)
-        novelty_score = random.randint(60, 90)
-        economic_score = random.randint(60, 90)
-        
-        total_score = (quality_score * 0.35 + demand_score * 0.25 + 
-                      reputation_score * 0.20 + novelty_score * 0.10 + 
-                      economic_score * 0.10)
+        scores = dict(scores)
+        scores['novelty_score'] = min(100, max(0, prediction_data['novelty_score']))
+        scores['novelty_details'] = prediction_data.get('novelty_details', {})
+        scores['total_score'] = round(weighted_total(
+            scores['quality_score'],
+            scores['demand_score'],
+            scores['reputation_score'],
+            scores['novelty_score'],
+            scores['economic_score']
+        ), 2)
+        return scores
+    
+    def _provisional_scores(self, prediction_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        백엔드 장애(서킷 open, 호출/파싱 실패) 시 결과
+        - provisional 모드: 휴리스틱 임시 점수 (is_fallback/is_provisional 표시, 저장/캐시하지 않음)
+        - queue 모드: ScoringUnavailableError로 즉시 실패 (호출한 쪽에서 재스코어링 대기열에 추가)
+        """
+        if settings.SCORING_FALLBACK_MODE == "queue":
+            raise ScoringUnavailableError("스코어링 백엔드를 사용할 수 없습니다")
         
-        return {
-            'quality_score': quality_score,
-            'demand_score': demand_score,
-            'reputation_score': reputation_score,
-            'novelty_score': novelty_score,
-            'economic_score': economic_score,
-            'total_score': round(total_score, 1),
-            'quality_details': {
-                'clarity': quality_score,
-                'data_source': quality_score,
-                'timeframe': quality_score,
-                'compliance': quality_score
-            },
-            'demand_details': {
-                'trend_indicators': demand_score,
-                'topic_popularity': demand_score,
-                'timing': demand_score
-            },
-            'reputation_details': {
-                'loyalty': reputation_score,
-                'success_history': reputation_score,
-                'bond_size': reputation_score
-            },
-            'novelty_details': {
-                'first_mover': novelty_score,
-                'uniqueness': novelty_score
-            },
-            'economic_details': {
-                'liquidity': economic_score,
-                'volatility': economic_score,
-                'oracle_cost': economic_score
-            },
-            'ai_reasoning': f'AI 분석 결과: 품질 {quality_score}점, 수요 {demand_score}점, 평판 {reputation_score}점, 독창성 {novelty_score}점, 경제성 {economic_score}점으로 종합 평가되었습니다.'
-        }
+        scores = self._heuristic.score(prediction_data)
+        scores['ai_reasoning'] = f"임시 점수: AI 평가를 사용할 수 없어 휴리스틱으로 계산했습니다. {scores['ai_reasoning']}"
+        scores['is_fallback'] = True
+        scores['is_provisional'] = True
+        return scores
+
+# 앱 전체에서 공유하는 스코어링 서비스 인스턴스
+_ai_scoring_service: Optional[AIScoringService] = None
+
+def get_ai_scoring_service() -> AIScoringService:
+    """공유 AIScoringService 반환 (FastAPI 의존성으로도 사용)"""
+    global _ai_scoring_service
+    if _ai_scoring_service is None:
+        _ai_scoring_service = AIScoringService()
+    return _ai_scoring_service
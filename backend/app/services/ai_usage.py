@@ -0,0 +1,263 @@
+import asyncio
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import case
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.database import SessionLocal, AIUsageStat, dialect_insert
+
+# 시간별 집계 테이블에 누적하는 항목
+AGGREGATE_FIELDS = (
+    "calls", "errors", "cache_hits", "retries",
+    "prompt_tokens", "output_tokens", "total_tokens", "latency_ms_sum", "cost_usd"
+)
+
+
+@dataclass
+class AICallRecord:
+    """AI 호출 1회 기록 (HTTP 호출 또는 캐시 적중)"""
+    timestamp: float
+    model: str
+    call_kind: str  # single, batch, fields
+    status: str  # ok, cache_hit, http_error, transport_error, bad_response, circuit_open, error
+    http_status: Optional[int] = None
+    retries: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    latency_ms: float = 0.0
+    items: int = 1  # 프롬프트에 담긴 예측 수
+
+    @property
+    def cache_hit(self) -> bool:
+        return self.status == "cache_hit"
+
+    @property
+    def failed(self) -> bool:
+        return self.status not in ("ok", "cache_hit")
+
+
+def estimate_cost(prompt_tokens: int, output_tokens: int) -> float:
+    """설정된 100만 토큰당 가격으로 추정한 비용 (USD)"""
+    return (
+        prompt_tokens * settings.GEMINI_INPUT_PRICE_PER_MTOK
+        + output_tokens * settings.GEMINI_OUTPUT_PRICE_PER_MTOK
+    ) / 1_000_000
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(records: List[AICallRecord]) -> Dict[str, Any]:
+    """호출 기록 목록 요약 (지연 시간/토큰 분포는 캐시 적중을 제외한 실제 API 호출 기준)"""
+    api_calls = [record for record in records if not record.cache_hit]
+    latencies = sorted(record.latency_ms for record in api_calls)
+    prompt_sizes = sorted(record.prompt_tokens for record in api_calls if not record.failed)
+    prompt_tokens = sum(record.prompt_tokens for record in records)
+    output_tokens = sum(record.output_tokens for record in records)
+    errors = sum(1 for record in records if record.failed)
+    cache_hits = len(records) - len(api_calls)
+    return {
+        "calls": len(records),
+        "api_calls": len(api_calls),
+        "cache_hits": cache_hits,
+        "cache_hit_rate": round(cache_hits / len(records), 4) if records else 0.0,
+        "errors": errors,
+        "error_rate": round(errors / len(records), 4) if records else 0.0,
+        "retries": sum(record.retries for record in records),
+        "items": sum(record.items for record in records),
+        "prompt_tokens": prompt_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": sum(record.total_tokens for record in records),
+        "prompt_tokens_p50": _percentile(prompt_sizes, 0.50),
+        "prompt_tokens_p95": _percentile(prompt_sizes, 0.95),
+        "latency_ms_p50": round(_percentile(latencies, 0.50), 1),
+        "latency_ms_p95": round(_percentile(latencies, 0.95), 1),
+        "latency_ms_p99": round(_percentile(latencies, 0.99), 1),
+        "latency_ms_max": round(latencies[-1], 1) if latencies else 0.0,
+        "cost_usd": round(estimate_cost(prompt_tokens, output_tokens), 6),
+        "statuses": dict(Counter(
+            str(record.http_status) if record.http_status else record.status for record in records
+        ))
+    }
+
+
+class AIUsageRecorder:
+    """
+    AI 호출 기록기
+    - 최근 호출은 고정 크기 링 버퍼에 보관 (롤링 요약용)
+    - 시간 단위 집계는 메모리에 모았다가 flush 시 ai_usage_stats에 증분 반영
+    """
+
+    def __init__(self, ring_size: Optional[int] = None):
+        self._records: "deque[AICallRecord]" = deque(maxlen=max(1, ring_size or settings.AI_USAGE_RING_SIZE))
+        self._pending: Dict[Tuple[datetime, str, str], Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, record: AICallRecord):
+        bucket_start = datetime.utcfromtimestamp(record.timestamp).replace(minute=0, second=0, microsecond=0)
+        key = (bucket_start, record.model, record.call_kind)
+        with self._lock:
+            self._records.append(record)
+            aggregate = self._pending.setdefault(key, dict.fromkeys(AGGREGATE_FIELDS + ("latency_ms_max",), 0))
+            aggregate["calls"] += 1
+            aggregate["errors"] += record.failed
+            aggregate["cache_hits"] += record.cache_hit
+            aggregate["retries"] += record.retries
+            aggregate["prompt_tokens"] += record.prompt_tokens
+            aggregate["output_tokens"] += record.output_tokens
+            aggregate["total_tokens"] += record.total_tokens
+            aggregate["cost_usd"] += estimate_cost(record.prompt_tokens, record.output_tokens)
+            if not record.cache_hit:
+                aggregate["latency_ms_sum"] += record.latency_ms
+                aggregate["latency_ms_max"] = max(aggregate["latency_ms_max"], record.latency_ms)
+
+    def recent(self, window_seconds: Optional[float] = None) -> List[AICallRecord]:
+        with self._lock:
+            records = list(self._records)
+        if window_seconds is None:
+            return records
+        since = time.time() - window_seconds
+        return [record for record in records if record.timestamp >= since]
+
+    def summary(self, window_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """최근 window_seconds 동안의 전체/호출 종류별 요약"""
+        records = self.recent(window_seconds)
+        by_kind: Dict[str, List[AICallRecord]] = {}
+        for record in records:
+            by_kind.setdefault(record.call_kind, []).append(record)
+        return {
+            **summarize(records),
+            "by_kind": {call_kind: summarize(items) for call_kind, items in sorted(by_kind.items())}
+        }
+
+    def flush(self, db: Session) -> int:
+        """쌓인 시간별 집계를 DB에 증분 반영하고 반영한 버킷 수 반환"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            for (bucket_start, model, call_kind), aggregate in pending.items():
+                db.execute(
+                    dialect_insert(db, AIUsageStat).values(
+                        bucket_start=bucket_start, model=model, call_kind=call_kind
+                    ).on_conflict_do_nothing(index_elements=["bucket_start", "model", "call_kind"])
+                )
+                values = {
+                    getattr(AIUsageStat, field): getattr(AIUsageStat, field) + aggregate[field]
+                    for field in AGGREGATE_FIELDS if aggregate[field]
+                }
+                values[AIUsageStat.latency_ms_max] = case(
+                    (AIUsageStat.latency_ms_max < aggregate["latency_ms_max"], aggregate["latency_ms_max"]),
+                    else_=AIUsageStat.latency_ms_max
+                )
+                values[AIUsageStat.updated_at] = datetime.utcnow()
+                db.query(AIUsageStat).filter(
+                    AIUsageStat.bucket_start == bucket_start,
+                    AIUsageStat.model == model,
+                    AIUsageStat.call_kind == call_kind
+                ).update(values, synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # 반영하지 못한 집계는 다음 flush에서 다시 시도
+            with self._lock:
+                for key, aggregate in pending.items():
+                    current = self._pending.setdefault(key, dict.fromkeys(aggregate, 0))
+                    for field, value in aggregate.items():
+                        if field == "latency_ms_max":
+                            current[field] = max(current[field], value)
+                        else:
+                            current[field] += value
+            raise
+        return len(pending)
+
+
+def hourly_usage(db: Session, hours: int = 24) -> List[Dict[str, Any]]:
+    """최근 hours시간 동안의 시간별 집계 (최신순)"""
+    since = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=max(0, hours - 1))
+    rows = db.query(AIUsageStat).filter(AIUsageStat.bucket_start >= since).order_by(
+        AIUsageStat.bucket_start.desc(), AIUsageStat.model, AIUsageStat.call_kind
+    ).all()
+    return [
+        {
+            "bucket_start": row.bucket_start,
+            "model": row.model,
+            "call_kind": row.call_kind,
+            "calls": row.calls,
+            "errors": row.errors,
+            "cache_hits": row.cache_hits,
+            "retries": row.retries,
+            "prompt_tokens": row.prompt_tokens,
+            "output_tokens": row.output_tokens,
+            "total_tokens": row.total_tokens,
+            "latency_ms_avg": round(row.latency_ms_sum / (row.calls - row.cache_hits), 1)
+            if row.calls > row.cache_hits else 0.0,
+            "latency_ms_max": round(row.latency_ms_max, 1),
+            "cost_usd": round(row.cost_usd, 6)
+        }
+        for row in rows
+    ]
+
+
+_usage_recorder: Optional[AIUsageRecorder] = None
+_flush_task: Optional[asyncio.Task] = None
+
+
+def get_usage_recorder() -> AIUsageRecorder:
+    """앱 전체에서 공유하는 AI 호출 기록기 반환"""
+    global _usage_recorder
+    if _usage_recorder is None:
+        _usage_recorder = AIUsageRecorder()
+    return _usage_recorder
+
+
+def flush_usage() -> int:
+    db = SessionLocal()
+    try:
+        return get_usage_recorder().flush(db)
+    finally:
+        db.close()
+
+
+async def _flush_periodically():
+    while True:
+        await asyncio.sleep(max(1.0, settings.AI_USAGE_FLUSH_SECONDS))
+        try:
+            flush_usage()
+        except Exception as e:
+            print(f"AI usage flush failed: {e}")
+
+
+async def start_usage_flusher():
+    """시간별 집계 주기적 반영 시작 (앱 시작 시)"""
+    global _flush_task
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_periodically())
+
+
+async def stop_usage_flusher():
+    """주기적 반영 종료 후 남은 집계 반영 (앱 종료 시)"""
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+    try:
+        flush_usage()
+    except Exception as e:
+        print(f"AI usage flush failed: {e}")
@@ -0,0 +1,171 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.database import Bet, PredictionEvent, dialect_insert
+from app.services.creator_stats import record_bets_created
+from app.services.pool_odds import get_pool_odds
+from app.services.pool_totals import option_side, record_bet_totals
+from app.services.realtime import publish
+
+
+def announce_bets(bets: Sequence[Dict[str, Any]]):
+    """
+    커밋된 베팅을 메모리 배당 집계에 반영하고 구독자에게 알림
+    bets: prediction_id, option_a, option_b, side, bet_id, option, amount, user_address
+    """
+    pool_odds = get_pool_odds()
+    for bet in bets:
+        pool_odds.record(bet["prediction_id"], bet["option_a"], bet["option_b"], bet["side"], bet["amount"])
+        publish("bet_placed", bet["prediction_id"], {
+            "bet_id": bet["bet_id"],
+            "side": bet["side"],
+            "option": bet["option"],
+            "amount": bet["amount"],
+            "user_address": bet["user_address"]
+        })
+    # 배당은 예측마다 마지막 값 한 번만 발행
+    for prediction_id in dict.fromkeys(bet["prediction_id"] for bet in bets):
+        publish("odds", prediction_id, pool_odds.odds(prediction_id))
+
+
+def ingest_bets(db: Session, items: Sequence[Any], default_user_id: int) -> List[Dict[str, Any]]:
+    """
+    베팅 일괄 등록 (transaction_hash 기준 멱등)
+    - 예측/기존 베팅 조회 각 1회, 다중 행 INSERT ... ON CONFLICT DO NOTHING RETURNING 1회로 저장
+    - 이미 저장된(또는 같은 요청에서 앞서 나온) transaction_hash는 duplicate
+    - 예측/옵션이 맞지 않거나 create_bet처럼 같은 사용자가 이미 베팅한 예측이면 rejected
+    - 저장된 베팅의 합계/제안자 집계는 같은 트랜잭션에서 예측/사용자별로 합쳐 반영
+    """
+    results: List[Dict[str, Any]] = [
+        {"index": index, "transaction_hash": item.transaction_hash, "status": None, "bet_id": None, "detail": None}
+        for index, item in enumerate(items)
+    ]
+
+    prediction_ids = {item.prediction_id for item in items}
+    predictions: Dict[int, Tuple[str, str, int]] = {
+        prediction_id: (option_a, option_b, creator_id)
+        for prediction_id, option_a, option_b, creator_id in db.query(
+            PredictionEvent.id, PredictionEvent.option_a, PredictionEvent.option_b, PredictionEvent.creator_id
+        ).filter(PredictionEvent.id.in_(prediction_ids)).all()
+    } if prediction_ids else {}
+
+    # 예측당 1인 1베팅 확인용 기존 베팅 ((예측 ID, 사용자 ID) -> (베팅 ID, transaction_hash))
+    user_ids = {item.user_id or default_user_id for item in items}
+    placed: Dict[Tuple[int, int], Tuple[int, str]] = {
+        (prediction_id, user_id): (bet_id, transaction_hash)
+        for prediction_id, user_id, bet_id, transaction_hash in db.query(
+            Bet.prediction_id, Bet.user_id, Bet.id, Bet.transaction_hash
+        ).filter(Bet.prediction_id.in_(list(predictions)), Bet.user_id.in_(user_ids)).all()
+    } if predictions else {}
+
+    now = datetime.utcnow()
+    rows: Dict[str, Dict[str, Any]] = {}
+    candidates: Dict[str, Tuple[int, str]] = {}
+    pending_pairs = set()
+    for result, item in zip(results, items):
+        user_id = item.user_id or default_user_id
+        prediction = predictions.get(item.prediction_id)
+        side = option_side(prediction[0], prediction[1], item.option) if prediction else None
+        existing_bet = placed.get((item.prediction_id, user_id))
+        if prediction is None:
+            result.update(status="rejected", detail="Prediction event not found")
+        elif side is None:
+            result.update(status="rejected", detail="Option must be one of the prediction's options")
+        elif item.transaction_hash in rows:
+            result.update(status="duplicate", detail="Repeated in this request")
+        elif existing_bet is not None and existing_bet[1] == item.transaction_hash:
+            result.update(status="duplicate", bet_id=existing_bet[0])
+        elif existing_bet is not None or (item.prediction_id, user_id) in pending_pairs:
+            result.update(status="rejected", detail="You have already placed a bet on this prediction")
+        else:
+            pending_pairs.add((item.prediction_id, user_id))
+            rows[item.transaction_hash] = {
+                "prediction_id": item.prediction_id,
+                "user_id": user_id,
+                "user_address": item.user_address,
+                "option": item.option,
+                "amount": item.amount,
+                "transaction_hash": item.transaction_hash,
+                "pool_id": item.pool_id,
+                "created_at": now
+            }
+            candidates[item.transaction_hash] = (result["index"], side)
+
+    inserted: Dict[str, int] = {}
+    committed: List[Dict[str, Any]] = []
+    try:
+        if rows:
+            inserted = {
+                transaction_hash: bet_id
+                for bet_id, transaction_hash in db.execute(
+                    dialect_insert(db, Bet).values(list(rows.values())).on_conflict_do_nothing(
+                        index_elements=["transaction_hash"]
+                    ).returning(Bet.id, Bet.transaction_hash)
+                ).all()
+            }
+
+        totals: Dict[Tuple[int, str], List[float]] = defaultdict(lambda: [0, 0.0])
+        stats = []
+        for transaction_hash, bet_id in inserted.items():
+            row = rows[transaction_hash]
+            _, side = candidates[transaction_hash]
+            option_a, option_b, creator_id = predictions[row["prediction_id"]]
+            total = totals[(row["prediction_id"], side)]
+            total[0] += 1
+            total[1] += row["amount"]
+            stats.append((creator_id, row["user_id"], row["amount"]))
+            committed.append({
+                "prediction_id": row["prediction_id"],
+                "option_a": option_a,
+                "option_b": option_b,
+                "side": side,
+                "bet_id": bet_id,
+                "option": row["option"],
+                "amount": row["amount"],
+                "user_address": row["user_address"]
+            })
+        for (prediction_id, side), (bets, amount) in totals.items():
+            record_bet_totals(db, prediction_id, side, amount, bets=bets)
+        if stats:
+            record_bets_created(db, stats)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    # 충돌로 저장되지 않은 항목은 기존 베팅 ID와 함께 duplicate로 응답
+    conflicts = [transaction_hash for transaction_hash in candidates if transaction_hash not in inserted]
+    existing: Dict[str, int] = {}
+    if conflicts:
+        existing = {
+            transaction_hash: bet_id
+            for bet_id, transaction_hash in db.query(Bet.id, Bet.transaction_hash).filter(
+                Bet.transaction_hash.in_(conflicts)
+            ).all()
+        }
+    for transaction_hash, (index, _) in candidates.items():
+        if transaction_hash in inserted:
+            results[index].update(status="accepted", bet_id=inserted[transaction_hash])
+        else:
+            results[index].update(status="duplicate", bet_id=existing.get(transaction_hash))
+    # 같은 요청 안에서 반복된 항목도 처음 항목의 결과 ID를 알려줌
+    for result in results:
+        if result["status"] == "duplicate" and result["bet_id"] is None:
+            first = candidates.get(result["transaction_hash"])
+            if first is not None:
+                result["bet_id"] = results[first[0]]["bet_id"]
+
+    announce_bets(committed)
+    return results
+
+
+def bulk_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "accepted": sum(1 for result in results if result["status"] == "accepted"),
+        "duplicates": sum(1 for result in results if result["status"] == "duplicate"),
+        "rejected": sum(1 for result in results if result["status"] == "rejected"),
+        "items": results
+    }
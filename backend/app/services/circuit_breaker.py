@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ScoringUnavailableError(Exception):
+    """스코어링 백엔드를 사용할 수 없어 바로 실패 (partial: 배치 중 이미 계산된 결과)"""
+
+    def __init__(self, message: str, partial: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.partial = partial or {}
+
+
+class CircuitBreaker:
+    """
+    스코어링 백엔드 호출용 서킷 브레이커
+    - closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+    - open: recovery_seconds 동안 호출하지 않고 즉시 실패
+    - half_open: 시험 호출을 half_open_max_calls개까지만 허용, 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        recovery_seconds: Optional[float] = None,
+        half_open_max_calls: Optional[int] = None
+    ):
+        self.failure_threshold = max(1, failure_threshold or settings.SCORING_CIRCUIT_FAILURE_THRESHOLD)
+        self.recovery_seconds = (
+            settings.SCORING_CIRCUIT_RECOVERY_SECONDS if recovery_seconds is None else recovery_seconds
+        )
+        self.half_open_max_calls = max(1, half_open_max_calls or settings.SCORING_CIRCUIT_HALF_OPEN_MAX_CALLS)
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def _current_state(self) -> str:
+        now = time.monotonic()
+        # open 후 대기 시간이 지났거나, half-open 시험 호출이 결과 없이(취소 등) 끝난 경우 다시 시험 호출 허용
+        if self._state != CLOSED and now - self._opened_at >= self.recovery_seconds:
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+            self._opened_at = now
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """호출 가능 여부 (half-open이면 시험 호출 슬롯을 하나 차지)"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                print("스코어링 백엔드가 복구되어 서킷을 닫습니다.")
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    print(f"스코어링 백엔드 연속 실패 {self._failures}회, {self.recovery_seconds:.0f}초 동안 서킷을 엽니다.")
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def reset(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._half_open_calls = 0
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "rejected": self._rejected,
+                "retry_in_seconds": (
+                    round(max(0.0, self.recovery_seconds - (time.monotonic() - self._opened_at)), 1)
+                    if state == OPEN else 0.0
+                ),
+                "failure_threshold": self.failure_threshold,
+                "recovery_seconds": self.recovery_seconds
+            }
+
+
+# 앱 전체에서 공유하는 서킷 브레이커와 재스코어링 대기열
+_circuit_breaker: Optional[CircuitBreaker] = None
+_deferred_ids: set = set()
+_deferred_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """공유 CircuitBreaker 반환"""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker()
+    return _circuit_breaker
+
+
+def defer_predictions(prediction_ids: Iterable[int]):
+    """백엔드 장애로 저장하지 못한 예측을 재스코어링 대기열에 추가 (워커가 서킷이 닫히면 처리)"""
+    with _deferred_lock:
+        _deferred_ids.update(prediction_ids)
+
+
+def take_deferred_predictions() -> List[int]:
+    """대기열의 예측 ID를 모두 꺼내 반환"""
+    with _deferred_lock:
+        prediction_ids = sorted(_deferred_ids)
+        _deferred_ids.clear()
+    return prediction_ids
+
+
+def deferred_count() -> int:
+    with _deferred_lock:
+        return len(_deferred_ids)
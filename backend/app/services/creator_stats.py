@@ -0,0 +1,211 @@
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import case, func, select, union
+from sqlalchemy.orm import Session
+
+from app.models.database import Bet, CreatorStats, DiscardedPrediction, PredictionEvent, User, dialect_insert
+
+# 승인된 것으로 보는 상태 (승인 후 진행/만료/경기 종료/결과 확정 포함)
+ACCEPTED_STATUSES = {"approved", "active", "expired", "ended", "completed"}
+REJECTED_STATUSES = {"rejected"}
+
+
+def _today() -> str:
+    return datetime.utcnow().strftime("%Y-%m-%d")
+
+
+def _apply(db: Session, user_id: int, deltas: Dict[str, float], touch: bool = False):
+    """
+    제안자 집계 행에 증분 반영 (호출한 쪽 트랜잭션에서 커밋)
+    UPDATE ... SET x = x + ? 형태로 처리하여 동시 요청에도 값이 유실되지 않음
+    """
+    db.execute(
+        dialect_insert(db, CreatorStats).values(user_id=user_id).on_conflict_do_nothing(
+            index_elements=["user_id"]
+        )
+    )
+    values = {
+        getattr(CreatorStats, field): getattr(CreatorStats, field) + delta
+        for field, delta in deltas.items() if delta
+    }
+    if touch:
+        today = _today()
+        values[CreatorStats.activity_days] = CreatorStats.activity_days + case(
+            (CreatorStats.last_active_date == today, 0), else_=1
+        )
+        values[CreatorStats.last_active_date] = today
+    if values:
+        values[CreatorStats.updated_at] = datetime.utcnow()
+        db.query(CreatorStats).filter(CreatorStats.user_id == user_id).update(
+            values, synchronize_session=False
+        )
+
+
+def _status_deltas(old_status: Optional[str], new_status: Optional[str]) -> Dict[str, int]:
+    return {
+        "approved_count": (new_status in ACCEPTED_STATUSES) - (old_status in ACCEPTED_STATUSES),
+        "rejected_count": (new_status in REJECTED_STATUSES) - (old_status in REJECTED_STATUSES),
+    }
+
+
+def record_prediction_created(db: Session, creator_id: int):
+    """예측 생성 시 제안 수/활동일 갱신"""
+    _apply(db, creator_id, {"predictions_created": 1}, touch=True)
+
+
+def record_status_changes(db: Session, changes: Iterable[Tuple[int, Optional[str], Optional[str]]]):
+    """
+    (제안자 ID, 이전 상태, 새 상태) 목록으로 승인/거절 수 갱신
+    삭제되어 선택되지 않은 예측은 새 상태를 "rejected"로 전달
+    """
+    totals: Dict[int, Counter] = {}
+    for creator_id, old_status, new_status in changes:
+        totals.setdefault(creator_id, Counter()).update(_status_deltas(old_status, new_status))
+    for creator_id, deltas in totals.items():
+        _apply(db, creator_id, dict(deltas))
+
+
+def record_discarded_predictions(db: Session, predictions: Iterable[Tuple[int, int]]):
+    """
+    자동 선택에서 삭제되는 (예측 ID, 제안자 ID) 기록 (호출한 쪽 트랜잭션에서 커밋)
+    삭제 후에도 rebuild_creator_stats가 거절 수와 제안 수를 다시 계산할 수 있도록 보존
+    """
+    now = datetime.utcnow()
+    rows = [
+        {"prediction_id": prediction_id, "creator_id": creator_id, "discarded_at": now}
+        for prediction_id, creator_id in predictions
+    ]
+    if rows:
+        db.execute(dialect_insert(db, DiscardedPrediction), rows)
+
+
+def record_bet_created(db: Session, prediction_creator_id: int, bettor_id: int, amount: float):
+    """베팅 생성 시 예측 제안자의 유치 베팅 수/금액과 베팅한 사용자의 활동일 갱신"""
+    _apply(db, prediction_creator_id, {"bets_attracted": 1, "bet_volume_attracted": amount})
+    _apply(db, bettor_id, {}, touch=True)
+
+
+def record_bets_created(db: Session, bets: Iterable[Tuple[int, int, float]]):
+    """(예측 제안자 ID, 베팅한 사용자 ID, 금액) 목록을 사용자별로 합쳐 한 번씩 갱신 (일괄 등록용)"""
+    attracted: Dict[int, Counter] = {}
+    bettors = set()
+    for prediction_creator_id, bettor_id, amount in bets:
+        attracted.setdefault(prediction_creator_id, Counter()).update(
+            {"bets_attracted": 1, "bet_volume_attracted": amount}
+        )
+        bettors.add(bettor_id)
+    for creator_id, deltas in attracted.items():
+        _apply(db, creator_id, dict(deltas))
+    for bettor_id in bettors:
+        _apply(db, bettor_id, {}, touch=True)
+
+
+def _success_rate(approved: int, rejected: int) -> Optional[float]:
+    decided = approved + rejected
+    return approved / decided if decided else None
+
+
+def contribution_score(success_rate: Optional[float], bet_volume: float) -> float:
+    """승인 성공률(최대 50점)과 유치 베팅액(1000 USDC에서 최대 50점)으로 기여도 계산"""
+    return round((success_rate or 0.0) * 50 + min(50.0, (bet_volume or 0.0) / 20), 1)
+
+
+def load_creator_profiles(db: Session, creator_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """제안자별 사용자명과 평판 집계를 한 번의 쿼리로 조회"""
+    creator_ids = list(set(creator_ids))
+    if not creator_ids:
+        return {}
+
+    rows = db.query(User.id, User.username, CreatorStats).outerjoin(
+        CreatorStats, CreatorStats.user_id == User.id
+    ).filter(User.id.in_(creator_ids)).all()
+
+    profiles = {}
+    for user_id, username, stats in rows:
+        approved = stats.approved_count if stats else 0
+        rejected = stats.rejected_count if stats else 0
+        bet_volume = stats.bet_volume_attracted if stats else 0.0
+        success_rate = _success_rate(approved, rejected)
+        profiles[user_id] = {
+            "creator_username": username,
+            "creator_activity_days": stats.activity_days if stats else 0,
+            "creator_contribution_score": contribution_score(success_rate, bet_volume),
+            "creator_predictions_created": stats.predictions_created if stats else 0,
+            "creator_approved_count": approved,
+            "creator_rejected_count": rejected,
+            "creator_success_rate": success_rate,
+            "creator_bets_attracted": stats.bets_attracted if stats else 0,
+            "creator_bet_volume": bet_volume,
+        }
+    return profiles
+
+
+def rebuild_creator_stats(db: Session) -> int:
+    """
+    예측/베팅 테이블에서 전체 제안자 집계를 다시 계산 (초기 적재/정합성 복구용)
+    자동 선택에서 삭제된 예측은 discarded_predictions 기록으로 거절/제안 수에 포함
+    """
+    accepted = case((PredictionEvent.status.in_(list(ACCEPTED_STATUSES)), 1), else_=0)
+    rejected = case((PredictionEvent.status.in_(list(REJECTED_STATUSES)), 1), else_=0)
+
+    stats: Dict[int, Dict[str, Any]] = {}
+
+    def row(user_id: int) -> Dict[str, Any]:
+        return stats.setdefault(user_id, {
+            "user_id": user_id,
+            "activity_days": 0,
+            "last_active_date": None,
+            "predictions_created": 0,
+            "approved_count": 0,
+            "rejected_count": 0,
+            "bets_attracted": 0,
+            "bet_volume_attracted": 0.0,
+        })
+
+    for creator_id, created, approved_count, rejected_count in db.query(
+        PredictionEvent.creator_id,
+        func.count(PredictionEvent.id),
+        func.sum(accepted),
+        func.sum(rejected)
+    ).group_by(PredictionEvent.creator_id).all():
+        entry = row(creator_id)
+        entry["predictions_created"] = created
+        entry["approved_count"] = approved_count or 0
+        entry["rejected_count"] = rejected_count or 0
+
+    for creator_id, discarded in db.query(
+        DiscardedPrediction.creator_id,
+        func.count(DiscardedPrediction.id)
+    ).group_by(DiscardedPrediction.creator_id).all():
+        entry = row(creator_id)
+        entry["predictions_created"] += discarded
+        entry["rejected_count"] += discarded
+
+    for creator_id, bet_count, bet_volume in db.query(
+        PredictionEvent.creator_id,
+        func.count(Bet.id),
+        func.coalesce(func.sum(Bet.amount), 0.0)
+    ).join(Bet, Bet.prediction_id == PredictionEvent.id).group_by(PredictionEvent.creator_id).all():
+        entry = row(creator_id)
+        entry["bets_attracted"] = bet_count
+        entry["bet_volume_attracted"] = float(bet_volume or 0.0)
+
+    # 예측 생성일과 베팅일을 합친 사용자별 활동 날짜
+    activity = union(
+        select(PredictionEvent.creator_id.label("user_id"), func.date(PredictionEvent.created_at).label("day")),
+        select(Bet.user_id.label("user_id"), func.date(Bet.created_at).label("day"))
+    ).subquery()
+    for user_id, days, last_day in db.execute(
+        select(activity.c.user_id, func.count(), func.max(activity.c.day)).group_by(activity.c.user_id)
+    ).all():
+        entry = row(user_id)
+        entry["activity_days"] = days
+        entry["last_active_date"] = str(last_day) if last_day else None
+
+    db.query(CreatorStats).delete(synchronize_session=False)
+    if stats:
+        db.execute(dialect_insert(db, CreatorStats), list(stats.values()))
+    db.commit()
+    return len(stats)
@@ -0,0 +1,169 @@
+import asyncio
+import heapq
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, or_, update
+
+from app.core.config import settings
+from app.models.database import SessionLocal, PredictionEvent
+from app.services.realtime import publish_status
+
+# 베팅 기간이 끝나면 expired로 바뀌는 상태 (pending은 승인 전이므로 제외)
+EXPIRABLE_STATUSES = ("approved", "active")
+
+
+def not_expired_condition(now: Optional[datetime] = None):
+    """expires_at이 지나지 않은 예측 조건 (스케줄러 반영 전 목록 보호용)"""
+    now = now or datetime.utcnow()
+    return or_(PredictionEvent.expires_at.is_(None), PredictionEvent.expires_at > now)
+
+
+def expire_due_predictions(db, now: Optional[datetime] = None) -> List[int]:
+    """
+    만료 시각이 지난 approved/active 예측을 한 번의 UPDATE로 expired 처리하고 ID 반환
+    (status, expires_at 인덱스 사용, RETURNING은 SQLite 3.35+/PostgreSQL 지원)
+    """
+    now = now or datetime.utcnow()
+    expired_ids = db.execute(
+        update(PredictionEvent).where(
+            PredictionEvent.status.in_(EXPIRABLE_STATUSES),
+            PredictionEvent.expires_at <= now
+        ).values(status="expired").returning(PredictionEvent.id)
+    ).scalars().all()
+    db.commit()
+    return expired_ids
+
+
+class ExpiryScheduler:
+    """
+    예측 만료 스케줄러
+    - 다가오는 expires_at을 min-heap에 보관하고 가장 이른 시각까지 대기
+    - 깨어나면 만료된 예측 전체를 한 번의 UPDATE로 expired 처리
+    - 예측 생성/승인 시 schedule()로 재무장, 다른 프로세스 변경은 EXPIRY_RESYNC_SECONDS마다 DB에서 다시 읽음
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def schedule(self, prediction_id: int, expires_at: Optional[datetime]):
+        """
+        만료 시각 등록 (어느 스레드에서 호출해도 됨)
+        실행 중이면 heap 변경과 깨우기를 이벤트 루프에서 처리 (sync 엔드포인트는 스레드풀에서 호출)
+        """
+        if expires_at is None:
+            return
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            heapq.heappush(self._heap, (expires_at, prediction_id))
+            return
+        try:
+            loop.call_soon_threadsafe(self._push, prediction_id, expires_at)
+        except RuntimeError:
+            pass
+
+    def _push(self, prediction_id: int, expires_at: datetime):
+        heapq.heappush(self._heap, (expires_at, prediction_id))
+        # 새 시각이 가장 이르면 대기 중인 루프를 깨워 다시 계산
+        if self._wakeup is not None and self._heap[0] == (expires_at, prediction_id):
+            self._wakeup.set()
+
+    def _load(self):
+        """아직 만료되지 않은 approved/active 예측의 expires_at으로 heap 재구성"""
+        db = SessionLocal()
+        try:
+            rows = db.query(PredictionEvent.expires_at, PredictionEvent.id).filter(
+                and_(
+                    PredictionEvent.status.in_(EXPIRABLE_STATUSES),
+                    PredictionEvent.expires_at.isnot(None)
+                )
+            ).all()
+        finally:
+            db.close()
+        self._heap = [(expires_at, prediction_id) for expires_at, prediction_id in rows]
+        heapq.heapify(self._heap)
+
+    def _expire(self, now: datetime) -> List[int]:
+        db = SessionLocal()
+        try:
+            return expire_due_predictions(db, now)
+        finally:
+            db.close()
+
+    async def start(self):
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._load()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._wakeup = None
+        self._loop = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        resync_at = loop.time() + settings.EXPIRY_RESYNC_SECONDS
+        while True:
+            if loop.time() >= resync_at:
+                self._load()
+                resync_at = loop.time() + settings.EXPIRY_RESYNC_SECONDS
+
+            now = datetime.utcnow()
+            due = False
+            while self._heap and self._heap[0][0] <= now:
+                heapq.heappop(self._heap)
+                due = True
+            if due:
+                try:
+                    expired_ids = self._expire(now)
+                    if expired_ids:
+                        print(f"만료 시각이 지난 예측 {len(expired_ids)}개를 expired로 변경했습니다.")
+                        publish_status(expired_ids, "expired")
+                except Exception as e:
+                    print(f"Prediction expiry failed: {e}")
+
+            timeout = resync_at - loop.time()
+            if self._heap:
+                timeout = min(timeout, (self._heap[0][0] - datetime.utcnow()).total_seconds())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, timeout))
+            except asyncio.TimeoutError:
+                pass
+
+
+_expiry_scheduler: Optional[ExpiryScheduler] = None
+
+
+def get_expiry_scheduler() -> ExpiryScheduler:
+    """앱 전체에서 공유하는 만료 스케줄러 반환"""
+    global _expiry_scheduler
+    if _expiry_scheduler is None:
+        _expiry_scheduler = ExpiryScheduler()
+    return _expiry_scheduler
+
+
+async def start_expiry_scheduler():
+    """스케줄러 시작 (앱 시작 시, 이미 지난 예측은 바로 만료 처리)"""
+    await get_expiry_scheduler().start()
+
+
+async def stop_expiry_scheduler():
+    """스케줄러 종료 (앱 종료 시)"""
+    global _expiry_scheduler
+    if _expiry_scheduler is not None:
+        await _expiry_scheduler.stop()
+        _expiry_scheduler = None
@@ -0,0 +1,101 @@
+import math
+import re
+from collections import Counter
+from typing import Any, Dict
+
+from app.services.weight_profiles import weighted_total
+
+# 판정 시점을 나타내는 표현이 있으면 해결 가능성이 높다고 봄
+_TIMEFRAME_PATTERN = re.compile(
+    r"\d|경기|전반|후반|시즌|라운드|오늘|내일|이번|match|game|half|season|round|today|tonight|week",
+    re.IGNORECASE
+)
+_NUMBER_PATTERN = re.compile(r"\d")
+
+
+def _clamp(value: float) -> float:
+    return round(min(100.0, max(0.0, value)), 1)
+
+
+class HeuristicScoringService:
+    """
+    Gemini 없이 예측 텍스트와 제안자 통계만으로 점수를 계산하는 로컬 스코어러
+    - AIScoringService와 같은 인터페이스 (calculate_prediction_score / calculate_batch_scores)
+    - 백엔드 비교의 기준선, 외부 API를 쓸 수 없을 때의 임시 점수로 사용
+    """
+
+    gemini_model = "heuristic"
+
+    def __init__(self):
+        self.usage = Counter()
+
+    def score(self, prediction_data: Dict[str, Any]) -> Dict[str, Any]:
+        prediction = prediction_data.get('prediction', '') or ''
+        option_a = prediction_data.get('option_a', '') or ''
+        option_b = prediction_data.get('option_b', '') or ''
+
+        # 품질: 적당한 길이, 수치 기준, 판정 시점, 두 옵션이 구분되는지
+        clarity = 90 - abs(len(prediction) - 60) * 0.5
+        data_source = 80 if _NUMBER_PATTERN.search(prediction) else 60
+        timeframe = 85 if _TIMEFRAME_PATTERN.search(prediction) else 55
+        compliance = 80 if option_a and option_b and option_a.strip() != option_b.strip() else 40
+        quality_details = {
+            'clarity': _clamp(clarity),
+            'data_source': data_source,
+            'timeframe': timeframe,
+            'compliance': compliance
+        }
+
+        # 수요: 제안자 예측이 지금까지 모은 베팅 수
+        bets_attracted = prediction_data.get('creator_bets_attracted', 0) or 0
+        topic_popularity = _clamp(50 + 10 * math.log1p(bets_attracted))
+        demand_details = {'trend_indicators': 60, 'topic_popularity': topic_popularity, 'timing': timeframe}
+
+        # 평판: 승인률과 활동일수
+        success_rate = prediction_data.get('creator_success_rate')
+        activity_days = prediction_data.get('creator_activity_days', 0) or 0
+        success_history = _clamp(success_rate * 100) if success_rate is not None else 50
+        loyalty = _clamp(40 + activity_days * 2)
+        bond_size = _clamp(prediction_data.get('creator_contribution_score', 0.0) or 0.0)
+        reputation_details = {'loyalty': loyalty, 'success_history': success_history, 'bond_size': bond_size}
+
+        # 경제성: 유치 베팅액, 수치 판정이면 오라클 비용이 낮음
+        bet_volume = prediction_data.get('creator_bet_volume', 0.0) or 0.0
+        economic_details = {
+            'liquidity': _clamp(40 + 10 * math.log10(1 + bet_volume)),
+            'volatility': 70,
+            'oracle_cost': data_source
+        }
+
+        quality_score = _clamp(sum(quality_details.values()) / len(quality_details))
+        demand_score = _clamp(sum(demand_details.values()) / len(demand_details))
+        reputation_score = _clamp(sum(reputation_details.values()) / len(reputation_details))
+        economic_score = _clamp(sum(economic_details.values()) / len(economic_details))
+        novelty_score = _clamp(prediction_data.get('novelty_score', 80))
+
+        return {
+            'quality_score': quality_score,
+            'demand_score': demand_score,
+            'reputation_score': reputation_score,
+            'novelty_score': novelty_score,
+            'economic_score': economic_score,
+            'total_score': round(weighted_total(
+                quality_score, demand_score, reputation_score, novelty_score, economic_score
+            ), 2),
+            'quality_details': quality_details,
+            'demand_details': demand_details,
+            'reputation_details': reputation_details,
+            'novelty_details': prediction_data.get('novelty_details', {}),
+            'economic_details': economic_details,
+            'ai_reasoning': '휴리스틱 점수: 예측 문장 형식과 제안자 통계로 계산했습니다.',
+            'is_fallback': False,
+            'cache_hit': False
+        }
+
+    async def calculate_prediction_score(self, prediction_data: Dict[str, Any]) -> Dict[str, Any]:
+        self.usage['requests'] += 1
+        return self.score(prediction_data)
+
+    async def calculate_batch_scores(self, items: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        self.usage['requests'] += 1
+        return {item_id: self.score(prediction_data) for item_id, prediction_data in items.items()}
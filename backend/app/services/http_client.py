@@ -0,0 +1,54 @@
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+# 앱 전체에서 공유하는 비동기 HTTP 클라이언트 (FastAPI lifespan에서 생성/종료)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """h2 패키지가 설치된 경우에만 HTTP/2 사용"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """keep-alive 커넥션 풀과 타임아웃이 설정된 AsyncClient 생성"""
+    timeout = httpx.Timeout(
+        settings.HTTP_READ_TIMEOUT_SECONDS,
+        connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS
+    )
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS
+    )
+    return httpx.AsyncClient(timeout=timeout, limits=limits, http2=_http2_available())
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    """공유 클라이언트 생성 (앱 시작 시)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client():
+    """공유 클라이언트 종료 (앱 종료 시)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 클라이언트 반환, lifespan 밖(스크립트 등)에서는 지연 생성"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
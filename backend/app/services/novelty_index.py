@@ -0,0 +1,287 @@
+import asyncio
+import hashlib
+import heapq
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.models.database import SessionLocal, PredictionEvent
+
+# MinHash/LSH 파라미터: 64개 해시를 2개씩 32밴드로 나누면 유사도 0.3 이상은 약 95% 확률로 후보에 포함
+NUM_PERM = 64
+BANDS = 32
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+NEAR_DUPLICATE_THRESHOLD = 0.5  # 이 이상이면 선점 여부 판단 대상
+
+# 시그니처는 64개 해시 최솟값을 32비트 lane으로 이어 붙인 정수 하나 (lane 최상위 비트는 비교용으로 항상 0)
+_LANE_BITS = 32
+_VALUE_BITS = _LANE_BITS - 1
+_DIGEST_SIZE = NUM_PERM * _LANE_BITS // 8
+_LANE_LOW = sum(1 << (lane * _LANE_BITS) for lane in range(NUM_PERM))
+_LANE_HIGH = _LANE_LOW << _VALUE_BITS
+_VALUE_MASK = _LANE_HIGH - _LANE_LOW  # 모든 lane의 값 비트
+_BAND_BITS = ROWS_PER_BAND * _LANE_BITS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+
+def prediction_text(game_id: str, prediction: str, option_a: str, option_b: str) -> str:
+    """유사도 비교에 쓰는 예측 텍스트"""
+    return " ".join(filter(None, [game_id, prediction, option_a, option_b]))
+
+
+def _shingles(text: str) -> Set[bytes]:
+    """소문자/공백 정규화 후 문자 3-gram 집합 (한글/영문 공통)"""
+    text = " ".join(unicodedata.normalize("NFKC", text).lower().split())
+    if len(text) <= SHINGLE_SIZE:
+        grams = {text} if text else set()
+    else:
+        grams = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    return {gram.encode("utf-8") for gram in grams}
+
+
+def _lane_min(a: int, b: int) -> int:
+    """lane별 최솟값 (a | 최상위 비트) - b는 lane 사이 빌림이 없고, a >= b인 lane만 최상위 비트가 남음"""
+    guard = ((a | _LANE_HIGH) - b) & _LANE_HIGH
+    take_b = guard - (guard >> _VALUE_BITS)
+    return (b & take_b) | (a & (_VALUE_MASK ^ take_b))
+
+
+def minhash_signature(text: str) -> int:
+    """
+    MinHash 시그니처
+    shingle마다 shake_128 한 번으로 해시 64개(31비트)를 lane 정수로 만들고,
+    shingle 사이 최솟값은 lane 단위 정수 연산으로 64개를 한 번에 계산 (순열별 Python 루프 없음)
+    """
+    signature = _VALUE_MASK
+    for gram in _shingles(text):
+        hashes = int.from_bytes(hashlib.shake_128(gram).digest(_DIGEST_SIZE), "little") & _VALUE_MASK
+        signature = _lane_min(signature, hashes)
+    return signature
+
+
+def _similarity(sig_a: int, sig_b: int) -> float:
+    """
+    두 시그니처의 일치 비율 = Jaccard 유사도 추정치
+    XOR한 lane마다 최상위 비트를 세우고 1을 빼면 0인 lane만 최상위 비트가 꺼짐 (lane 사이 빌림 없음)
+    """
+    different = ((((sig_a ^ sig_b) | _LANE_HIGH) - _LANE_LOW) & _LANE_HIGH).bit_count()
+    return (NUM_PERM - different) / NUM_PERM
+
+
+def _similarity_upper_bound(band_hits: int) -> float:
+    """일치한 밴드 수로 가능한 최대 유사도 (일치하지 않은 밴드도 ROWS_PER_BAND - 1개까지는 같을 수 있음)"""
+    return (band_hits * ROWS_PER_BAND + (BANDS - band_hits) * (ROWS_PER_BAND - 1)) / NUM_PERM
+
+
+def _band_keys(signature: int) -> List[Tuple[int, int]]:
+    return [
+        (band, (signature >> (band * _BAND_BITS)) & _BAND_MASK)
+        for band in range(BANDS)
+    ]
+
+
+class NoveltyIndex:
+    """
+    예측 텍스트의 MinHash/LSH 기반 근접 중복 인덱스
+    - 예측 생성/삭제 시 증분 갱신
+    - LSH 버킷 후보만 시그니처로 비교하므로 전체 예측 수와 무관하게 빠르게 조회
+    - 일치 밴드가 많은 후보부터 비교하고, 남은 후보의 최대 유사도가 상위 k개보다 낮으면 중단
+    - 기존 예측은 load()로 백그라운드에서 채우며, 그 사이 삭제된 예측은 다시 넣지 않음
+    """
+
+    def __init__(self):
+        self._signatures: Dict[int, int] = {}
+        self._buckets: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._removed: Set[int] = set()
+        self.ready = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, prediction_id: int, text: str):
+        signature = minhash_signature(text)
+        with self._lock:
+            self._add_locked(prediction_id, signature)
+
+    def load(self, rows: List[Tuple[int, str]]):
+        """
+        DB에서 읽은 기존 예측 추가 (백그라운드 생성용)
+        그 사이 add()된 예측은 최신 값을 유지하고 remove()된 예측은 건너뜀
+        """
+        signatures = [(prediction_id, minhash_signature(text)) for prediction_id, text in rows]
+        with self._lock:
+            for prediction_id, signature in signatures:
+                if prediction_id not in self._signatures and prediction_id not in self._removed:
+                    self._add_locked(prediction_id, signature)
+
+    def mark_ready(self):
+        with self._lock:
+            self._removed.clear()
+        self.ready.set()
+
+    def _add_locked(self, prediction_id: int, signature: int):
+        self._remove_locked(prediction_id)
+        self._removed.discard(prediction_id)
+        self._signatures[prediction_id] = signature
+        for key in _band_keys(signature):
+            self._buckets[key].add(prediction_id)
+
+    def remove(self, prediction_id: int):
+        with self._lock:
+            self._remove_locked(prediction_id)
+            if not self.ready.is_set():
+                self._removed.add(prediction_id)
+
+    def _remove_locked(self, prediction_id: int):
+        signature = self._signatures.pop(prediction_id, None)
+        if signature is None:
+            return
+        for key in _band_keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(prediction_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        k: int = 5,
+        prediction_id: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        유사도 높은 순 상위 k개 (prediction_id, 유사도) 반환
+        prediction_id가 인덱스에 있으면 저장된 시그니처를 쓰고 자기 자신은 제외
+        """
+        signature = self._signatures.get(prediction_id) if prediction_id is not None else None
+        if signature is None:
+            signature = minhash_signature(text or "")
+        with self._lock:
+            band_hits: Counter = Counter()
+            for key in _band_keys(signature):
+                band_hits.update(self._buckets.get(key, ()))
+            band_hits.pop(prediction_id, None)
+            by_hits: Dict[int, List[int]] = defaultdict(list)
+            for candidate_id, hits in band_hits.items():
+                by_hits[hits].append(candidate_id)
+            # (유사도, -id) min-heap으로 상위 k개 유지 (동점이면 작은 id 우선)
+            top: List[Tuple[float, int]] = []
+            for hits in sorted(by_hits, reverse=True):
+                if len(top) >= k and _similarity_upper_bound(hits) < top[0][0]:
+                    break
+                for candidate_id in by_hits[hits]:
+                    entry = (_similarity(signature, self._signatures[candidate_id]), -candidate_id)
+                    if len(top) < k:
+                        heapq.heappush(top, entry)
+                    elif entry > top[0]:
+                        heapq.heapreplace(top, entry)
+        return [(-negative_id, similarity) for similarity, negative_id in sorted(top, reverse=True)]
+
+    def novelty(
+        self,
+        text: Optional[str] = None,
+        prediction_id: Optional[int] = None,
+        k: int = 5
+    ) -> Dict[str, Any]:
+        """근접 중복 기반 독창성 점수와 세부 점수 계산 (0-100)"""
+        neighbors = self.query(text, k=k, prediction_id=prediction_id)
+        max_similarity = neighbors[0][1] if neighbors else 0.0
+        uniqueness = round(100 * (1 - max_similarity))
+
+        # 먼저 제안된(더 작은 id) 근접 중복이 있으면 선점 점수 감점
+        earlier = [
+            similarity for neighbor_id, similarity in neighbors
+            if similarity >= NEAR_DUPLICATE_THRESHOLD
+            and (prediction_id is None or neighbor_id < prediction_id)
+        ]
+        first_mover = round(100 * (1 - max(earlier))) if earlier else 100
+
+        return {
+            'novelty_score': round((uniqueness + first_mover) / 2, 1),
+            'novelty_details': {
+                'first_mover': first_mover,
+                'uniqueness': uniqueness,
+                'nearest': [
+                    {'prediction_id': neighbor_id, 'similarity': round(similarity, 3)}
+                    for neighbor_id, similarity in neighbors
+                ]
+            }
+        }
+
+
+_novelty_index: Optional[NoveltyIndex] = None
+_build_lock = threading.Lock()
+_load_task: Optional[asyncio.Task] = None
+LOAD_CHUNK_SIZE = 2000
+
+
+def fill_novelty_index(index: NoveltyIndex):
+    """DB의 전체 예측을 LOAD_CHUNK_SIZE개씩 인덱스에 추가 (조회가 잠금을 오래 기다리지 않도록)"""
+    db = SessionLocal()
+    try:
+        chunk: List[Tuple[int, str]] = []
+        for prediction_id, game_id, prediction, option_a, option_b in db.query(
+            PredictionEvent.id,
+            PredictionEvent.game_id,
+            PredictionEvent.prediction,
+            PredictionEvent.option_a,
+            PredictionEvent.option_b
+        ).yield_per(LOAD_CHUNK_SIZE):
+            chunk.append((prediction_id, prediction_text(game_id, prediction, option_a, option_b)))
+            if len(chunk) >= LOAD_CHUNK_SIZE:
+                index.load(chunk)
+                chunk = []
+        index.load(chunk)
+    finally:
+        db.close()
+    index.mark_ready()
+
+
+def build_novelty_index() -> NoveltyIndex:
+    """DB의 전체 예측으로 인덱스 생성"""
+    index = NoveltyIndex()
+    fill_novelty_index(index)
+    return index
+
+
+def get_novelty_index() -> NoveltyIndex:
+    """
+    앱 전체에서 공유하는 독창성 인덱스 반환
+    start_novelty_index() 전이면 이 자리에서 DB로 생성, 이후에는 채우는 중일 수 있음 (조회 전 wait_novelty_index())
+    """
+    global _novelty_index
+    if _novelty_index is None:
+        with _build_lock:
+            if _novelty_index is None:
+                _novelty_index = build_novelty_index()
+    return _novelty_index
+
+
+async def start_novelty_index():
+    """빈 인덱스를 바로 등록하고 기존 예측은 스레드에서 채움 (앱 시작을 막지 않음)"""
+    global _novelty_index, _load_task
+    if _novelty_index is not None:
+        return
+    index = NoveltyIndex()
+    _novelty_index = index
+
+    async def load():
+        try:
+            await asyncio.to_thread(fill_novelty_index, index)
+            print(f"독창성 인덱스 생성 완료: 예측 {len(index)}개")
+        except Exception as e:
+            print(f"Novelty index build failed: {e}")
+            index.mark_ready()
+
+    _load_task = asyncio.create_task(load())
+
+
+async def wait_novelty_index() -> NoveltyIndex:
+    """인덱스를 채우는 중이면 끝날 때까지 대기 후 반환 (독창성 점수가 일부 예측만으로 계산되지 않도록)"""
+    index = get_novelty_index()
+    if not index.ready.is_set() and _load_task is not None:
+        await asyncio.shield(_load_task)
+    return index
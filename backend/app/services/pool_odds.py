@@ -0,0 +1,145 @@
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.models.database import SessionLocal, Bet, PredictionEvent
+from app.services.pool_totals import option_side
+
+SIDES = ("a", "b")
+
+
+def to_units(amount: float) -> int:
+    """USDC 금액을 컨트랙트 최소 단위로 변환 (프론트엔드 placeBet과 같은 내림)"""
+    return math.floor(amount * 10 ** settings.USDC_DECIMALS)
+
+
+def claim_payout(pot_units: int, side_units: int, bet_units: int, fee_bps: int) -> int:
+    """
+    Move claim과 같은 정산 금액 계산 (최소 단위 정수 연산)
+    수수료 = pot * fee_bps / 10000 (내림), 지급액 = (pot - 수수료) * bet / 승리 측 합계 (내림)
+    """
+    if side_units <= 0:
+        return 0
+    net_units = pot_units - pot_units * fee_bps // 10000
+    return net_units * bet_units // side_units
+
+
+class _PoolState:
+    __slots__ = ("labels", "units", "bettors")
+
+    def __init__(self, option_a: str, option_b: str):
+        self.labels = (option_a, option_b)
+        self.units = [0, 0]
+        self.bettors = [0, 0]
+
+
+class PoolOddsAggregator:
+    """
+    예측별 옵션 베팅 합계를 메모리에 보관하는 배당 집계기
+    - 시작 시 bets 테이블로 한 번 채우고 이후 create_bet마다 증분 반영
+    - 금액은 컨트랙트와 같은 최소 단위 정수로 누적해 claim 계산과 오차가 없음
+    - 예측당 1인 1베팅이므로 베팅 수를 베팅 참여자 수로 사용
+    """
+
+    def __init__(self, fee_bps: Optional[int] = None):
+        self.fee_bps = settings.POOL_FEE_BPS if fee_bps is None else fee_bps
+        self._pools: Dict[int, _PoolState] = {}
+        self._lock = threading.Lock()
+
+    def ensure(self, prediction_id: int, option_a: str, option_b: str):
+        """베팅이 없는 예측도 조회되도록 빈 집계 등록"""
+        with self._lock:
+            if prediction_id not in self._pools:
+                self._pools[prediction_id] = _PoolState(option_a, option_b)
+
+    def record(self, prediction_id: int, option_a: str, option_b: str, side: str, amount: float, bets: int = 1):
+        index = SIDES.index(side)
+        with self._lock:
+            state = self._pools.get(prediction_id)
+            if state is None:
+                state = self._pools[prediction_id] = _PoolState(option_a, option_b)
+            state.units[index] += to_units(amount)
+            state.bettors[index] += bets
+
+    def remove(self, prediction_id: int):
+        with self._lock:
+            self._pools.pop(prediction_id, None)
+
+    def odds(self, prediction_id: int) -> Optional[Dict[str, Any]]:
+        """옵션별 합계/비율/배당 반환 (집계에 없는 예측은 None)"""
+        with self._lock:
+            state = self._pools.get(prediction_id)
+            if state is None:
+                return None
+            labels, units, bettors = state.labels, tuple(state.units), tuple(state.bettors)
+
+        scale = 10 ** settings.USDC_DECIMALS
+        pot_units = units[0] + units[1]
+        fee_units = pot_units * self.fee_bps // 10000
+        options = []
+        for index, side in enumerate(SIDES):
+            side_units = units[index]
+            options.append({
+                "side": side,
+                "label": labels[index],
+                "total_amount": side_units / scale,
+                "bettors": bettors[index],
+                "share": round(side_units / pot_units, 4) if pot_units else 0.0,
+                # 이 옵션이 이기면 1 USDC당 받는 금액 (claim과 같은 내림, 베팅이 없으면 None)
+                "payout_multiplier": (
+                    claim_payout(pot_units, side_units, scale, self.fee_bps) / scale if side_units else None
+                )
+            })
+        return {
+            "prediction_id": prediction_id,
+            "total_amount": pot_units / scale,
+            "total_bettors": bettors[0] + bettors[1],
+            "fee_bps": self.fee_bps,
+            "fee_amount": fee_units / scale,
+            "net_pot": (pot_units - fee_units) / scale,
+            "options": options
+        }
+
+    def missing(self, prediction_ids: Iterable[int]) -> List[int]:
+        with self._lock:
+            return [prediction_id for prediction_id in prediction_ids if prediction_id not in self._pools]
+
+
+_pool_odds: Optional[PoolOddsAggregator] = None
+_build_lock = threading.Lock()
+
+
+def build_pool_odds() -> PoolOddsAggregator:
+    """DB의 전체 예측과 베팅으로 집계기 생성"""
+    aggregator = PoolOddsAggregator()
+    db = SessionLocal()
+    try:
+        labels: Dict[int, Tuple[str, str]] = {
+            prediction_id: (option_a, option_b)
+            for prediction_id, option_a, option_b in db.query(
+                PredictionEvent.id, PredictionEvent.option_a, PredictionEvent.option_b
+            ).yield_per(10000)
+        }
+        for prediction_id, (option_a, option_b) in labels.items():
+            aggregator.ensure(prediction_id, option_a, option_b)
+        for prediction_id, option, amount in db.query(
+            Bet.prediction_id, Bet.option, Bet.amount
+        ).yield_per(10000):
+            option_a, option_b = labels.get(prediction_id, (None, None))
+            side = option_side(option_a, option_b, option) if option_a is not None else None
+            if side is not None:
+                aggregator.record(prediction_id, option_a, option_b, side, amount)
+    finally:
+        db.close()
+    return aggregator
+
+
+def get_pool_odds() -> PoolOddsAggregator:
+    """앱 전체에서 공유하는 배당 집계기 반환 (최초 호출 시 DB에서 생성)"""
+    global _pool_odds
+    if _pool_odds is None:
+        with _build_lock:
+            if _pool_odds is None:
+                _pool_odds = build_pool_odds()
+    return _pool_odds
@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session
+
+from app.models.database import Bet, PredictionEvent, PredictionPoolStats, dialect_insert
+
+
+def option_side(option_a: str, option_b: str, option: str) -> Optional[str]:
+    """베팅 옵션이 option_a/option_b 중 어느 쪽인지 반환 (옵션 문구 또는 "option_a"/"option_b")"""
+    if option in (option_a, "option_a"):
+        return "a"
+    if option in (option_b, "option_b"):
+        return "b"
+    return None
+
+
+def bet_side(prediction: PredictionEvent, option: str) -> Optional[str]:
+    return option_side(prediction.option_a, prediction.option_b, option)
+
+
+def record_bet_totals(db: Session, prediction_id: int, side: str, amount: float, bets: int = 1):
+    """
+    베팅 수/금액을 예측 전체 합계와 옵션별 합계에 증분 반영 (호출한 쪽 트랜잭션에서 커밋)
+    UPDATE ... SET x = x + ? 형태로 처리하여 동시 베팅에도 값이 유실되지 않음
+    """
+    db.query(PredictionEvent).filter(PredictionEvent.id == prediction_id).update({
+        PredictionEvent.total_bets: func.coalesce(PredictionEvent.total_bets, 0) + bets,
+        PredictionEvent.total_amount: func.coalesce(PredictionEvent.total_amount, 0) + amount
+    }, synchronize_session=False)
+
+    db.execute(
+        dialect_insert(db, PredictionPoolStats).values(prediction_id=prediction_id).on_conflict_do_nothing(
+            index_elements=["prediction_id"]
+        )
+    )
+    bets_column = getattr(PredictionPoolStats, f"option_{side}_bets")
+    amount_column = getattr(PredictionPoolStats, f"option_{side}_amount")
+    db.query(PredictionPoolStats).filter(PredictionPoolStats.prediction_id == prediction_id).update({
+        bets_column: bets_column + bets,
+        amount_column: amount_column + amount,
+        PredictionPoolStats.updated_at: datetime.utcnow()
+    }, synchronize_session=False)
+
+
+def load_pool_totals(db: Session, prediction_id: int) -> Optional[Dict[str, Any]]:
+    """예측 한 건의 베팅 합계를 집계 행에서 바로 조회 (bets 테이블을 읽지 않음, 예측이 없으면 None)"""
+    row = db.query(
+        PredictionEvent.total_bets, PredictionEvent.total_amount, PredictionPoolStats
+    ).outerjoin(
+        PredictionPoolStats, PredictionPoolStats.prediction_id == PredictionEvent.id
+    ).filter(PredictionEvent.id == prediction_id).first()
+    if row is None:
+        return None
+
+    total_bets, total_amount, stats = row
+    return {
+        "prediction_id": prediction_id,
+        "total_bets": total_bets or 0,
+        "total_amount": float(total_amount or 0.0),
+        "option_a_bets": stats.option_a_bets if stats else 0,
+        "option_a_amount": stats.option_a_amount if stats else 0.0,
+        "option_b_bets": stats.option_b_bets if stats else 0,
+        "option_b_amount": stats.option_b_amount if stats else 0.0,
+    }
+
+
+def rebuild_pool_totals(db: Session, prediction_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    bets 테이블에서 예측별 전체/옵션별 베팅 합계를 다시 계산 (정합성 복구용)
+    prediction_ids를 주면 해당 예측만 다시 계산하고, 갱신한 예측 수를 반환
+    """
+    if prediction_ids is not None:
+        prediction_ids = list(set(prediction_ids))
+        if not prediction_ids:
+            return 0
+
+    side_a = or_(Bet.option == PredictionEvent.option_a, Bet.option == "option_a")
+    side_b = or_(Bet.option == PredictionEvent.option_b, Bet.option == "option_b")
+    query = db.query(
+        Bet.prediction_id,
+        func.count(Bet.id),
+        func.coalesce(func.sum(Bet.amount), 0.0),
+        func.sum(case((side_a, 1), else_=0)),
+        func.coalesce(func.sum(case((side_a, Bet.amount), else_=0.0)), 0.0),
+        func.sum(case((side_b, 1), else_=0)),
+        func.coalesce(func.sum(case((side_b, Bet.amount), else_=0.0)), 0.0)
+    ).join(PredictionEvent, PredictionEvent.id == Bet.prediction_id).group_by(Bet.prediction_id)
+    if prediction_ids is not None:
+        query = query.filter(Bet.prediction_id.in_(prediction_ids))
+    aggregates = query.all()
+
+    events = db.query(PredictionEvent)
+    stats = db.query(PredictionPoolStats)
+    if prediction_ids is not None:
+        events = events.filter(PredictionEvent.id.in_(prediction_ids))
+        stats = stats.filter(PredictionPoolStats.prediction_id.in_(prediction_ids))
+
+    try:
+        # 베팅이 없는 예측은 0으로 두고, 베팅이 있는 예측만 다시 채움
+        updated = events.update({
+            PredictionEvent.total_bets: 0,
+            PredictionEvent.total_amount: 0
+        }, synchronize_session=False)
+        stats.delete(synchronize_session=False)
+        for prediction_id, bets, amount, a_bets, a_amount, b_bets, b_amount in aggregates:
+            db.query(PredictionEvent).filter(PredictionEvent.id == prediction_id).update({
+                PredictionEvent.total_bets: bets,
+                PredictionEvent.total_amount: float(amount)
+            }, synchronize_session=False)
+        if aggregates:
+            db.execute(dialect_insert(db, PredictionPoolStats), [
+                {
+                    "prediction_id": prediction_id,
+                    "option_a_bets": a_bets or 0,
+                    "option_a_amount": float(a_amount),
+                    "option_b_bets": b_bets or 0,
+                    "option_b_amount": float(b_amount),
+                }
+                for prediction_id, _, _, a_bets, a_amount, b_bets, b_amount in aggregates
+            ])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return updated
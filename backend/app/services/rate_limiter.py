@@ -0,0 +1,93 @@
+import asyncio
+import time
+from typing import Optional
+
+from app.core.config import settings
+
+
+class TokenBucket:
+    """분당 rate 만큼 채워지는 토큰 버킷"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = max(rate_per_minute, 1e-9) / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_second)
+            self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount 만큼 꺼내려면 기다려야 하는 시간(초), 0이면 즉시 가능"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate_per_second
+
+    def consume(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float):
+        """추정치와 실제 사용량의 차이 보정 (음수면 환급)"""
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class GeminiRateLimiter:
+    """
+    Gemini 할당량(RPM/TPM)에 맞춘 공유 rate limiter
+    - 요청 수와 토큰 수 두 개의 버킷을 모두 만족해야 호출
+    - 429 수신 시 pause()로 모든 호출자를 Retry-After 동안 대기시킴
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, estimated_tokens: int):
+        """요청 1건 + 예상 토큰만큼 할당량 확보 (도착 순서대로 대기)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                wait = max(
+                    self._paused_until - now,
+                    self.requests.wait_time(1, now),
+                    self.tokens.wait_time(estimated_tokens, now)
+                )
+                if wait <= 0:
+                    self.requests.consume(1)
+                    self.tokens.consume(estimated_tokens)
+                    return
+                await asyncio.sleep(wait)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """응답의 usageMetadata 기준으로 토큰 버킷 보정"""
+        self.tokens.adjust(actual_tokens - estimated_tokens)
+
+    def pause(self, seconds: float):
+        """할당량 초과 응답 시 모든 호출을 seconds 동안 중단"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def estimate_tokens(prompt: str, max_output_tokens: int) -> int:
+    """프롬프트 토큰 수 대략 추정 (한글 포함 ~3자당 1토큰) + 최대 출력 토큰"""
+    return len(prompt) // 3 + 1 + max_output_tokens
+
+
+_rate_limiter: Optional[GeminiRateLimiter] = None
+
+
+def get_rate_limiter() -> GeminiRateLimiter:
+    """앱 전체에서 공유하는 Gemini rate limiter 반환"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = GeminiRateLimiter(
+            settings.GEMINI_REQUESTS_PER_MINUTE,
+            settings.GEMINI_TOKENS_PER_MINUTE
+        )
+    return _rate_limiter
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from app.core.config import settings
+
+# 전체 피드 토픽 (승인/만료 등 상태 변경), 예측별 토픽은 prediction_topic()
+FEED_TOPIC = "predictions"
+
+# 같은 예측의 이전 값이 아직 전달되지 않았다면 최신 값으로 덮어쓰는 이벤트 종류
+COALESCED_TYPES = {"odds", "status"}
+
+
+def prediction_topic(prediction_id: int) -> str:
+    return f"prediction:{prediction_id}"
+
+
+def make_event(event_type: str, prediction_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": event_type, "prediction_id": prediction_id, "data": data, "ts": time.time()}
+
+
+def event_topics(event: Dict[str, Any]) -> Set[str]:
+    """이벤트를 받을 토픽 (예측별 토픽 + 상태 변경은 전체 피드)"""
+    topics = {prediction_topic(event["prediction_id"])}
+    if event["type"] == "status":
+        topics.add(FEED_TOPIC)
+    return topics
+
+
+class Subscription:
+    """
+    구독자 1명의 전송 대기열 (이벤트 루프 안에서만 사용)
+    - odds/status는 같은 예측의 대기 중인 이전 값을 최신 값으로 덮어씀
+    - 대기열이 max_pending을 넘으면 가장 오래된 이벤트를 버리고 dropped로 알림 (클라이언트는 다시 조회)
+    """
+
+    def __init__(self, topics: Iterable[str], max_pending: Optional[int] = None):
+        self.topics: Set[str] = set(topics)
+        self.max_pending = max(1, max_pending or settings.REALTIME_QUEUE_SIZE)
+        self.dropped = 0
+        self._pending: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._sequence = 0
+        self._ready = asyncio.Event()
+
+    def offer(self, event: Dict[str, Any]):
+        if event["type"] in COALESCED_TYPES:
+            key = (event["type"], event["prediction_id"])
+            self._pending.pop(key, None)
+        else:
+            self._sequence += 1
+            key = self._sequence
+        self._pending[key] = event
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+        self._ready.set()
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """대기 중인 이벤트를 모두 꺼냄 (timeout 동안 없으면 빈 목록)"""
+        if not self._pending:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        events = list(self._pending.values())
+        self._pending.clear()
+        if self.dropped:
+            events.insert(0, {"type": "dropped", "count": self.dropped, "ts": time.time()})
+            self.dropped = 0
+        return events
+
+
+class RealtimeBroker:
+    """
+    프로세스 내 pub-sub 브로커
+    - publish()는 어느 스레드에서 호출해도 되며 이벤트 루프에서 구독자에게 전달
+    - redis 백엔드는 채널로 발행하고 구독한 메시지를 전달하여 여러 워커가 같은 이벤트를 받음
+    """
+
+    backend = "memory"
+
+    def __init__(self):
+        self._subscriptions: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.published = 0
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+
+    async def close(self):
+        self._loop = None
+
+    def subscribe(self, topics: Iterable[str]) -> Subscription:
+        subscription = Subscription(topics)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions.discard(subscription)
+
+    def publish(self, event: Dict[str, Any]):
+        """이벤트 발행 (브로커 시작 전이거나 종료 후면 무시)"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._publish_in_loop, event)
+        except RuntimeError:
+            pass
+
+    def _publish_in_loop(self, event: Dict[str, Any]):
+        self._dispatch(event)
+
+    def _dispatch(self, event: Dict[str, Any]):
+        self.published += 1
+        topics = event_topics(event)
+        for subscription in list(self._subscriptions):
+            if subscription.topics & topics:
+                subscription.offer(event)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "subscribers": len(self._subscriptions),
+            "published": self.published
+        }
+
+
+class RedisRealtimeBroker(RealtimeBroker):
+    """Redis pub/sub으로 워커 간 이벤트를 공유하는 브로커 (Redis 장애 시 같은 워커 구독자에게만 전달)"""
+
+    backend = "redis"
+
+    def __init__(self, url: str, channel: str):
+        super().__init__()
+        import redis.asyncio as redis_asyncio
+
+        self._redis = redis_asyncio.from_url(url)
+        self._channel = channel
+        self._listener: Optional[asyncio.Task] = None
+        self._publishing: Set[asyncio.Task] = set()
+
+    async def start(self):
+        await super().start()
+        self._listener = asyncio.create_task(self._listen())
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self._redis.aclose()
+        await super().close()
+
+    def _publish_in_loop(self, event: Dict[str, Any]):
+        task = asyncio.create_task(self._publish_redis(event))
+        self._publishing.add(task)
+        task.add_done_callback(self._publishing.discard)
+
+    async def _publish_redis(self, event: Dict[str, Any]):
+        try:
+            await self._redis.publish(self._channel, json.dumps(event, ensure_ascii=False, default=str))
+        except Exception as e:
+            print(f"Realtime publish to Redis failed: {e}")
+            self._dispatch(event)
+
+    async def _listen(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub()
+                await pubsub.subscribe(self._channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._dispatch(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Realtime Redis subscription failed: {e}")
+                await asyncio.sleep(1.0)
+
+
+_broker: Optional[RealtimeBroker] = None
+
+
+def create_broker() -> RealtimeBroker:
+    """REALTIME_BACKEND 설정에 맞는 브로커 생성"""
+    if settings.REALTIME_BACKEND.lower() == "redis":
+        try:
+            return RedisRealtimeBroker(settings.REDIS_URL, settings.REALTIME_REDIS_CHANNEL)
+        except ImportError:
+            print("redis 패키지가 없어 프로세스 내 브로커를 사용합니다.")
+    return RealtimeBroker()
+
+
+def get_broker() -> RealtimeBroker:
+    """앱 전체에서 공유하는 실시간 브로커 반환"""
+    global _broker
+    if _broker is None:
+        _broker = create_broker()
+    return _broker
+
+
+def publish(event_type: str, prediction_id: int, data: Dict[str, Any]):
+    get_broker().publish(make_event(event_type, prediction_id, data))
+
+
+def publish_status(prediction_ids: Iterable[int], new_status: str):
+    """예측 상태 변경 알림 (승인/만료 등)"""
+    for prediction_id in prediction_ids:
+        publish("status", prediction_id, {"status": new_status})
+
+
+async def start_broker():
+    """브로커 시작 (앱 시작 시)"""
+    await get_broker().start()
+
+
+async def close_broker():
+    """브로커 종료 (앱 종료 시)"""
+    global _broker
+    if _broker is not None:
+        await _broker.close()
+        _broker = None
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+
+def normalize_prompt(prompt: str) -> str:
+    """공백/유니코드 차이만 있는 프롬프트가 같은 키를 갖도록 정규화"""
+    prompt = unicodedata.normalize("NFC", prompt)
+    return "\n".join(" ".join(line.split()) for line in prompt.strip().splitlines() if line.strip())
+
+
+def make_cache_key(prompt: str, model: str) -> str:
+    """정규화된 프롬프트 + 모델명의 SHA-256 해시"""
+    digest = hashlib.sha256(f"{model}\n{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+    return f"score:{model}:{digest}"
+
+
+class _CacheStats:
+    """캐시 적중/미스 카운터 (프로세스 단위)"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class InMemoryScoreCache:
+    """TTL + LRU 정책의 프로세스 내 점수 캐시"""
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: int = 604800):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.stats = _CacheStats()
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return dict(value)
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, dict(value))
+        self._entries.move_to_end(key)
+        self.stats.sets += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def close(self):
+        self._entries.clear()
+
+    def info(self) -> Dict[str, Any]:
+        return {"backend": self.backend, "size": len(self._entries), **self.stats.as_dict()}
+
+
+class RedisScoreCache:
+    """
+    Redis 기반 점수 캐시 (여러 워커가 공유)
+    TTL은 SETEX로, LRU 제거는 Redis의 maxmemory-policy(allkeys-lru)에 맡김
+    """
+
+    backend = "redis"
+
+    def __init__(self, url: str, ttl_seconds: int = 604800):
+        import redis.asyncio as redis_asyncio
+
+        self.ttl_seconds = ttl_seconds
+        self.stats = _CacheStats()
+        self._redis = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await self._redis.get(key)
+        except Exception as e:
+            # Redis 장애 시 캐시 미스로 처리하고 스코어링은 계속 진행
+            print(f"Score cache get error: {e}")
+            self.stats.errors += 1
+            self.stats.misses += 1
+            return None
+        if raw is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        try:
+            await self._redis.setex(key, self.ttl_seconds, json.dumps(value, ensure_ascii=False))
+            self.stats.sets += 1
+        except Exception as e:
+            print(f"Score cache set error: {e}")
+            self.stats.errors += 1
+
+    async def close(self):
+        await self._redis.aclose()
+
+    def info(self) -> Dict[str, Any]:
+        return {"backend": self.backend, **self.stats.as_dict()}
+
+
+class NullScoreCache:
+    """캐시 비활성화 (SCORE_CACHE_BACKEND=none)"""
+
+    backend = "none"
+
+    def __init__(self):
+        self.stats = _CacheStats()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        pass
+
+    async def close(self):
+        pass
+
+    def info(self) -> Dict[str, Any]:
+        return {"backend": self.backend, **self.stats.as_dict()}
+
+
+_score_cache = None
+
+
+def create_score_cache():
+    """SCORE_CACHE_BACKEND 설정에 맞는 캐시 생성"""
+    backend = settings.SCORE_CACHE_BACKEND.lower()
+    if backend == "redis":
+        try:
+            return RedisScoreCache(settings.REDIS_URL, settings.SCORE_CACHE_TTL_SECONDS)
+        except ImportError:
+            print("redis 패키지가 없어 메모리 캐시를 사용합니다.")
+    elif backend == "none":
+        return NullScoreCache()
+    return InMemoryScoreCache(settings.SCORE_CACHE_MAX_ENTRIES, settings.SCORE_CACHE_TTL_SECONDS)
+
+
+def get_score_cache():
+    """앱 전체에서 공유하는 점수 캐시 반환"""
+    global _score_cache
+    if _score_cache is None:
+        _score_cache = create_score_cache()
+    return _score_cache
+
+
+async def close_score_cache():
+    """공유 점수 캐시 종료 (앱 종료 시)"""
+    global _score_cache
+    if _score_cache is not None:
+        await _score_cache.close()
+        _score_cache = None
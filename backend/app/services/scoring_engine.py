@@ -0,0 +1,491 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.database import PredictionEvent, PredictionScore
+from app.services.ai_scoring import AIScoringService, get_ai_scoring_service
+from app.services.circuit_breaker import ScoringUnavailableError, defer_predictions
+from app.services.creator_stats import load_creator_profiles, record_discarded_predictions, record_status_changes
+from app.services.expiry_scheduler import get_expiry_scheduler
+from app.services.novelty_index import get_novelty_index, prediction_text, wait_novelty_index
+from app.services.pool_odds import get_pool_odds
+from app.services.realtime import publish_status
+
+
+def build_scoring_data(
+    prediction: PredictionEvent,
+    creator_profile: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    예측 이벤트를 AI 스코어링 입력 데이터로 변환
+    독창성은 근접 중복 인덱스로 계산하고, 제안자 평판은 load_creator_profiles 결과를 사용
+    """
+    novelty = get_novelty_index().novelty(
+        prediction_text(prediction.game_id, prediction.prediction, prediction.option_a, prediction.option_b),
+        prediction_id=prediction.id
+    )
+    return {
+        'game_id': prediction.game_id,
+        'prediction': prediction.prediction,
+        'option_a': prediction.option_a,
+        'option_b': prediction.option_b,
+        'creator_username': 'unknown',
+        'creator_activity_days': 0,
+        'creator_contribution_score': 0.0,
+        **(creator_profile or {}),
+        'novelty_score': novelty['novelty_score'],
+        'novelty_details': novelty['novelty_details']
+    }
+
+
+def build_score_row(prediction_id: int, score_result: Dict[str, Any]) -> PredictionScore:
+    """AI 스코어링 결과로 PredictionScore 행 생성"""
+    return PredictionScore(
+        prediction_id=prediction_id,
+        quality_score=score_result['quality_score'],
+        demand_score=score_result['demand_score'],
+        reputation_score=score_result['reputation_score'],
+        novelty_score=score_result['novelty_score'],
+        economic_score=score_result['economic_score'],
+        total_score=score_result['total_score'],
+        quality_details=score_result['quality_details'],
+        demand_details=score_result['demand_details'],
+        reputation_details=score_result['reputation_details'],
+        novelty_details=score_result['novelty_details'],
+        economic_details=score_result['economic_details'],
+        ai_reasoning=score_result['ai_reasoning']
+    )
+
+
+@dataclass(frozen=True)
+class ScoringCandidate:
+    """
+    자동 선택에 쓰는 후보 예측 값 (커밋 전에 복사)
+    스코어링 중 커밋되면 ORM 객체가 만료되어 속성을 읽을 때마다 SELECT가 실행되므로 미리 보관
+    """
+    id: int
+    game_id: str
+    prediction: str
+    creator_id: int
+    status: str
+
+    @classmethod
+    def from_prediction(cls, prediction: PredictionEvent) -> "ScoringCandidate":
+        return cls(
+            id=prediction.id,
+            game_id=prediction.game_id,
+            prediction=prediction.prediction,
+            creator_id=prediction.creator_id,
+            status=prediction.status
+        )
+
+
+def snapshot_candidates(predictions: Sequence[PredictionEvent]) -> List[ScoringCandidate]:
+    return [ScoringCandidate.from_prediction(prediction) for prediction in predictions]
+
+
+def load_candidates(db: Session, prediction_ids: Sequence[int]) -> List[ScoringCandidate]:
+    """후보 값을 ORM 객체 없이 한 번의 쿼리로 조회"""
+    if not prediction_ids:
+        return []
+    return [
+        ScoringCandidate(*row)
+        for row in db.query(
+            PredictionEvent.id,
+            PredictionEvent.game_id,
+            PredictionEvent.prediction,
+            PredictionEvent.creator_id,
+            PredictionEvent.status
+        ).filter(PredictionEvent.id.in_(list(prediction_ids))).all()
+    ]
+
+
+@dataclass
+class ScoringItemResult:
+    """개별 예측 스코어링 결과"""
+    prediction_id: int
+    success: bool
+    score: Optional[PredictionScore] = None
+    error: Optional[str] = None
+    latency_ms: float = 0.0
+    total_score: Optional[float] = None  # 커밋 후 만료된 score를 다시 읽지 않도록 따로 보관
+    cache_hit: bool = False
+    is_fallback: bool = False
+    deferred: bool = False  # 백엔드 장애로 저장하지 않고 재스코어링 대기열에 넣은 경우
+
+    @classmethod
+    def unavailable(cls, prediction_id: int, latency_ms: float) -> "ScoringItemResult":
+        return cls(
+            prediction_id=prediction_id,
+            success=False,
+            error="scoring backend unavailable",
+            latency_ms=latency_ms,
+            deferred=True
+        )
+
+    @classmethod
+    def scored(cls, prediction_id: int, score_result: Dict[str, Any], latency_ms: float) -> "ScoringItemResult":
+        if score_result.get('is_fallback'):
+            # 임시(휴리스틱) 점수는 prediction_scores에 저장하지 않고 총점만 전달
+            return cls(
+                prediction_id=prediction_id,
+                success=False,
+                error="provisional score (scoring backend unavailable)",
+                latency_ms=latency_ms,
+                total_score=score_result['total_score'],
+                is_fallback=True,
+                deferred=True
+            )
+        return cls(
+            prediction_id=prediction_id,
+            success=True,
+            score=build_score_row(prediction_id, score_result),
+            latency_ms=latency_ms,
+            total_score=score_result['total_score'],
+            cache_hit=score_result.get('cache_hit', False),
+            is_fallback=score_result.get('is_fallback', False)
+        )
+
+
+class _Pacer:
+    """AI 호출 시작 간격을 최소 interval 초 이상으로 유지"""
+
+    def __init__(self, interval: float):
+        self.interval = max(0.0, interval)
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self):
+        if self.interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+                now = time.monotonic()
+            self._next_start = now + self.interval
+
+
+class ScoringEngine:
+    """
+    동시 실행 수 제한과 호출 간격 정책을 적용한 일괄 AI 스코어링 엔진
+    - batch_size 개씩 하나의 프롬프트로 묶어 호출 (1이면 단건 호출)
+    - AI 호출은 최대 concurrency 개까지 병렬 실행
+    - 결과는 commit_batch_size 단위로 커밋
+    - 예측별 성공/실패 결과 반환
+    """
+
+    def __init__(
+        self,
+        ai_service: Optional[AIScoringService] = None,
+        concurrency: Optional[int] = None,
+        min_interval: Optional[float] = None,
+        commit_batch_size: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ):
+        self.ai_service = ai_service or get_ai_scoring_service()
+        self.concurrency = max(1, concurrency or settings.SCORING_CONCURRENCY)
+        self.min_interval = (
+            settings.SCORING_MIN_INTERVAL_SECONDS if min_interval is None else min_interval
+        )
+        self.commit_batch_size = max(1, commit_batch_size or settings.SCORING_COMMIT_BATCH_SIZE)
+        self.batch_size = max(1, batch_size or settings.SCORING_BATCH_SIZE)
+
+    async def _score_one(
+        self,
+        prediction_id: int,
+        scoring_data: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        pacer: _Pacer
+    ) -> List[ScoringItemResult]:
+        async with semaphore:
+            await pacer.wait()
+            started = time.perf_counter()
+            try:
+                score_result = await self.ai_service.calculate_prediction_score(scoring_data)
+                return [ScoringItemResult.scored(
+                    prediction_id, score_result, (time.perf_counter() - started) * 1000
+                )]
+            except ScoringUnavailableError:
+                return [ScoringItemResult.unavailable(prediction_id, (time.perf_counter() - started) * 1000)]
+            except Exception as e:
+                print(f"Error calculating score for prediction {prediction_id}: {e}")
+                return [ScoringItemResult(
+                    prediction_id=prediction_id,
+                    success=False,
+                    error=str(e),
+                    latency_ms=(time.perf_counter() - started) * 1000
+                )]
+
+    async def _score_chunk(
+        self,
+        chunk: Dict[int, Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+        pacer: _Pacer
+    ) -> List[ScoringItemResult]:
+        """여러 예측을 하나의 배치 프롬프트로 스코어링"""
+        async with semaphore:
+            await pacer.wait()
+            started = time.perf_counter()
+            unavailable = False
+            try:
+                batch_results = await self.ai_service.calculate_batch_scores(
+                    {str(prediction_id): scoring_data for prediction_id, scoring_data in chunk.items()}
+                )
+            except ScoringUnavailableError as e:
+                batch_results = e.partial
+                unavailable = True
+            except Exception as e:
+                print(f"Error calculating batch scores for predictions {list(chunk)}: {e}")
+                batch_results = {}
+            latency_ms = (time.perf_counter() - started) * 1000
+
+        results = []
+        for prediction_id in chunk:
+            score_result = batch_results.get(str(prediction_id))
+            if score_result is None and unavailable:
+                results.append(ScoringItemResult.unavailable(prediction_id, latency_ms))
+            elif score_result is None:
+                results.append(ScoringItemResult(
+                    prediction_id=prediction_id,
+                    success=False,
+                    error="batch scoring returned no result",
+                    latency_ms=latency_ms
+                ))
+            else:
+                results.append(ScoringItemResult.scored(prediction_id, score_result, latency_ms))
+        return results
+
+    def _commit_batch(self, db: Session, batch: List[ScoringItemResult]):
+        """성공한 결과들을 한 번에 커밋, 실패 시 배치 전체를 실패로 표시"""
+        if not batch:
+            return
+        try:
+            db.add_all([item.score for item in batch])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Error committing score batch: {e}")
+            for item in batch:
+                item.success = False
+                item.score = None
+                item.total_score = None
+                item.error = f"commit failed: {e}"
+
+    async def iter_score_batches(
+        self,
+        db: Session,
+        predictions: List[PredictionEvent]
+    ) -> AsyncIterator[List[ScoringItemResult]]:
+        """
+        예측 목록을 병렬로 스코어링하면서 커밋할 때마다 그 사이에 끝난 결과 목록을 yield
+        소비하는 쪽이 중간에 멈추면 남은 AI 호출은 취소
+        임시 점수/백엔드 장애 결과는 저장하지 않고 재스코어링 대기열에 추가
+        """
+        if not predictions:
+            return
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pacer = _Pacer(self.min_interval)
+        # 독창성 인덱스가 아직 채워지는 중이면 완료 후 계산
+        await wait_novelty_index()
+        # 제안자 평판은 한 번의 쿼리로 미리 조회
+        profiles = load_creator_profiles(db, [prediction.creator_id for prediction in predictions])
+        scoring_data = [
+            (prediction.id, build_scoring_data(prediction, profiles.get(prediction.creator_id)))
+            for prediction in predictions
+        ]
+        if self.batch_size > 1:
+            tasks = [
+                asyncio.create_task(
+                    self._score_chunk(dict(scoring_data[i:i + self.batch_size]), semaphore, pacer)
+                )
+                for i in range(0, len(scoring_data), self.batch_size)
+            ]
+        else:
+            tasks = [
+                asyncio.create_task(self._score_one(prediction_id, data, semaphore, pacer))
+                for prediction_id, data in scoring_data
+            ]
+
+        pending_batch: List[ScoringItemResult] = []
+        unflushed: List[ScoringItemResult] = []
+        try:
+            for future in asyncio.as_completed(tasks):
+                chunk_results = await future
+                for item in chunk_results:
+                    unflushed.append(item)
+                    if item.success:
+                        pending_batch.append(item)
+                # 백엔드 장애로 저장하지 못한 예측은 서킷이 닫힌 뒤 다시 스코어링
+                defer_predictions(item.prediction_id for item in chunk_results if item.deferred)
+                if len(pending_batch) >= self.commit_batch_size:
+                    self._commit_batch(db, pending_batch)
+                    pending_batch = []
+                    flushed, unflushed = unflushed, []
+                    yield flushed
+
+            self._commit_batch(db, pending_batch)
+            if unflushed:
+                yield unflushed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def score_predictions(
+        self,
+        db: Session,
+        predictions: List[PredictionEvent],
+        on_flush: Optional[Callable[[List[ScoringItemResult]], None]] = None
+    ) -> List[ScoringItemResult]:
+        """
+        예측 목록을 병렬로 스코어링하고 배치 단위로 저장
+        on_flush가 있으면 커밋할 때마다 그 사이에 끝난 결과 목록으로 호출 (진행률 기록용)
+        """
+        # 커밋 후에는 예측 객체가 만료되므로 입력 순서는 미리 계산
+        order = {prediction.id: index for index, prediction in enumerate(predictions)}
+        results: List[ScoringItemResult] = []
+        async for batch in self.iter_score_batches(db, predictions):
+            results.extend(batch)
+            if on_flush:
+                on_flush(batch)
+
+        # 입력 순서대로 정렬하여 반환
+        results.sort(key=lambda item: order[item.prediction_id])
+        return results
+
+
+def select_best_prediction(
+    db: Session,
+    candidates: Sequence[ScoringCandidate],
+    results: List[ScoringItemResult],
+    top_k: int = 1
+) -> Dict[str, Any]:
+    """
+    후보 중 총점 상위 top_k개 예측을 승인하고 나머지 후보는 점수와 함께 삭제
+    선택과 정리는 후보 수와 무관하게 몇 개의 집합 단위 SQL로 한 트랜잭션에서 처리
+    candidates는 스코어링 커밋 전에 snapshot_candidates()로 복사한 값 (또는 load_candidates())
+    """
+    predictions_by_id = {prediction.id: prediction for prediction in candidates}
+    candidate_ids = list(predictions_by_id)
+    calculated_scores = [
+        {
+            'prediction_id': item.prediction_id,
+            'game_id': predictions_by_id[item.prediction_id].game_id,
+            'prediction': predictions_by_id[item.prediction_id].prediction,
+            'total_score': item.total_score
+        }
+        for item in results if item.success
+    ]
+    failed_predictions = [
+        {'prediction_id': item.prediction_id, 'error': item.error}
+        for item in results if not item.success
+    ]
+    
+    # 총점 상위 top_k개 조회 (동점이면 먼저 제안된 예측 우선)
+    winners = db.query(PredictionScore.prediction_id, PredictionScore.total_score).filter(
+        PredictionScore.prediction_id.in_(candidate_ids)
+    ).order_by(
+        PredictionScore.total_score.desc(),
+        PredictionScore.prediction_id
+    ).limit(max(1, top_k)).all()
+    
+    if not winners:
+        return {
+            "message": "Batch scoring completed but no prediction was selected",
+            "selected_prediction": None,
+            "selected_predictions": [],
+            "calculated_scores": calculated_scores,
+            "failed_predictions": failed_predictions
+        }
+    
+    winner_scores = dict(winners)
+    # 점수가 저장되지 않은 후보(실패/재스코어링 대기)는 비교 대상이 아니므로 pending으로 남김
+    scored_ids = {
+        prediction_id for (prediction_id,) in db.query(PredictionScore.prediction_id).filter(
+            PredictionScore.prediction_id.in_(candidate_ids)
+        ).all()
+    }
+    loser_ids = [
+        prediction_id for prediction_id in candidate_ids
+        if prediction_id in scored_ids and prediction_id not in winner_scores
+    ]
+    
+    try:
+        # 상위 예측 승인
+        db.query(PredictionEvent).filter(
+            PredictionEvent.id.in_(list(winner_scores))
+        ).update({PredictionEvent.status: "approved"}, synchronize_session=False)
+        
+        # 제안자 평판 집계 반영 (선택되지 않아 삭제되는 예측은 거절로 집계)
+        record_status_changes(db, [
+            (predictions_by_id[prediction_id].creator_id, predictions_by_id[prediction_id].status,
+             "approved" if prediction_id in winner_scores else "rejected")
+            for prediction_id in list(winner_scores) + loser_ids
+        ])
+        
+        # 나머지 후보 예측과 점수 일괄 삭제 (거절 이력은 discarded_predictions에 보존)
+        if loser_ids:
+            record_discarded_predictions(db, [
+                (prediction_id, predictions_by_id[prediction_id].creator_id) for prediction_id in loser_ids
+            ])
+            db.query(PredictionScore).filter(
+                PredictionScore.prediction_id.in_(loser_ids)
+            ).delete(synchronize_session=False)
+            db.query(PredictionEvent).filter(
+                PredictionEvent.id.in_(loser_ids)
+            ).delete(synchronize_session=False)
+        
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    
+    novelty_index = get_novelty_index()
+    pool_odds = get_pool_odds()
+    for prediction_id in loser_ids:
+        novelty_index.remove(prediction_id)
+        pool_odds.remove(prediction_id)
+    
+    selected_rows = {
+        prediction.id: prediction
+        for prediction in db.query(PredictionEvent).filter(
+            PredictionEvent.id.in_(list(winner_scores))
+        ).all()
+    }
+    expiry_scheduler = get_expiry_scheduler()
+    for prediction in selected_rows.values():
+        expiry_scheduler.schedule(prediction.id, prediction.expires_at)
+    publish_status(selected_rows, "approved")
+    selected_predictions = [
+        {
+            "id": prediction.id,
+            "game_id": prediction.game_id,
+            "prediction": prediction.prediction,
+            "option_a": prediction.option_a,
+            "option_b": prediction.option_b,
+            "deadline": prediction.deadline,
+            "expires_at": prediction.expires_at,
+            "user_address": prediction.user_address,
+            "total_score": winner_scores[prediction_id],
+            "status": "approved"
+        }
+        for prediction_id in winner_scores
+        for prediction in [selected_rows.get(prediction_id)] if prediction is not None
+    ]
+    best_score = winners[0][1]
+    deleted_count = len(loser_ids)
+    
+    return {
+        "message": f"Batch scoring completed. Selected prediction with highest score: {best_score:.2f}. Deleted {deleted_count} other pending predictions.",
+        "selected_prediction": selected_predictions[0] if selected_predictions else None,
+        "selected_predictions": selected_predictions,
+        "deleted_count": deleted_count,
+        "calculated_scores": calculated_scores,
+        "failed_predictions": failed_predictions
+    }
@@ -0,0 +1,403 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.database import (
+    SessionLocal,
+    PredictionEvent,
+    PredictionScore,
+    ScoringJob,
+    ScoringJobItem
+)
+from app.services.circuit_breaker import OPEN, defer_predictions, get_circuit_breaker, take_deferred_predictions
+from app.services.scoring_engine import (
+    ScoringEngine,
+    ScoringItemResult,
+    load_candidates,
+    select_best_prediction
+)
+
+JOB_TYPES = ("batch_calculate", "batch_calculate_and_select")
+# 재스코어링 대기열 처리용 작업 (작업 행 하나를 계속 재사용)
+RETRY_JOB_TYPE = "retry_deferred"
+
+
+def unscored_prediction_ids(db: Session, prediction_ids: Optional[List[int]] = None) -> List[int]:
+    """스코어링되지 않은 예측 ID 목록 (prediction_ids가 있으면 그 안에서만)"""
+    query = db.query(PredictionEvent.id).filter(
+        ~PredictionEvent.id.in_(
+            db.query(PredictionScore.prediction_id)
+        )
+    )
+    if prediction_ids is not None:
+        query = query.filter(PredictionEvent.id.in_(prediction_ids))
+    return [prediction_id for (prediction_id,) in query.order_by(PredictionEvent.id).all()]
+
+
+def create_scoring_job(
+    db: Session,
+    job_type: str,
+    params: Dict[str, Any],
+    user_id: Optional[int] = None,
+    prediction_ids: Optional[List[int]] = None
+) -> ScoringJob:
+    """스코어링되지 않은 예측들(prediction_ids가 있으면 그중 미스코어링 예측)로 작업과 작업 항목 생성"""
+    unscored_ids = unscored_prediction_ids(db, prediction_ids)
+
+    job = ScoringJob(
+        job_type=job_type,
+        status="queued",
+        params=params,
+        total=len(unscored_ids),
+        created_by=user_id
+    )
+    db.add(job)
+    db.flush()
+    db.add_all([
+        ScoringJobItem(job_id=job.id, prediction_id=prediction_id, status="pending")
+        for prediction_id in unscored_ids
+    ])
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def queue_retry_job(db: Session, prediction_ids: List[int]) -> Optional[ScoringJob]:
+    """
+    재스코어링 대기열의 예측을 재스코어링 작업에 넣고 반환 (넣을 예측이 없으면 None)
+    - 이미 스코어링되었거나 대기/실행 중인 작업에 pending 항목으로 있는 예측은 제외
+    - 작업 행은 RETRY_JOB_TYPE 하나를 재사용하여 장애가 길어져도 작업이 계속 늘어나지 않음
+    - 그 작업이 실행 중이면 예측을 대기열에 되돌리고 다음 주기에 처리
+    """
+    unscored_ids = unscored_prediction_ids(db, prediction_ids)
+    covered = {
+        prediction_id for (prediction_id,) in db.query(ScoringJobItem.prediction_id).join(
+            ScoringJob, ScoringJob.id == ScoringJobItem.job_id
+        ).filter(
+            ScoringJob.status.in_(["queued", "running"]),
+            ScoringJobItem.status == "pending",
+            ScoringJobItem.prediction_id.in_(unscored_ids)
+        ).all()
+    }
+    retry_ids = [prediction_id for prediction_id in unscored_ids if prediction_id not in covered]
+    if not retry_ids:
+        return None
+
+    job = db.query(ScoringJob).filter(ScoringJob.job_type == RETRY_JOB_TYPE).order_by(ScoringJob.id.desc()).first()
+    if job is not None and job.status == "running":
+        defer_predictions(retry_ids)
+        return None
+    if job is None:
+        job = ScoringJob(job_type=RETRY_JOB_TYPE, params={})
+        db.add(job)
+        db.flush()
+
+    existing_items = dict(
+        db.query(ScoringJobItem.prediction_id, ScoringJobItem.id).filter(
+            ScoringJobItem.job_id == job.id,
+            ScoringJobItem.prediction_id.in_(retry_ids)
+        ).all()
+    )
+    if existing_items:
+        db.execute(update(ScoringJobItem), [
+            {"id": item_id, "status": "pending", "total_score": None, "error": None, "latency_ms": None}
+            for item_id in existing_items.values()
+        ])
+    db.add_all([
+        ScoringJobItem(job_id=job.id, prediction_id=prediction_id, status="pending")
+        for prediction_id in retry_ids if prediction_id not in existing_items
+    ])
+    job.status = "queued"
+    job.error = None
+    job.result = None
+    job.finished_at = None
+    db.flush()
+    _refresh_counters(db, job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def reset_failed_items(db: Session, job: ScoringJob):
+    """실패 항목을 다시 pending으로 돌리고 작업을 대기 상태로 전환"""
+    db.query(ScoringJobItem).filter(
+        ScoringJobItem.job_id == job.id,
+        ScoringJobItem.status == "failed"
+    ).update({"status": "pending", "error": None}, synchronize_session=False)
+    job.status = "queued"
+    job.error = None
+    job.finished_at = None
+    _refresh_counters(db, job)
+    db.commit()
+    db.refresh(job)
+
+
+def _refresh_counters(db: Session, job: ScoringJob):
+    """작업 항목 상태별 개수로 진행률 갱신"""
+    counts = dict(
+        db.query(ScoringJobItem.status, func.count(ScoringJobItem.id)).filter(
+            ScoringJobItem.job_id == job.id
+        ).group_by(ScoringJobItem.status).all()
+    )
+    job.succeeded = counts.get("succeeded", 0)
+    job.failed = counts.get("failed", 0)
+    job.processed = job.succeeded + job.failed
+    job.total = job.processed + counts.get("pending", 0)
+
+
+class _ClaimLost(Exception):
+    """진행 기록이 오래되어 다른 워커가 작업을 이어받은 경우"""
+
+
+def claim_job(db: Session, job_id: int, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    작업을 이 워커가 맡도록 한 번의 조건부 UPDATE로 선점하고 heartbeat 시각 반환 (실패 시 None)
+    queued 작업이나 heartbeat가 SCORING_JOB_STALE_SECONDS보다 오래된 running 작업만 선점 가능
+    """
+    now = now or datetime.utcnow()
+    stale_before = now - timedelta(seconds=settings.SCORING_JOB_STALE_SECONDS)
+    claimed = db.query(ScoringJob).filter(
+        ScoringJob.id == job_id,
+        or_(
+            ScoringJob.status == "queued",
+            and_(
+                ScoringJob.status == "running",
+                or_(ScoringJob.heartbeat_at.is_(None), ScoringJob.heartbeat_at < stale_before)
+            )
+        )
+    ).update({
+        ScoringJob.status: "running",
+        ScoringJob.heartbeat_at: now,
+        ScoringJob.started_at: func.coalesce(ScoringJob.started_at, now)
+    }, synchronize_session=False)
+    db.commit()
+    return now if claimed else None
+
+
+def _heartbeat(db: Session, job_id: int, last_heartbeat: datetime) -> datetime:
+    """진행 기록 갱신 (호출한 쪽에서 커밋), 그 사이 다른 워커가 이어받았으면 _ClaimLost"""
+    now = datetime.utcnow()
+    updated = db.query(ScoringJob).filter(
+        ScoringJob.id == job_id,
+        ScoringJob.heartbeat_at == last_heartbeat
+    ).update({ScoringJob.heartbeat_at: now}, synchronize_session=False)
+    if not updated:
+        raise _ClaimLost()
+    return now
+
+
+class ScoringJobWorker:
+    """
+    DB 기반 프로세스 내 스코어링 작업 워커
+    - 작업은 큐 순서대로 하나씩 처리 (작업 내부는 ScoringEngine으로 병렬 처리)
+    - 진행 상황은 커밋 배치마다 scoring_job_items에 기록
+    - 시작 시 queued/running 상태로 남은 작업을 이어서 처리
+    - 작업은 claim_job으로 선점한 워커만 처리 (여러 프로세스/재시작 중 중복 처리 방지)
+    - 백엔드 장애로 재스코어링 대기열에 들어간 예측은 서킷이 열려 있지 않을 때 새 작업으로 처리
+    """
+
+    def __init__(self):
+        self._queue: "asyncio.Queue[int]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._retry_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        self._retry_task = asyncio.create_task(self._retry_deferred())
+
+        # 재시작 전 끝나지 않은 작업 재개
+        db = SessionLocal()
+        try:
+            unfinished_ids = [
+                job_id for (job_id,) in db.query(ScoringJob.id).filter(
+                    ScoringJob.status.in_(["queued", "running"])
+                ).order_by(ScoringJob.id).all()
+            ]
+        finally:
+            db.close()
+        for job_id in unfinished_ids:
+            self.submit(job_id)
+
+    async def stop(self):
+        if self._task is None:
+            return
+        for task in (self._task, self._retry_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._retry_task = None
+
+    def submit(self, job_id: int):
+        self._queue.put_nowait(job_id)
+
+    async def _run(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Scoring job {job_id} failed: {e}")
+                self._mark_failed(job_id, str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _retry_deferred(self):
+        while True:
+            await asyncio.sleep(max(1.0, settings.SCORING_CIRCUIT_RECOVERY_SECONDS))
+            if get_circuit_breaker().state == OPEN:
+                continue
+            deferred_ids = take_deferred_predictions()
+            if not deferred_ids:
+                continue
+            db = SessionLocal()
+            try:
+                job = queue_retry_job(db, deferred_ids)
+            finally:
+                db.close()
+            if job is None:
+                continue
+            print(f"재스코어링 대기열의 예측을 스코어링 작업 {job.id}에 넣었습니다. (대기 {job.total - job.processed}개)")
+            self.submit(job.id)
+
+    def _mark_failed(self, job_id: int, error: str):
+        db = SessionLocal()
+        try:
+            job = db.get(ScoringJob, job_id)
+            if job is not None:
+                job.status = "failed"
+                job.error = error
+                job.finished_at = datetime.utcnow()
+                db.commit()
+        finally:
+            db.close()
+
+    async def _process(self, job_id: int):
+        db = SessionLocal()
+        try:
+            heartbeat = claim_job(db, job_id)
+            if heartbeat is None:
+                # 이미 끝났거나 다른 워커가 처리 중인 작업
+                return
+            job = db.get(ScoringJob, job_id)
+
+            pending_items = db.query(ScoringJobItem.id, ScoringJobItem.prediction_id).filter(
+                ScoringJobItem.job_id == job_id,
+                ScoringJobItem.status == "pending"
+            ).all()
+            item_ids = {prediction_id: item_id for item_id, prediction_id in pending_items}
+
+            # 중단 전에 점수는 저장됐지만 항목 상태가 기록되지 않은 경우 정리
+            already_scored = dict(
+                db.query(PredictionScore.prediction_id, PredictionScore.total_score).filter(
+                    PredictionScore.prediction_id.in_(list(item_ids))
+                ).all()
+            )
+            predictions = db.query(PredictionEvent).filter(
+                PredictionEvent.id.in_([pid for pid in item_ids if pid not in already_scored])
+            ).order_by(PredictionEvent.id).all()
+            existing_ids = {prediction.id for prediction in predictions}
+
+            recovered = [
+                {"id": item_ids[pid], "status": "succeeded", "total_score": total_score}
+                for pid, total_score in already_scored.items()
+            ] + [
+                {"id": item_ids[pid], "status": "failed", "error": "prediction not found"}
+                for pid in item_ids
+                if pid not in already_scored and pid not in existing_ids
+            ]
+            if recovered:
+                db.execute(update(ScoringJobItem), recovered)
+            _refresh_counters(db, job)
+            db.commit()
+
+            def on_flush(batch: List[ScoringItemResult]):
+                nonlocal heartbeat
+                heartbeat = _heartbeat(db, job_id, heartbeat)
+                db.execute(update(ScoringJobItem), [
+                    {
+                        "id": item_ids[item.prediction_id],
+                        "status": "succeeded" if item.success else "failed",
+                        "total_score": item.total_score if item.success else None,
+                        "error": item.error,
+                        "latency_ms": round(item.latency_ms, 1)
+                    }
+                    for item in batch
+                ])
+                _refresh_counters(db, job)
+                db.commit()
+
+            params = job.params or {}
+            scoring_engine = ScoringEngine(
+                concurrency=params.get("concurrency"),
+                batch_size=params.get("batch_size")
+            )
+            await scoring_engine.score_predictions(db, predictions, on_flush=on_flush)
+
+            # 자동 선택(예측 삭제)은 작업을 여전히 맡고 있을 때만 실행
+            heartbeat = _heartbeat(db, job_id, heartbeat)
+            db.commit()
+            if job.job_type == "batch_calculate_and_select":
+                job.result = jsonable_encoder(self._select_best(db, job))
+
+            _refresh_counters(db, job)
+            job.status = "completed"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+        except _ClaimLost:
+            db.rollback()
+            print(f"Scoring job {job_id} was taken over by another worker")
+        finally:
+            db.close()
+
+    def _select_best(self, db: Session, job: ScoringJob) -> Dict[str, Any]:
+        """작업 전체 결과(재시작 이전 포함)를 기준으로 최고 점수 예측 자동 선택"""
+        items = db.query(ScoringJobItem).filter(ScoringJobItem.job_id == job.id).all()
+        candidates = load_candidates(db, [item.prediction_id for item in items])
+        existing_ids = {candidate.id for candidate in candidates}
+        results = [
+            ScoringItemResult(
+                prediction_id=item.prediction_id,
+                success=item.status == "succeeded",
+                total_score=item.total_score,
+                error=item.error
+            )
+            for item in items if item.prediction_id in existing_ids
+        ]
+        top_k = (job.params or {}).get("top_k") or 1
+        return select_best_prediction(db, candidates, results, top_k=top_k)
+
+
+_scoring_worker: Optional[ScoringJobWorker] = None
+
+
+def get_scoring_worker() -> ScoringJobWorker:
+    """앱 전체에서 공유하는 스코어링 작업 워커 반환"""
+    global _scoring_worker
+    if _scoring_worker is None:
+        _scoring_worker = ScoringJobWorker()
+    return _scoring_worker
+
+
+async def start_scoring_worker():
+    """워커 시작 (앱 시작 시)"""
+    await get_scoring_worker().start()
+
+
+async def stop_scoring_worker():
+    """워커 종료 (앱 종료 시)"""
+    global _scoring_worker
+    if _scoring_worker is not None:
+        await _scoring_worker.stop()
+        _scoring_worker = None
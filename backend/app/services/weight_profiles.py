@@ -0,0 +1,176 @@
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.database import SessionLocal, PredictionScore, ScoringWeightProfile
+
+CATEGORIES = ("quality", "demand", "reputation", "novelty", "economic")
+
+# 프로필이 하나도 없을 때 생성하는 기본 가중치 (품질 35%, 수요 25%, 평판 20%, 독창성 10%, 경제성 10%)
+DEFAULT_PROFILE_NAME = "default"
+DEFAULT_WEIGHTS = {"quality": 0.35, "demand": 0.25, "reputation": 0.20, "novelty": 0.10, "economic": 0.10}
+
+# 프로세스별 캐시, SCORING_WEIGHTS_TTL_SECONDS가 지나면 DB에서 다시 읽음 (다른 워커의 활성화 반영)
+_active_weights: Optional[Dict[str, float]] = None
+_loaded_at = 0.0
+_lock = threading.Lock()
+
+
+def normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
+    """카테고리별 가중치 검증 후 합이 1이 되도록 정규화"""
+    missing = [category for category in CATEGORIES if category not in weights]
+    if missing:
+        raise ValueError(f"가중치가 없는 카테고리: {', '.join(missing)}")
+    if any(weights[category] < 0 for category in CATEGORIES):
+        raise ValueError("가중치는 0 이상이어야 합니다")
+    total = sum(weights[category] for category in CATEGORIES)
+    if total <= 0:
+        raise ValueError("가중치 합은 0보다 커야 합니다")
+    return {category: weights[category] / total for category in CATEGORIES}
+
+
+def profile_weights(profile: ScoringWeightProfile) -> Dict[str, float]:
+    return {category: getattr(profile, f"{category}_weight") for category in CATEGORIES}
+
+
+def weighted_total(
+    quality: float,
+    demand: float,
+    reputation: float,
+    novelty: float,
+    economic: float,
+    weights: Optional[Dict[str, float]] = None
+) -> float:
+    """카테고리 점수 가중합 (weights가 없으면 활성 프로필 사용)"""
+    weights = weights or get_active_weights()
+    return (
+        quality * weights["quality"]
+        + demand * weights["demand"]
+        + reputation * weights["reputation"]
+        + novelty * weights["novelty"]
+        + economic * weights["economic"]
+    )
+
+
+def total_score_expression(weights: Dict[str, float]):
+    """저장된 카테고리 점수로 총점을 계산하는 SQL 식"""
+    return func.round(
+        sum(
+            func.coalesce(getattr(PredictionScore, f"{category}_score"), 0) * weights[category]
+            for category in CATEGORIES
+        ),
+        2
+    )
+
+
+def _ensure_active_profile(db: Session) -> ScoringWeightProfile:
+    """활성 프로필 조회, 없으면 기본 프로필을 만들어 활성화"""
+    profile = db.query(ScoringWeightProfile).filter(ScoringWeightProfile.is_active.is_(True)).first()
+    if profile is None:
+        profile = ScoringWeightProfile(
+            name=DEFAULT_PROFILE_NAME,
+            version=1,
+            description="기본 가중치",
+            is_active=True,
+            activated_at=datetime.utcnow(),
+            **{f"{category}_weight": weight for category, weight in DEFAULT_WEIGHTS.items()}
+        )
+        db.add(profile)
+        db.commit()
+        db.refresh(profile)
+    return profile
+
+
+def load_active_weights() -> Dict[str, float]:
+    """DB의 활성 프로필 가중치를 다시 읽어 캐시 (앱 시작 시, TTL 만료 시)"""
+    global _active_weights, _loaded_at
+    db = SessionLocal()
+    try:
+        weights = profile_weights(_ensure_active_profile(db))
+    finally:
+        db.close()
+    with _lock:
+        _active_weights = weights
+        _loaded_at = time.monotonic()
+    return weights
+
+
+def get_active_weights() -> Dict[str, float]:
+    """현재 활성 가중치 반환 (최초 호출 시, 캐시가 오래되면 DB에서 조회)"""
+    if _active_weights is None or time.monotonic() - _loaded_at > settings.SCORING_WEIGHTS_TTL_SECONDS:
+        return load_active_weights()
+    return _active_weights
+
+
+def create_weight_profile(
+    db: Session,
+    name: str,
+    weights: Dict[str, float],
+    description: Optional[str] = None,
+    created_by: Optional[int] = None
+) -> ScoringWeightProfile:
+    """같은 이름의 마지막 버전 다음 버전으로 프로필 생성 (활성화는 별도)"""
+    weights = normalize_weights(weights)
+    latest_version = db.query(func.max(ScoringWeightProfile.version)).filter(
+        ScoringWeightProfile.name == name
+    ).scalar() or 0
+    profile = ScoringWeightProfile(
+        name=name,
+        version=latest_version + 1,
+        description=description,
+        created_by=created_by,
+        **{f"{category}_weight": weight for category, weight in weights.items()}
+    )
+    db.add(profile)
+    db.commit()
+    db.refresh(profile)
+    return profile
+
+
+def rerank_scores(db: Session, weights: Dict[str, float]) -> int:
+    """모든 prediction_scores의 total_score를 한 번의 UPDATE로 재계산 (커밋은 호출한 쪽에서)"""
+    return db.query(PredictionScore).update(
+        {PredictionScore.total_score: total_score_expression(weights)},
+        synchronize_session=False
+    )
+
+
+def activate_weight_profile(db: Session, profile: ScoringWeightProfile) -> int:
+    """프로필을 활성화하고 저장된 전체 점수의 총점을 재계산, 갱신된 행 수 반환"""
+    global _active_weights, _loaded_at
+    weights = profile_weights(profile)
+    try:
+        db.query(ScoringWeightProfile).filter(
+            ScoringWeightProfile.id != profile.id,
+            ScoringWeightProfile.is_active.is_(True)
+        ).update({ScoringWeightProfile.is_active: False}, synchronize_session=False)
+        profile.is_active = True
+        profile.activated_at = datetime.utcnow()
+        updated = rerank_scores(db, weights)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    with _lock:
+        _active_weights = weights
+        _loaded_at = time.monotonic()
+    return updated
+
+
+def preview_rerank(db: Session, weights: Dict[str, float], limit: int = 20) -> List[Dict[str, Any]]:
+    """저장하지 않고 새 가중치 기준 상위 limit개와 현재 총점 비교"""
+    new_total = total_score_expression(weights).label("new_total_score")
+    rows = db.query(
+        PredictionScore.prediction_id,
+        PredictionScore.total_score,
+        new_total
+    ).order_by(new_total.desc(), PredictionScore.prediction_id).limit(limit).all()
+    return [
+        {"prediction_id": prediction_id, "total_score": total_score, "new_total_score": new_total_score}
+        for prediction_id, total_score, new_total_score in rows
+    ]
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Gemini 스텁 서버를 상대로 AI 스코어링 처리량을 측정하는 벤치마크 스크립트
+
+- 단건(single), 배치(batch), 스트리밍(stream) 세 가지 방식으로 같은 예측들을 스코어링
+- 처리량, 지연 시간(p50/p95/p99), 첫 결과까지 걸린 시간, 대체(더미) 점수 비율을 출력
+- --stub-url을 지정하지 않으면 gemini_stub.py 서버를 프로세스 안에서 띄워 사용
+- 임시 디렉터리의 별도 SQLite DB를 사용하므로 실제 데이터에는 영향 없음
+
+사용 예:
+    python benchmark_scoring.py --predictions 200 --latency-ms 800 --error-rates 429=0.05,503=0.02
+    python benchmark_scoring.py --mode replay --cassette cassettes/gemini.jsonl
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+
+from gemini_stub import add_stub_arguments, config_from_args, serve_in_thread
+
+SCENARIOS = ("single", "batch", "stream")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="AI 스코어링 처리량 벤치마크 (Gemini 스텁 서버 사용)")
+    parser.add_argument("--stub-url", default=None, help="이미 실행 중인 스텁 서버의 /v1beta URL")
+    parser.add_argument("--predictions", type=int, default=100, help="스코어링할 예측 수")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="실행할 시나리오 (single,batch,stream)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--rpm", type=int, default=100000, help="Gemini rate limiter RPM (스텁이므로 기본값은 사실상 무제한)")
+    parser.add_argument("--max-retries", type=int, default=2)
+    parser.add_argument("--workdir", default=None, help="벤치마크용 SQLite DB를 만들 디렉터리 (기본: 임시 디렉터리)")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+    args.scenarios = scenarios
+    if args.mode in ("record", "replay") and not args.cassette:
+        parser.error("record/replay 모드에는 --cassette가 필요합니다")
+    return args
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def seed_predictions(count):
+    """벤치마크용 사용자와 예측 생성"""
+    from app.models.database import SessionLocal, create_tables, User, PredictionEvent
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        if db.query(PredictionEvent).count() >= count:
+            return
+        user = db.query(User).filter(User.username == "benchmark").first()
+        if user is None:
+            user = User(username="benchmark", email="benchmark@example.com", hashed_password="-")
+            db.add(user)
+            db.flush()
+        teams = ["Tottenham", "Arsenal", "Chelsea", "Liverpool", "Man City", "PSG", "Bayern", "Napoli"]
+        db.add_all([
+            PredictionEvent(
+                game_id=f"BENCH-{i // 4}",
+                prediction=f"{teams[i % len(teams)]} will win match {i} by two or more goals",
+                option_a="Yes",
+                option_b="No",
+                duration=24,
+                creator_id=user.id,
+                status="pending"
+            )
+            for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_scenario(name, args):
+    """시나리오 하나 실행 후 결과 지표 반환 (실행 전 기존 점수 삭제)"""
+    from app.models.database import SessionLocal, PredictionEvent, PredictionScore
+    from app.services.scoring_engine import ScoringEngine
+
+    db = SessionLocal()
+    try:
+        db.query(PredictionScore).delete()
+        db.commit()
+        predictions = db.query(PredictionEvent).order_by(PredictionEvent.id).all()
+
+        batch_size = 1 if name == "single" else args.batch_size
+        scoring_engine = ScoringEngine(
+            concurrency=args.concurrency,
+            batch_size=batch_size,
+            min_interval=0.0,
+            commit_batch_size=batch_size if name == "stream" else None
+        )
+
+        started = time.perf_counter()
+        first_result = None
+        results = []
+        async for batch in scoring_engine.iter_score_batches(db, predictions):
+            if first_result is None:
+                first_result = time.perf_counter() - started
+            results.extend(batch)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    latencies = sorted(item.latency_ms for item in results)
+    # 임시(대체) 점수는 저장되지 않으므로 실패에 포함됨
+    failed = sum(1 for item in results if not item.success)
+    return {
+        "scenario": name,
+        "items": len(results),
+        "elapsed": elapsed,
+        "throughput": len(results) / elapsed if elapsed else 0.0,
+        "first_result": first_result or 0.0,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "fallback_rate": failed / len(results) if results else 0.0,
+        "failed": failed
+    }
+
+
+async def run_benchmark(args, stub_url):
+    from app.services.http_client import close_http_client
+
+    stats_url = stub_url.rsplit("/v1beta", 1)[0] + "/stats"
+    rows = []
+    try:
+        async with httpx.AsyncClient() as stub_client:
+            for name in args.scenarios:
+                await stub_client.post(stats_url + "/reset")
+                row = await run_scenario(name, args)
+                row["stub"] = (await stub_client.get(stats_url)).json()
+                rows.append(row)
+                print(
+                    f"   ✅ {name}: {row['items']}건 {row['elapsed']:.1f}s, "
+                    f"스텁 요청 {row['stub'].get('requests', 0)}회"
+                )
+    finally:
+        await close_http_client()
+    return rows
+
+
+def print_report(rows):
+    print(f"\n{'시나리오':<8} {'건수':>6} {'소요(s)':>8} {'건/s':>8} {'첫결과(s)':>9} "
+          f"{'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'대체율':>7}  스텁 응답")
+    for row in rows:
+        statuses = ", ".join(
+            f"{key.replace('status_', '')}:{value}"
+            for key, value in sorted(row["stub"].items())
+            if key.startswith("status_") or key == "malformed"
+        )
+        print(
+            f"{row['scenario']:<10} {row['items']:>6} {row['elapsed']:>8.2f} {row['throughput']:>8.2f} "
+            f"{row['first_result']:>9.2f} {row['p50']:>9.0f} {row['p95']:>9.0f} {row['p99']:>9.0f} "
+            f"{row['fallback_rate']:>7.1%}  {statuses}"
+        )
+
+
+def main():
+    args = parse_args()
+
+    server = None
+    stub_url = args.stub_url
+    if not stub_url:
+        server, stub_url = serve_in_thread(config_from_args(args))
+
+    # app 모듈을 불러오기 전에 설정과 DB 위치 지정 (DB는 현재 디렉터리에 생성됨)
+    os.environ.update({
+        "GEMINI_API_BASE_URL": stub_url,
+        # record 모드에서는 실제 API 키가 그대로 전달되어야 함
+        "GEMINI_API_KEY": os.getenv("GEMINI_API_KEY", "stub-key"),
+        "GEMINI_REQUESTS_PER_MINUTE": str(args.rpm),
+        "GEMINI_MAX_RETRIES": str(args.max_retries),
+        "SCORE_CACHE_BACKEND": "none",
+    })
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(args.workdir or tempfile.mkdtemp(prefix="scoring-benchmark-"))
+
+    print(f"🚀 예측 {args.predictions}개로 스코어링 벤치마크를 시작합니다. (스텁: {stub_url})")
+    seed_predictions(args.predictions)
+    rows = asyncio.run(run_benchmark(args, stub_url))
+    print_report(rows)
+
+    if server is not None:
+        server.should_exit = True
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,100 +1,164 @@
 #!/usr/bin/env python3
 """
-모든 예측 이벤트에 대해 AI 점수를 계산하는 스크립트
+점수가 없는 모든 예측 이벤트에 대해 AI 점수를 계산하는 스크립트
+
+- 점수가 없는 예측 ID만 한 번에 조회하여 처리
+- 여러 워커가 하나의 HTTP 세션(커넥션 풀)을 공유하여 병렬 요청
+- 완료한 ID를 체크포인트 파일에 기록하여 중단 후 재실행 시 이어서 처리
+
+사용 예:
+    ADMIN_PASSWORD=... python calculate_all_scores.py --workers 8
 """
 
-import requests
-import json
+import argparse
+import getpass
+import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import httpx
+
 
-def login():
+def parse_args():
+    parser = argparse.ArgumentParser(description="점수가 없는 예측 이벤트의 AI 점수 일괄 계산")
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL", "http://localhost:8000/api/v1"))
+    parser.add_argument("--username", default=os.getenv("ADMIN_USERNAME", "admin"))
+    parser.add_argument("--password", default=os.getenv("ADMIN_PASSWORD"), help="미지정 시 ADMIN_PASSWORD 또는 입력 프롬프트 사용")
+    parser.add_argument("--token", default=os.getenv("ADMIN_TOKEN"), help="로그인 대신 사용할 액세스 토큰")
+    parser.add_argument("--workers", type=int, default=4, help="동시 요청 수")
+    parser.add_argument("--checkpoint", default="calculate_all_scores.checkpoint", help="완료한 예측 ID 기록 파일")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 개수")
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청당 타임아웃(초)")
+    return parser.parse_args()
+
+
+def login(client, username, password):
     """관리자로 로그인하여 토큰 획득"""
-    login_url = "http://localhost:8000/api/v1/auth/login"
-    login_data = {
-        "username": "admin",
-        "password": "admin123"
-    }
-    
-    response = requests.post(login_url, data=login_data)
+    response = client.post("/auth/login", data={"username": username, "password": password})
     if response.status_code == 200:
-        token_data = response.json()
-        return token_data["access_token"]
-    else:
-        print(f"로그인 실패: {response.status_code}")
-        return None
-
-def get_predictions(token):
-    """모든 예측 이벤트 조회"""
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
-    response = requests.get("http://localhost:8000/api/v1/predictions/", headers=headers)
+        return response.json()["access_token"]
+    print(f"로그인 실패: {response.status_code}")
+    return None
+
+
+def get_unscored_ids(client):
+    """점수가 없는 예측 ID 목록 조회 (서버에서 한 번의 쿼리로 계산)"""
+    response = client.get("/scoring/unscored")
     if response.status_code == 200:
         return response.json()
-    else:
-        print(f"예측 이벤트 조회 실패: {response.status_code}")
-        return []
-
-def calculate_score(token, prediction_id):
-    """특정 예측 이벤트에 대해 AI 점수 계산"""
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
-    response = requests.post(f"http://localhost:8000/api/v1/scoring/calculate/{prediction_id}", headers=headers)
+    print(f"예측 ID 조회 실패: {response.status_code}")
+    return None
+
+
+def load_checkpoint(path):
+    """체크포인트 파일에서 완료한 예측 ID 읽기"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {int(line) for line in f if line.strip().isdigit()}
+
+
+def calculate_score(client, prediction_id):
+    """특정 예측 이벤트에 대해 AI 점수 계산, (상태, 총점 또는 오류, 소요시간) 반환"""
+    started = time.perf_counter()
+    try:
+        response = client.post(f"/scoring/calculate/{prediction_id}")
+    except httpx.HTTPError as e:
+        return "failed", repr(e), time.perf_counter() - started
+    elapsed = time.perf_counter() - started
+
     if response.status_code == 200:
-        score_data = response.json()
-        return score_data
-    else:
-        print(f"점수 계산 실패 - 예측 ID {prediction_id}: {response.status_code}")
-        if response.status_code == 400:
-            error_data = response.json()
-            print(f"오류 메시지: {error_data.get('detail', '알 수 없는 오류')}")
-        return None
+        return "scored", response.json()["total_score"], elapsed
+    if response.status_code == 400:
+        # 다른 실행에서 이미 계산된 경우
+        return "skipped", response.json().get("detail", ""), elapsed
+    return "failed", f"HTTP {response.status_code}", elapsed
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
 
 def main():
-    print("🚀 모든 예측 이벤트에 대해 AI 점수 계산을 시작합니다...")
-    
-    # 로그인
-    token = login()
-    if not token:
-        print("❌ 로그인에 실패했습니다.")
-        return
-    
-    print("✅ 로그인 성공")
-    
-    # 예측 이벤트 조회
-    predictions = get_predictions(token)
-    if not predictions:
-        print("❌ 예측 이벤트를 조회할 수 없습니다.")
-        return
-    
-    print(f"📊 총 {len(predictions)}개의 예측 이벤트를 발견했습니다.")
-    
-    # 각 예측 이벤트에 대해 점수 계산
-    success_count = 0
-    for prediction in predictions:
-        prediction_id = prediction["id"]
-        game_id = prediction["game_id"]
-        prediction_text = prediction["prediction"]
-        
-        print(f"\n🎯 예측 ID {prediction_id}: {game_id}")
-        print(f"   내용: {prediction_text}")
-        
-        score = calculate_score(token, prediction_id)
-        if score:
-            print(f"   ✅ 점수 계산 완료: {score['total_score']}점")
-            success_count += 1
-        else:
-            print(f"   ❌ 점수 계산 실패")
-        
-        # API 호출 간격 조절
-        time.sleep(1)
-    
-    print(f"\n🎉 완료! 총 {success_count}/{len(predictions)}개의 예측 이벤트에 대해 점수를 계산했습니다.")
+    args = parse_args()
+    print("🚀 점수가 없는 예측 이벤트에 대해 AI 점수 계산을 시작합니다...")
+
+    limits = httpx.Limits(max_connections=args.workers, max_keepalive_connections=args.workers)
+    with httpx.Client(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        # 로그인
+        token = args.token
+        if not token:
+            password = args.password or getpass.getpass(f"{args.username} 비밀번호: ")
+            token = login(client, args.username, password)
+        if not token:
+            print("❌ 로그인에 실패했습니다.")
+            return 1
+        client.headers["Authorization"] = f"Bearer {token}"
+        print("✅ 로그인 성공")
+
+        # 점수가 없는 예측 ID 조회 후 체크포인트에 있는 ID 제외
+        unscored_ids = get_unscored_ids(client)
+        if unscored_ids is None:
+            print("❌ 예측 이벤트를 조회할 수 없습니다.")
+            return 1
+        done_ids = load_checkpoint(args.checkpoint)
+        todo_ids = [prediction_id for prediction_id in unscored_ids if prediction_id not in done_ids]
+        if args.limit is not None:
+            todo_ids = todo_ids[:args.limit]
+
+        print(f"📊 점수가 없는 예측 {len(unscored_ids)}개 중 {len(todo_ids)}개를 처리합니다. (워커 {args.workers}개)")
+        if not todo_ids:
+            print("🎉 처리할 예측이 없습니다.")
+            return 0
+
+        counts = {"scored": 0, "skipped": 0, "failed": 0}
+        latencies = []
+        started = time.perf_counter()
+
+        with open(args.checkpoint, "a", encoding="utf-8") as checkpoint, \
+                ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(calculate_score, client, prediction_id): prediction_id
+                for prediction_id in todo_ids
+            }
+            try:
+                for future in as_completed(futures):
+                    prediction_id = futures[future]
+                    outcome, detail, elapsed = future.result()
+                    counts[outcome] += 1
+                    latencies.append(elapsed)
+
+                    if outcome == "scored":
+                        print(f"   ✅ 예측 ID {prediction_id}: {detail}점 ({elapsed:.2f}s)")
+                    elif outcome == "skipped":
+                        print(f"   ⏭️  예측 ID {prediction_id}: 이미 계산됨")
+                    else:
+                        print(f"   ❌ 예측 ID {prediction_id}: {detail}")
+
+                    # 성공/이미 계산된 ID만 기록 (실패는 다음 실행에서 재시도)
+                    if outcome != "failed":
+                        checkpoint.write(f"{prediction_id}\n")
+                        checkpoint.flush()
+            except KeyboardInterrupt:
+                print("\n⏸️  중단되었습니다. 다시 실행하면 체크포인트부터 이어서 처리합니다.")
+                for pending in futures:
+                    pending.cancel()
+
+        total_elapsed = time.perf_counter() - started
+        processed = sum(counts.values())
+        latencies.sort()
+
+    print(f"\n🎉 완료! 계산 {counts['scored']}개, 건너뜀 {counts['skipped']}개, 실패 {counts['failed']}개")
+    print(
+        f"⏱️  {processed}건 / {total_elapsed:.1f}s = {processed / total_elapsed if total_elapsed else 0:.2f} req/s, "
+        f"p50 {percentile(latencies, 0.50):.2f}s, p95 {percentile(latencies, 0.95):.2f}s"
+    )
+    return 0 if counts["failed"] == 0 else 2
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
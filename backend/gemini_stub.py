@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Gemini generateContent API 로컬 스텁 서버
+
+실제 API 키/할당량 없이 AI 스코어링을 부하 테스트하기 위한 서버
+- synth: 프롬프트에서 예측 id를 읽어 형식에 맞는 점수 JSON을 생성 (기본)
+- record: 실제 Gemini API로 전달하고 응답을 카세트 파일에 기록
+- replay: 카세트 파일에 기록된 응답을 그대로 재생
+- 지연 시간 분포(로그정규), 오류 비율(400/403/429/5xx), 잘못된 JSON 응답 비율 설정 가능
+
+사용 예:
+    python gemini_stub.py --port 8090 --latency-ms 800 --error-rates 429=0.05,503=0.02 --malformed-rate 0.03
+    GEMINI_API_BASE_URL=http://127.0.0.1:8090/v1beta uvicorn main:app
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+UPSTREAM_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+
+ERROR_BODIES = {
+    400: ("INVALID_ARGUMENT", "Request contains an invalid argument."),
+    403: ("PERMISSION_DENIED", "API key not valid. Please pass a valid API key."),
+    429: ("RESOURCE_EXHAUSTED", "Resource has been exhausted (e.g. check quota)."),
+    500: ("INTERNAL", "An internal error has occurred."),
+    502: ("UNAVAILABLE", "Bad gateway."),
+    503: ("UNAVAILABLE", "The model is overloaded. Please try again later."),
+    504: ("DEADLINE_EXCEEDED", "Deadline exceeded."),
+}
+
+BATCH_ID_PATTERN = re.compile(r"\[예측 id: ([^\]]+)\]")
+
+
+def parse_error_rates(value: str) -> Dict[int, float]:
+    """'429=0.05,503=0.02' 형식을 {상태 코드: 비율}로 변환"""
+    rates = {}
+    for part in filter(None, (p.strip() for p in value.split(","))):
+        code, rate = part.split("=")
+        if int(code) not in ERROR_BODIES:
+            raise argparse.ArgumentTypeError(f"지원하지 않는 상태 코드: {code}")
+        rates[int(code)] = float(rate)
+    if sum(rates.values()) > 1:
+        raise argparse.ArgumentTypeError("오류 비율 합계는 1 이하여야 합니다")
+    return rates
+
+
+@dataclass
+class StubConfig:
+    mode: str = "synth"  # synth, record, replay
+    latency_ms: float = 500.0  # 지연 시간 중앙값
+    latency_sigma: float = 0.4  # 로그정규 분포 sigma (0이면 고정 지연)
+    latency_per_item_ms: float = 50.0  # 배치 프롬프트 예측 1건당 추가 지연
+    error_rates: Dict[int, float] = field(default_factory=dict)
+    malformed_rate: float = 0.0
+    retry_after_seconds: float = 1.0  # 429 응답의 Retry-After
+    cassette: Optional[str] = None
+    replay_miss: str = "synth"  # replay 모드에서 카세트에 없는 요청 처리: synth, error
+    upstream_base_url: str = UPSTREAM_BASE_URL
+    seed: Optional[int] = None
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    """스텁 설정 인자 (benchmark_scoring.py에서도 재사용)"""
+    parser.add_argument("--mode", choices=["synth", "record", "replay"], default="synth")
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="지연 시간 중앙값(ms)")
+    parser.add_argument("--latency-sigma", type=float, default=0.4, help="로그정규 분포 sigma, 0이면 고정 지연")
+    parser.add_argument("--latency-per-item-ms", type=float, default=50.0, help="배치 예측 1건당 추가 지연(ms)")
+    parser.add_argument("--error-rates", type=parse_error_rates, default={}, help="예: 429=0.05,500=0.01,503=0.02")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="잘못된 JSON 텍스트 응답 비율")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After(초)")
+    parser.add_argument("--cassette", default=None, help="record/replay 카세트 파일 (JSON Lines)")
+    parser.add_argument("--replay-miss", choices=["synth", "error"], default="synth", help="카세트에 없는 요청 처리")
+    parser.add_argument("--upstream-url", default=UPSTREAM_BASE_URL, help="record 모드에서 요청을 전달할 API URL")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        mode=args.mode,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        latency_per_item_ms=args.latency_per_item_ms,
+        error_rates=args.error_rates,
+        malformed_rate=args.malformed_rate,
+        retry_after_seconds=args.retry_after,
+        cassette=args.cassette,
+        replay_miss=args.replay_miss,
+        upstream_base_url=args.upstream_url,
+        seed=args.seed
+    )
+
+
+def cassette_key(model: str, body: Dict[str, Any]) -> str:
+    """모델 + 프롬프트 + 생성 설정으로 카세트 키 생성"""
+    canonical = json.dumps(
+        {"model": model, "contents": body.get("contents"), "generationConfig": body.get("generationConfig")},
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """요청 키별 응답(상태 코드/헤더/본문)을 JSON Lines 파일로 저장"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if path:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            self.entries[entry["key"]] = entry
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(key)
+
+    def record(self, key: str, status_code: int, headers: Dict[str, str], body: Any):
+        entry = {"key": key, "status": status_code, "headers": headers, "body": body}
+        with self._lock:
+            self.entries[key] = entry
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def _prompt_text(body: Dict[str, Any]) -> str:
+    try:
+        return "".join(part.get("text", "") for part in body["contents"][0]["parts"])
+    except (KeyError, IndexError, TypeError):
+        return ""
+
+
+def _synth_scores(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "quality_score": rng.randint(50, 95),
+        "demand_score": rng.randint(40, 95),
+        "reputation_score": rng.randint(30, 90),
+        "economic_score": rng.randint(40, 90),
+        "quality_details": {"clarity": rng.randint(50, 100), "data_source": rng.randint(50, 100),
+                            "timeframe": rng.randint(50, 100), "compliance": rng.randint(50, 100)},
+        "demand_details": {"trend_indicators": rng.randint(40, 100), "topic_popularity": rng.randint(40, 100),
+                           "timing": rng.randint(40, 100)},
+        "reputation_details": {"loyalty": rng.randint(30, 100), "success_history": rng.randint(30, 100),
+                               "bond_size": rng.randint(30, 100)},
+        "economic_details": {"liquidity": rng.randint(40, 100), "volatility": rng.randint(40, 100),
+                             "oracle_cost": rng.randint(40, 100)},
+        "ai_reasoning": "스텁 서버가 생성한 평가입니다."
+    }
+
+
+def _synth_text(prompt: str) -> str:
+    """프롬프트 내용으로 시드를 고정하여 같은 프롬프트에는 같은 점수 반환"""
+    rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+    batch_ids = BATCH_ID_PATTERN.findall(prompt)
+    if batch_ids:
+        return json.dumps(
+            [{"id": item_id.strip(), **_synth_scores(rng)} for item_id in batch_ids],
+            ensure_ascii=False
+        )
+    return json.dumps(_synth_scores(rng), ensure_ascii=False)
+
+
+def _generate_content_body(text: str, prompt: str) -> Dict[str, Any]:
+    prompt_tokens = len(prompt) // 3 + 1
+    output_tokens = len(text) // 3 + 1
+    return {
+        "candidates": [{
+            "content": {"parts": [{"text": text}], "role": "model"},
+            "finishReason": "STOP"
+        }],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": output_tokens,
+            "totalTokenCount": prompt_tokens + output_tokens
+        }
+    }
+
+
+def _error_response(status_code: int, retry_after: float) -> JSONResponse:
+    status_name, message = ERROR_BODIES[status_code]
+    error = {"code": status_code, "message": message, "status": status_name}
+    headers = {}
+    if status_code == 429:
+        error["details"] = [{
+            "@type": "type.googleapis.com/google.rpc.RetryInfo",
+            "retryDelay": f"{retry_after:g}s"
+        }]
+        headers["Retry-After"] = f"{retry_after:g}"
+    return JSONResponse({"error": error}, status_code=status_code, headers=headers)
+
+
+def create_stub_app(config: StubConfig) -> FastAPI:
+    app = FastAPI(title="Gemini Stub")
+    rng = random.Random(config.seed)
+    cassette = Cassette(config.cassette)
+    stats: Counter = Counter()
+
+    async def simulate_latency(prompt: str):
+        median = config.latency_ms + config.latency_per_item_ms * len(BATCH_ID_PATTERN.findall(prompt))
+        if median <= 0:
+            return
+        latency_ms = median * math.exp(rng.gauss(0, config.latency_sigma)) if config.latency_sigma > 0 else median
+        await asyncio.sleep(latency_ms / 1000)
+
+    def pick_error() -> Optional[int]:
+        roll = rng.random()
+        for status_code, rate in config.error_rates.items():
+            if roll < rate:
+                return status_code
+            roll -= rate
+        return None
+
+    async def forward(model: str, key: Optional[str], body: Dict[str, Any]) -> JSONResponse:
+        """실제 Gemini API 호출 후 응답 기록"""
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            response = await client.post(
+                f"{config.upstream_base_url}/models/{model}:generateContent",
+                params={"key": key} if key else None,
+                json=body
+            )
+        headers = {name: value for name, value in response.headers.items() if name.lower() == "retry-after"}
+        try:
+            response_body = response.json()
+        except ValueError:
+            response_body = {"error": {"code": response.status_code, "message": response.text}}
+        cassette.record(cassette_key(model, body), response.status_code, headers, response_body)
+        return JSONResponse(response_body, status_code=response.status_code, headers=headers)
+
+    @app.post("/v1beta/models/{model}:generateContent")
+    async def generate_content(model: str, request: Request):
+        body = await request.json()
+        prompt = _prompt_text(body)
+        stats["requests"] += 1
+
+        if config.mode == "record":
+            response = await forward(model, request.query_params.get("key"), body)
+            stats[f"status_{response.status_code}"] += 1
+            return response
+
+        if config.mode == "replay":
+            entry = cassette.get(cassette_key(model, body))
+            if entry is not None:
+                await simulate_latency(prompt)
+                stats["replayed"] += 1
+                stats[f"status_{entry['status']}"] += 1
+                return JSONResponse(entry["body"], status_code=entry["status"], headers=entry.get("headers") or {})
+            stats["replay_misses"] += 1
+            if config.replay_miss == "error":
+                stats["status_404"] += 1
+                return JSONResponse(
+                    {"error": {"code": 404, "message": "cassette miss", "status": "NOT_FOUND"}},
+                    status_code=404
+                )
+
+        await simulate_latency(prompt)
+
+        error_status = pick_error()
+        if error_status is not None:
+            stats[f"status_{error_status}"] += 1
+            return _error_response(error_status, config.retry_after_seconds)
+
+        text = _synth_text(prompt)
+        if rng.random() < config.malformed_rate:
+            # 잘린 JSON (출력 토큰 초과/형식 오류 재현)
+            text = text[:max(1, len(text) // 2)]
+            stats["malformed"] += 1
+        stats["status_200"] += 1
+        return _generate_content_body(text, prompt)
+
+    @app.get("/stats")
+    async def get_stats():
+        return dict(stats)
+
+    @app.post("/stats/reset")
+    async def reset_stats():
+        stats.clear()
+        return {}
+
+    return app
+
+
+def serve_in_thread(config: StubConfig, host: str = "127.0.0.1", port: int = 0):
+    """스텁 서버를 별도 스레드의 이벤트 루프에서 실행하고 (서버, /v1beta URL) 반환"""
+    import socket
+    import uvicorn
+
+    if not port:
+        with socket.socket() as sock:
+            sock.bind((host, 0))
+            port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(create_stub_app(config), host=host, port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://{host}:{port}/v1beta"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gemini generateContent 로컬 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    if args.mode in ("record", "replay") and not args.cassette:
+        parser.error("record/replay 모드에는 --cassette가 필요합니다")
+
+    import uvicorn
+    print(f"🧪 Gemini 스텁 서버: http://{args.host}:{args.port}/v1beta (mode={args.mode})")
+    uvicorn.run(create_stub_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
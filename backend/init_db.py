@@ -5,7 +5,7 @@
 
 import json
 from sqlalchemy.orm import Session
-from app.models.database import engine, SessionLocal, create_tables, News, CommunityPost, LeagueStanding, User, PredictionEvent, PredictionScore
+from app.models.database import engine, SessionLocal, create_tables, News, CommunityPost, LeagueStanding, User, PredictionEvent, PredictionScore, CreatorStats
 from app.schemas.news import NewsCreate
 from app.schemas.community import CommunityPostCreate
 from app.schemas.standings import LeagueStandingCreate
@@ -29,6 +29,7 @@ def insert_sample_data():
         db.query(User).delete()
         db.query(PredictionEvent).delete()
         db.query(PredictionScore).delete()
+        db.query(CreatorStats).delete()
         db.commit()
         
         # 뉴스 데이터 삽입 (main.tsx의 모든 데이터)
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -7,12 +8,48 @@ import os
 from app.api import api_router
 from app.core.config import settings
 from app.models.database import create_tables
+from app.services.expiry_scheduler import start_expiry_scheduler, stop_expiry_scheduler
+from app.services.ai_usage import start_usage_flusher, stop_usage_flusher
+from app.services.http_client import start_http_client, close_http_client
+from app.services.novelty_index import start_novelty_index
+from app.services.pool_odds import get_pool_odds
+from app.services.realtime import start_broker, close_broker
+from app.services.score_cache import close_score_cache
+from app.services.scoring_jobs import start_scoring_worker, stop_scoring_worker
+from app.services.weight_profiles import load_active_weights
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 공유 HTTP 클라이언트 (커넥션 풀) 생성/종료
+    await start_http_client()
+    # 독창성 계산용 근접 중복 인덱스 (기존 예측은 백그라운드 스레드에서 채움)
+    await start_novelty_index()
+    # 예측별 배당 집계 미리 생성 (이후 베팅마다 증분 반영)
+    get_pool_odds()
+    # 활성 총점 가중치 프로필 로드 (없으면 기본 프로필 생성)
+    load_active_weights()
+    # 실시간 알림 브로커 (WebSocket/SSE 구독자에게 베팅/배당/상태 변경 전달)
+    await start_broker()
+    # 백그라운드 스코어링 작업 워커 (미완료 작업 재개 포함)
+    await start_scoring_worker()
+    # AI 호출 사용량 시간별 집계 주기적 반영
+    await start_usage_flusher()
+    # 베팅 마감 시각이 지난 예측을 expired로 바꾸는 스케줄러
+    await start_expiry_scheduler()
+    yield
+    await stop_expiry_scheduler()
+    await stop_scoring_worker()
+    await close_broker()
+    await stop_usage_flusher()
+    await close_http_client()
+    await close_score_cache()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="Sui Ports API",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 # 데이터베이스 테이블 생성
@@ -25,6 +62,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 목록 키셋 페이지네이션 cursor
 )
 
 # API 라우터 등록
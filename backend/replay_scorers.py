@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+저장된 예측을 여러 스코어링 백엔드로 다시 채점해 비교하는 리플레이 스크립트
+
+- 현재 디렉터리 DB의 PredictionEvent를 읽어 같은 입력으로 모든 백엔드를 동시에 실행 (DB에는 쓰지 않음)
+- 백엔드별 지연 시간(p50/p95/p99), 토큰 사용량, 예상 비용, 실패율을 출력
+- 백엔드 쌍마다 total_score 순위 상관계수(Spearman)를 출력
+- 백엔드 종류
+    gemini     실제 Gemini API (model, url, key, input_price, output_price)
+    stub       gemini_stub.py 서버 (url이 없으면 프로세스 안에서 실행, latency_ms, malformed_rate, error_429=0.05 등)
+    heuristic  외부 호출 없는 로컬 휴리스틱 스코어러
+- 공통 옵션: concurrency, batch_size, rpm, tpm
+- 캐시는 사용하지 않으며 백엔드마다 별도의 rate limiter와 서킷 브레이커를 사용
+
+사용 예:
+    python replay_scorers.py --backend flash=gemini:model=gemini-1.5-flash \\
+        --backend pro=gemini:model=gemini-1.5-pro,input_price=1.25,output_price=5 \\
+        --backend local=heuristic --limit 200
+    python replay_scorers.py --backend stub=stub:latency_ms=300,error_429=0.05 --backend local=heuristic
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Any, Dict, List, Optional
+
+BACKEND_KINDS = ("gemini", "stub", "heuristic")
+USAGE_KEYS = ("requests", "prompt_tokens", "output_tokens", "total_tokens")
+
+
+@dataclass
+class BackendSpec:
+    label: str
+    kind: str
+    options: Dict[str, str] = field(default_factory=dict)
+
+    def option(self, name: str, default=None, cast=str):
+        value = self.options.get(name)
+        return default if value is None else cast(value)
+
+
+def parse_backend(value: str) -> BackendSpec:
+    """LABEL=KIND[:key=value,...] 형식 파싱"""
+    label, sep, rest = value.partition("=")
+    if not sep or not label:
+        raise argparse.ArgumentTypeError(f"백엔드 형식은 LABEL=KIND[:key=value,...] 입니다: {value}")
+    kind, _, option_text = rest.partition(":")
+    if kind not in BACKEND_KINDS:
+        raise argparse.ArgumentTypeError(f"알 수 없는 백엔드 종류: {kind} ({', '.join(BACKEND_KINDS)})")
+    options = {}
+    for pair in filter(None, option_text.split(",")):
+        key, sep, option_value = pair.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"옵션 형식은 key=value 입니다: {pair}")
+        options[key.strip()] = option_value.strip()
+    return BackendSpec(label=label, kind=kind, options=options)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="저장된 예측으로 스코어링 백엔드 비교")
+    parser.add_argument("--backend", dest="backends", action="append", type=parse_backend, required=True,
+                        help="LABEL=KIND[:key=value,...] (여러 번 지정 가능)")
+    parser.add_argument("--limit", type=int, default=100, help="리플레이할 예측 수 (최신순)")
+    parser.add_argument("--status", default=None, help="특정 상태의 예측만 사용 (예: approved)")
+    parser.add_argument("--concurrency", type=int, default=4, help="백엔드별 기본 동시 호출 수")
+    parser.add_argument("--max-retries", type=int, default=2)
+    parser.add_argument("--json", dest="json_path", default=None, help="백엔드별 결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    labels = [spec.label for spec in args.backends]
+    if len(set(labels)) != len(labels):
+        parser.error("백엔드 LABEL이 중복되었습니다")
+    return args
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _ranks(values: List[float]) -> List[float]:
+    """동점은 평균 순위로 처리한 순위 목록"""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+
+def spearman(a: List[float], b: List[float]) -> Optional[float]:
+    """Spearman 순위 상관계수 (순위에 대한 Pearson 상관), 계산 불가면 None"""
+    if len(a) < 2:
+        return None
+    rank_a, rank_b = _ranks(a), _ranks(b)
+    mean_a, mean_b = sum(rank_a) / len(rank_a), sum(rank_b) / len(rank_b)
+    cov = sum((x - mean_a) * (y - mean_b) for x, y in zip(rank_a, rank_b))
+    var_a = sum((x - mean_a) ** 2 for x in rank_a)
+    var_b = sum((y - mean_b) ** 2 for y in rank_b)
+    if var_a == 0 or var_b == 0:
+        return None
+    return cov / (var_a * var_b) ** 0.5
+
+
+def build_service(spec: BackendSpec, args):
+    """백엔드 설정으로 스코어링 서비스 생성 (stub은 url이 없으면 스텁 서버를 띄움)"""
+    from app.core.config import settings
+    from app.services.ai_scoring import AIScoringService
+    from app.services.circuit_breaker import CircuitBreaker
+    from app.services.heuristic_scoring import HeuristicScoringService
+    from app.services.rate_limiter import GeminiRateLimiter
+    from app.services.score_cache import NullScoreCache
+
+    if spec.kind == "heuristic":
+        return HeuristicScoringService(), None
+
+    server = None
+    base_url = spec.option("url")
+    if spec.kind == "stub" and not base_url:
+        from gemini_stub import StubConfig, serve_in_thread
+
+        error_rates = {
+            int(key.split("_", 1)[1]): float(value)
+            for key, value in spec.options.items()
+            if key.startswith("error_")
+        }
+        server, base_url = serve_in_thread(StubConfig(
+            latency_ms=spec.option("latency_ms", 500.0, float),
+            latency_sigma=spec.option("latency_sigma", 0.4, float),
+            malformed_rate=spec.option("malformed_rate", 0.0, float),
+            error_rates=error_rates,
+            seed=spec.option("seed", None, int)
+        ))
+
+    default_rpm = 100000 if spec.kind == "stub" else settings.GEMINI_REQUESTS_PER_MINUTE
+    service = AIScoringService(
+        cache=NullScoreCache(),
+        rate_limiter=GeminiRateLimiter(
+            spec.option("rpm", default_rpm, int),
+            spec.option("tpm", settings.GEMINI_TOKENS_PER_MINUTE, int)
+        ),
+        circuit_breaker=CircuitBreaker(),
+        model=spec.option("model"),
+        base_url=base_url,
+        api_key=spec.option("key", "stub-key" if spec.kind == "stub" else None)
+    )
+    return service, server
+
+
+async def run_backend(spec: BackendSpec, service, inputs: Dict[str, Dict[str, Any]], args) -> Dict[str, Any]:
+    """입력 전체를 백엔드 하나로 채점하고 예측별 점수/지연 시간 수집"""
+    batch_size = max(1, spec.option("batch_size", 1, int))
+    semaphore = asyncio.Semaphore(max(1, spec.option("concurrency", args.concurrency, int)))
+    usage_before = Counter(service.usage)
+    scores: Dict[str, float] = {}
+    latencies: List[float] = []
+    failures = Counter()
+
+    async def score_chunk(chunk: Dict[str, Dict[str, Any]]):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                if batch_size == 1:
+                    item_id, prediction_data = next(iter(chunk.items()))
+                    results = {item_id: await service.calculate_prediction_score(prediction_data)}
+                else:
+                    results = await service.calculate_batch_scores(chunk)
+            except Exception as e:
+                print(f"   ⚠️ {spec.label}: {e}")
+                failures["error"] += len(chunk)
+                return
+            latency_ms = (time.perf_counter() - started) * 1000
+        for item_id in chunk:
+            result = results.get(item_id)
+            latencies.append(latency_ms)
+            if result is None:
+                failures["missing"] += 1
+            elif result.get("is_fallback"):
+                failures["fallback"] += 1
+            else:
+                scores[item_id] = result["total_score"]
+
+    item_ids = list(inputs)
+    chunks = [
+        {item_id: inputs[item_id] for item_id in item_ids[start:start + batch_size]}
+        for start in range(0, len(item_ids), batch_size)
+    ]
+    started = time.perf_counter()
+    await asyncio.gather(*(score_chunk(chunk) for chunk in chunks))
+    elapsed = time.perf_counter() - started
+
+    usage = {key: service.usage[key] - usage_before[key] for key in USAGE_KEYS}
+    input_price = spec.option("input_price", 0.0, float)
+    output_price = spec.option("output_price", 0.0, float)
+    latencies.sort()
+    return {
+        "label": spec.label,
+        "kind": spec.kind,
+        "model": service.gemini_model,
+        "items": len(inputs),
+        "elapsed": elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "failures": dict(failures),
+        "failure_rate": sum(failures.values()) / len(inputs) if inputs else 0.0,
+        "usage": usage,
+        # 가격은 100만 토큰당 USD
+        "cost_usd": (usage["prompt_tokens"] * input_price + usage["output_tokens"] * output_price) / 1_000_000,
+        "scores": scores
+    }
+
+
+def load_inputs(args) -> Dict[str, Dict[str, Any]]:
+    """현재 디렉터리 DB에서 예측을 읽어 스코어링 입력으로 변환"""
+    from app.models.database import SessionLocal, PredictionEvent
+    from app.services.creator_stats import load_creator_profiles
+    from app.services.scoring_engine import build_scoring_data
+
+    db = SessionLocal()
+    try:
+        query = db.query(PredictionEvent)
+        if args.status:
+            query = query.filter(PredictionEvent.status == args.status)
+        predictions = query.order_by(PredictionEvent.id.desc()).limit(args.limit).all()
+        profiles = load_creator_profiles(db, {prediction.creator_id for prediction in predictions})
+        return {
+            str(prediction.id): build_scoring_data(prediction, profiles.get(prediction.creator_id))
+            for prediction in predictions
+        }
+    finally:
+        db.close()
+
+
+def correlations(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """백엔드 쌍마다 둘 다 채점에 성공한 예측만으로 순위 상관 계산"""
+    pairs = []
+    for left, right in combinations(rows, 2):
+        common = sorted(set(left["scores"]) & set(right["scores"]))
+        pairs.append({
+            "pair": f"{left['label']} ~ {right['label']}",
+            "items": len(common),
+            "spearman": spearman(
+                [left["scores"][item_id] for item_id in common],
+                [right["scores"][item_id] for item_id in common]
+            )
+        })
+    return pairs
+
+
+def print_report(rows, pairs):
+    print(f"\n{'백엔드':<12} {'모델':<20} {'건수':>5} {'소요(s)':>8} {'p50(ms)':>8} {'p95(ms)':>8} "
+          f"{'p99(ms)':>8} {'실패율':>7} {'요청':>6} {'입력토큰':>9} {'출력토큰':>9} {'비용($)':>9}")
+    for row in rows:
+        usage = row["usage"]
+        print(
+            f"{row['label']:<14} {row['model']:<20} {row['items']:>6} {row['elapsed']:>8.2f} "
+            f"{row['p50']:>8.0f} {row['p95']:>8.0f} {row['p99']:>8.0f} {row['failure_rate']:>7.1%} "
+            f"{usage['requests']:>6} {usage['prompt_tokens']:>9} {usage['output_tokens']:>9} {row['cost_usd']:>9.4f}"
+        )
+    if pairs:
+        print("\n📈 total_score 순위 상관 (Spearman)")
+        for pair in pairs:
+            value = "계산 불가" if pair["spearman"] is None else f"{pair['spearman']:.3f}"
+            print(f"   {pair['pair']}: {value} ({pair['items']}건)")
+
+
+async def run_replay(args, services, inputs):
+    from app.services.http_client import close_http_client
+
+    try:
+        return await asyncio.gather(*(
+            run_backend(spec, service, inputs, args) for spec, service in services
+        ))
+    finally:
+        await close_http_client()
+
+
+def main():
+    args = parse_args()
+    os.environ.setdefault("GEMINI_MAX_RETRIES", str(args.max_retries))
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    inputs = load_inputs(args)
+    if not inputs:
+        print("❌ 리플레이할 예측이 없습니다.")
+        return 1
+
+    services, servers = [], []
+    for spec in args.backends:
+        service, server = build_service(spec, args)
+        services.append((spec, service))
+        if server is not None:
+            servers.append(server)
+
+    print(f"🚀 예측 {len(inputs)}개를 {len(services)}개 백엔드로 리플레이합니다.")
+    try:
+        rows = asyncio.run(run_replay(args, services, inputs))
+    finally:
+        for server in servers:
+            server.should_exit = True
+
+    pairs = correlations(rows)
+    print_report(rows, pairs)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"backends": rows, "correlations": pairs}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과를 {args.json_path}에 저장했습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
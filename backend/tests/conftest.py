@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base, PredictionEvent, User
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """테스트마다 새 SQLite 파일 DB (앱의 sui_ports.db는 건드리지 않음)"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def make_user(db):
+    counter = {"n": 0}
+
+    def make(is_admin: bool = False, **fields) -> User:
+        counter["n"] += 1
+        user = User(
+            username=f"user{counter['n']}",
+            email=f"user{counter['n']}@example.com",
+            hashed_password="x",
+            is_admin=is_admin,
+            **fields
+        )
+        db.add(user)
+        db.commit()
+        return user
+
+    return make
+
+
+@pytest.fixture
+def make_prediction(db):
+    def make(creator: User, status: str = "pending", **fields) -> PredictionEvent:
+        values = {
+            "game_id": "g1",
+            "prediction": "home team wins",
+            "option_a": "yes",
+            "option_b": "no",
+            "duration": 24,
+            "creator_id": creator.id,
+            "status": status,
+            "expires_at": datetime.utcnow() + timedelta(hours=24),
+            "total_bets": 0,
+            "total_amount": 0,
+        }
+        values.update(fields)
+        prediction = PredictionEvent(**values)
+        db.add(prediction)
+        db.commit()
+        return prediction
+
+    return make
@@ -0,0 +1,66 @@
+import asyncio
+
+import httpx
+
+from app.services.ai_scoring import AIScoringService
+from app.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeRateLimiter:
+    async def acquire(self, estimated_tokens):
+        pass
+
+    def record_usage(self, estimated_tokens, actual_tokens):
+        pass
+
+    def pause(self, seconds):
+        pass
+
+
+class FakeRecorder:
+    def __init__(self):
+        self.calls = []
+
+    def record(self, call):
+        self.calls.append(call)
+
+
+def make_service(body, breaker):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+    recorder = FakeRecorder()
+    service = AIScoringService(
+        client=httpx.AsyncClient(transport=transport),
+        rate_limiter=FakeRateLimiter(),
+        circuit_breaker=breaker,
+        usage_recorder=recorder,
+        base_url="http://gemini.test",
+        api_key="test"
+    )
+    return service, recorder
+
+
+def half_open_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0, half_open_max_calls=1)
+    breaker.record_failure()
+    assert breaker.state == HALF_OPEN
+    return breaker
+
+
+def test_response_without_candidates_counts_as_failure():
+    breaker = half_open_breaker()
+    service, recorder = make_service({"promptFeedback": {"blockReason": "SAFETY"}}, breaker)
+
+    assert asyncio.run(service._request_gemini_text("prompt")) is None
+    assert recorder.calls[-1].status == "bad_response"
+    # 시험 호출이 실패했으므로 다시 open (recovery_seconds=0이라 조회 시점엔 half-open)
+    assert breaker._state == OPEN
+
+
+def test_response_with_text_closes_breaker():
+    breaker = half_open_breaker()
+    body = {"candidates": [{"content": {"parts": [{"text": "{}"}]}}]}
+    service, recorder = make_service(body, breaker)
+
+    assert asyncio.run(service._request_gemini_text("prompt")) == "{}"
+    assert recorder.calls[-1].status == "ok"
+    assert breaker.state == CLOSED
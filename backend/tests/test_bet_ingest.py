@@ -0,0 +1,84 @@
+import pytest
+
+from app.models.database import Bet
+from app.schemas.bet import BetBulkItem
+from app.services import bet_ingest
+from app.services.bet_ingest import bulk_summary, ingest_bets
+from app.services.pool_odds import PoolOddsAggregator
+from app.services.pool_totals import load_pool_totals
+
+
+@pytest.fixture
+def pool_odds(monkeypatch):
+    aggregator = PoolOddsAggregator(fee_bps=200)
+    monkeypatch.setattr(bet_ingest, "get_pool_odds", lambda: aggregator)
+    return aggregator
+
+
+def _item(prediction_id, transaction_hash, option="yes", amount=1.5, user_id=None):
+    return BetBulkItem(
+        prediction_id=prediction_id,
+        user_address="0xabc",
+        option=option,
+        amount=amount,
+        transaction_hash=transaction_hash,
+        user_id=user_id
+    )
+
+
+def test_ingest_is_idempotent_on_transaction_hash(db, make_user, make_prediction, pool_odds):
+    admin = make_user(is_admin=True)
+    alice, bob = make_user(), make_user()
+    prediction = make_prediction(admin, status="approved")
+    items = [
+        _item(prediction.id, "tx-1", "yes", 2.0, alice.id),
+        _item(prediction.id, "tx-2", "no", 1.0, bob.id),
+        _item(prediction.id, "tx-1", "yes", 2.0, alice.id),
+        _item(prediction.id + 100, "tx-3", "yes", 1.0, alice.id),
+        _item(prediction.id, "tx-4", "maybe", 1.0, admin.id),
+    ]
+
+    first = bulk_summary(ingest_bets(db, items, admin.id))
+    assert (first["accepted"], first["duplicates"], first["rejected"]) == (2, 1, 2)
+    statuses = [item["status"] for item in first["items"]]
+    assert statuses == ["accepted", "accepted", "duplicate", "rejected", "rejected"]
+    assert first["items"][2]["bet_id"] == first["items"][0]["bet_id"]
+
+    # 타임아웃 후 같은 요청을 재시도해도 새로 저장되지 않음
+    retry = bulk_summary(ingest_bets(db, items, admin.id))
+    assert (retry["accepted"], retry["duplicates"], retry["rejected"]) == (0, 3, 2)
+    assert [item["bet_id"] for item in retry["items"][:3]] == [item["bet_id"] for item in first["items"][:3]]
+
+    assert db.query(Bet).count() == 2
+    totals = load_pool_totals(db, prediction.id)
+    assert totals["total_bets"] == 2
+    assert totals["total_amount"] == 3.0
+    assert (totals["option_a_bets"], totals["option_a_amount"]) == (1, 2.0)
+    assert (totals["option_b_bets"], totals["option_b_amount"]) == (1, 1.0)
+
+    odds = pool_odds.odds(prediction.id)
+    assert odds["total_amount"] == 3.0
+    assert odds["total_bettors"] == 2
+
+
+def test_ingest_enforces_one_bet_per_user_per_prediction(db, make_user, make_prediction, pool_odds):
+    admin = make_user(is_admin=True)
+    alice = make_user()
+    prediction = make_prediction(admin, status="approved")
+    db.add(Bet(prediction_id=prediction.id, user_id=alice.id, user_address="0xabc", option="yes",
+               amount=1.0, transaction_hash="tx-existing"))
+    db.commit()
+    other = make_prediction(admin, status="approved")
+
+    results = ingest_bets(db, [
+        _item(prediction.id, "tx-new", "no", 1.0, alice.id),
+        _item(other.id, "tx-a", "yes", 1.0, alice.id),
+        _item(other.id, "tx-b", "no", 1.0, alice.id),
+        _item(prediction.id, "tx-existing", "yes", 1.0, alice.id),
+    ], admin.id)
+
+    assert [result["status"] for result in results] == ["rejected", "accepted", "rejected", "duplicate"]
+    assert results[0]["detail"] == "You have already placed a bet on this prediction"
+    assert results[3]["bet_id"] is not None
+    assert db.query(Bet).filter(Bet.user_id == alice.id).count() == 2
+    assert pool_odds.odds(other.id)["total_bettors"] == 1
@@ -0,0 +1,87 @@
+from app.models.database import CreatorStats, PredictionScore
+from app.services import scoring_engine
+from app.services.creator_stats import (
+    _status_deltas,
+    rebuild_creator_stats,
+    record_prediction_created,
+    record_status_changes,
+)
+from app.services.scoring_engine import ScoringItemResult, select_best_prediction, snapshot_candidates
+
+
+def _stats(db, user_id):
+    db.expire_all()
+    return db.get(CreatorStats, user_id)
+
+
+def test_status_deltas_count_ended_as_accepted():
+    assert _status_deltas("approved", "ended") == {"approved_count": 0, "rejected_count": 0}
+    assert _status_deltas("expired", "ended") == {"approved_count": 0, "rejected_count": 0}
+    assert _status_deltas("ended", "completed") == {"approved_count": 0, "rejected_count": 0}
+    assert _status_deltas("pending", "approved") == {"approved_count": 1, "rejected_count": 0}
+    assert _status_deltas("pending", "rejected") == {"approved_count": 0, "rejected_count": 1}
+
+
+def test_end_match_flow_keeps_approved_count(db, make_user):
+    creator = make_user()
+    record_prediction_created(db, creator.id)
+    for old_status, new_status in [("pending", "approved"), ("approved", "expired"), ("expired", "ended"),
+                                   ("ended", "completed")]:
+        record_status_changes(db, [(creator.id, old_status, new_status)])
+    db.commit()
+
+    stats = _stats(db, creator.id)
+    assert stats.predictions_created == 1
+    assert stats.approved_count == 1
+    assert stats.rejected_count == 0
+
+
+def test_rebuild_counts_ended_predictions(db, make_user, make_prediction):
+    creator = make_user()
+    make_prediction(creator, status="ended")
+    make_prediction(creator, status="approved")
+    make_prediction(creator, status="rejected")
+    make_prediction(creator, status="pending")
+
+    assert rebuild_creator_stats(db) == 1
+    stats = _stats(db, creator.id)
+    assert stats.predictions_created == 4
+    assert stats.approved_count == 2
+    assert stats.rejected_count == 1
+
+
+class _NullIndex:
+    def remove(self, prediction_id):
+        pass
+
+
+def test_rebuild_keeps_rejections_of_discarded_predictions(db, make_user, make_prediction, monkeypatch):
+    monkeypatch.setattr(scoring_engine, "get_novelty_index", lambda: _NullIndex())
+    monkeypatch.setattr(scoring_engine, "get_pool_odds", lambda: _NullIndex())
+    winner_creator, loser_creator = make_user(), make_user()
+    candidates = [make_prediction(winner_creator), make_prediction(loser_creator), make_prediction(loser_creator)]
+    for prediction, total in zip(candidates, [90.0, 50.0, 40.0]):
+        db.add(PredictionScore(
+            prediction_id=prediction.id, quality_score=total, demand_score=total, reputation_score=total,
+            novelty_score=total, economic_score=total, total_score=total
+        ))
+    db.commit()
+    for prediction in candidates:
+        record_prediction_created(db, prediction.creator_id)
+    db.commit()
+
+    results = [
+        ScoringItemResult(prediction_id=prediction.id, success=True, total_score=total)
+        for prediction, total in zip(candidates, [90.0, 50.0, 40.0])
+    ]
+    select_best_prediction(db, snapshot_candidates(candidates), results)
+    before = _stats(db, loser_creator.id)
+    assert (before.predictions_created, before.rejected_count) == (2, 2)
+
+    rebuild_creator_stats(db)
+
+    # 삭제된 예측의 거절 이력이 다시 계산해도 남아 있어야 함
+    loser = _stats(db, loser_creator.id)
+    assert (loser.predictions_created, loser.approved_count, loser.rejected_count) == (2, 0, 2)
+    winner = _stats(db, winner_creator.id)
+    assert (winner.predictions_created, winner.approved_count, winner.rejected_count) == (1, 1, 0)
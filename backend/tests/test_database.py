@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.models.database import Base, Bet, DuplicateKeyError, create_missing_indexes
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    """uq_bets_transaction_hash가 생기기 전 DB (인덱스만 빠진 상태)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX uq_bets_transaction_hash"))
+    yield engine
+    engine.dispose()
+
+
+def insert_bet(engine, transaction_hash):
+    with engine.begin() as connection:
+        connection.execute(Bet.__table__.insert().values(
+            prediction_id=1, user_id=1, user_address="0xuser", option="A", amount=1.0, transaction_hash=transaction_hash
+        ))
+
+
+def test_missing_unique_index_is_created(legacy_engine):
+    insert_bet(legacy_engine, "0xa")
+    insert_bet(legacy_engine, "0xb")
+    insert_bet(legacy_engine, None)
+    insert_bet(legacy_engine, None)
+
+    create_missing_indexes(legacy_engine)
+
+    names = {index["name"] for index in inspect(legacy_engine).get_indexes("bets")}
+    assert "uq_bets_transaction_hash" in names
+
+
+def test_duplicates_block_startup_with_report(legacy_engine):
+    insert_bet(legacy_engine, "0xa")
+    insert_bet(legacy_engine, "0xa")
+
+    with pytest.raises(DuplicateKeyError) as error:
+        create_missing_indexes(legacy_engine)
+
+    assert "uq_bets_transaction_hash" in str(error.value)
+    assert "0xa" in str(error.value)
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.database import PredictionEvent
+from app.services import expiry_scheduler
+from app.services.expiry_scheduler import ExpiryScheduler, expire_due_predictions
+
+
+@pytest.fixture(autouse=True)
+def scheduler_db(monkeypatch, session_factory):
+    monkeypatch.setattr(expiry_scheduler, "SessionLocal", session_factory)
+
+
+def _status(db, prediction_id):
+    db.expire_all()
+    return db.get(PredictionEvent, prediction_id).status
+
+
+def test_expire_due_predictions_only_flips_due_open_predictions(db, make_user, make_prediction):
+    creator = make_user()
+    past = datetime.utcnow() - timedelta(minutes=1)
+    due_approved = make_prediction(creator, status="approved", expires_at=past)
+    due_active = make_prediction(creator, status="active", expires_at=past)
+    due_pending = make_prediction(creator, status="pending", expires_at=past)
+    future = make_prediction(creator, status="approved")
+
+    expired_ids = expire_due_predictions(db)
+
+    assert sorted(expired_ids) == sorted([due_approved.id, due_active.id])
+    assert _status(db, due_approved.id) == "expired"
+    assert _status(db, due_active.id) == "expired"
+    assert _status(db, due_pending.id) == "pending"
+    assert _status(db, future.id) == "approved"
+
+
+def test_start_expires_predictions_already_past_deadline(db, make_user, make_prediction):
+    creator = make_user()
+    prediction = make_prediction(creator, status="approved", expires_at=datetime.utcnow() - timedelta(seconds=1))
+
+    async def scenario():
+        scheduler = ExpiryScheduler()
+        await scheduler.start()
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+    assert _status(db, prediction.id) == "expired"
+
+
+def test_schedule_from_worker_thread_wakes_the_loop(db, make_user, make_prediction):
+    creator = make_user()
+
+    async def scenario():
+        scheduler = ExpiryScheduler()
+        await scheduler.start()
+        # 시작 후 승인된 예측은 schedule()로만 알 수 있음 (재동기화 주기는 기본 300초)
+        prediction = make_prediction(
+            creator, status="approved", expires_at=datetime.utcnow() + timedelta(milliseconds=200)
+        )
+        # sync 엔드포인트처럼 스레드풀에서 호출
+        caller = threading.Thread(target=scheduler.schedule, args=(prediction.id, prediction.expires_at))
+        caller.start()
+        caller.join()
+        await asyncio.sleep(0.6)
+        await scheduler.stop()
+        return prediction.id
+
+    prediction_id = asyncio.run(scenario())
+    assert _status(db, prediction_id) == "expired"
+
+
+def test_schedule_before_start_is_loaded_into_heap():
+    scheduler = ExpiryScheduler()
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    scheduler.schedule(1, expires_at)
+    scheduler.schedule(2, None)
+    assert scheduler._heap == [(expires_at, 1)]
@@ -0,0 +1,70 @@
+import asyncio
+import random
+
+from app.services import novelty_index
+from app.services.novelty_index import (
+    NUM_PERM,
+    NoveltyIndex,
+    _lane_min,
+    _similarity,
+    minhash_signature,
+)
+
+
+def lanes(signature: int):
+    return [(signature >> (lane * 32)) & 0xFFFFFFFF for lane in range(NUM_PERM)]
+
+
+def pack(values):
+    return sum(value << (lane * 32) for lane, value in enumerate(values))
+
+
+def test_lane_operations_match_per_lane_loop():
+    rng = random.Random(7)
+    for _ in range(200):
+        a = [rng.randrange(1 << 31) for _ in range(NUM_PERM)]
+        b = [rng.randrange(1 << 31) for _ in range(NUM_PERM)]
+        for lane in rng.sample(range(NUM_PERM), 16):
+            b[lane] = a[lane]
+
+        assert lanes(_lane_min(pack(a), pack(b))) == [min(x, y) for x, y in zip(a, b)]
+        assert _similarity(pack(a), pack(b)) == sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+def test_query_ranks_near_duplicates_first():
+    index = NoveltyIndex()
+    index.add(1, "game_1 Lakers beat Celtics by 10 points Yes No")
+    index.add(2, "game_1 Lakers beat Celtics by 12 points Yes No")
+    index.add(3, "game_9 두산 베어스가 LG 트윈스를 이긴다 예 아니오")
+
+    neighbors = index.query(prediction_id=1, k=2)
+
+    assert neighbors[0][0] == 2
+    assert neighbors[0][1] >= 0.5
+    assert all(neighbor_id != 1 for neighbor_id, _ in neighbors)
+    assert _similarity(minhash_signature("same text"), minhash_signature("same  TEXT")) == 1.0
+
+
+def test_background_load_skips_predictions_removed_meanwhile(monkeypatch):
+    rows = [(1, "game_1 Lakers beat Celtics"), (2, "game_2 Heat beat Knicks")]
+    index = NoveltyIndex()
+
+    def fill(target):
+        # 채우는 도중 새 예측 추가/삭제가 들어온 경우
+        target.add(3, "game_3 Suns beat Bulls")
+        target.remove(2)
+        target.load(rows)
+        target.mark_ready()
+
+    monkeypatch.setattr(novelty_index, "_novelty_index", None)
+    monkeypatch.setattr(novelty_index, "_load_task", None)
+    monkeypatch.setattr(novelty_index, "NoveltyIndex", lambda: index)
+    monkeypatch.setattr(novelty_index, "fill_novelty_index", fill)
+
+    async def run():
+        await novelty_index.start_novelty_index()
+        return await novelty_index.wait_novelty_index()
+
+    assert asyncio.run(run()) is index
+    assert index.ready.is_set()
+    assert sorted(index._signatures) == [1, 3]
@@ -0,0 +1,73 @@
+from sqlalchemy import create_engine, text
+
+from app.models.database import Bet, PredictionEvent, upgrade_column_types
+from app.services.pool_totals import bet_side, load_pool_totals, rebuild_pool_totals, record_bet_totals
+
+
+def test_bet_side_accepts_labels_and_keys(db, make_user, make_prediction):
+    prediction = make_prediction(make_user())
+    assert bet_side(prediction, "yes") == "a"
+    assert bet_side(prediction, "option_b") == "b"
+    assert bet_side(prediction, "maybe") is None
+
+
+def test_record_bet_totals_keeps_fractional_amounts(db, make_user, make_prediction):
+    prediction = make_prediction(make_user(), status="approved", total_bets=None, total_amount=None)
+    record_bet_totals(db, prediction.id, "a", 1.25)
+    record_bet_totals(db, prediction.id, "a", 0.5)
+    record_bet_totals(db, prediction.id, "b", 2.75, bets=2)
+    db.commit()
+
+    assert load_pool_totals(db, prediction.id) == {
+        "prediction_id": prediction.id,
+        "total_bets": 4,
+        "total_amount": 4.5,
+        "option_a_bets": 2,
+        "option_a_amount": 1.75,
+        "option_b_bets": 2,
+        "option_b_amount": 2.75,
+    }
+
+
+def test_load_pool_totals_without_bets(db, make_user, make_prediction):
+    prediction = make_prediction(make_user())
+    totals = load_pool_totals(db, prediction.id)
+    assert (totals["total_bets"], totals["option_a_bets"], totals["option_b_amount"]) == (0, 0, 0.0)
+    assert load_pool_totals(db, prediction.id + 1) is None
+
+
+def test_rebuild_pool_totals_matches_bets(db, make_user, make_prediction):
+    creator = make_user()
+    prediction = make_prediction(creator, status="approved")
+    empty = make_prediction(creator, status="approved")
+    for option, amount in [("yes", 1.5), ("option_a", 2.0), ("no", 0.25)]:
+        db.add(Bet(prediction_id=prediction.id, user_id=creator.id, user_address="0x", option=option, amount=amount))
+    # 집계가 어긋난 상태에서 재계산
+    db.query(PredictionEvent).update({PredictionEvent.total_bets: 99, PredictionEvent.total_amount: 99})
+    db.commit()
+
+    assert rebuild_pool_totals(db, [prediction.id]) == 1
+    totals = load_pool_totals(db, prediction.id)
+    assert (totals["total_bets"], totals["total_amount"]) == (3, 3.75)
+    assert (totals["option_a_bets"], totals["option_a_amount"]) == (2, 3.5)
+    assert (totals["option_b_bets"], totals["option_b_amount"]) == (1, 0.25)
+    assert load_pool_totals(db, empty.id)["total_bets"] == 99
+
+    assert rebuild_pool_totals(db) == 2
+    assert load_pool_totals(db, empty.id)["total_bets"] == 0
+    assert load_pool_totals(db, prediction.id)["total_amount"] == 3.75
+
+
+def test_legacy_integer_total_amount_keeps_fractions_on_sqlite(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE prediction_events (id INTEGER PRIMARY KEY, total_bets INTEGER, total_amount INTEGER)"
+        ))
+        connection.execute(text("INSERT INTO prediction_events VALUES (1, 0, 0)"))
+
+    upgrade_column_types(engine)
+    with engine.begin() as connection:
+        connection.execute(text("UPDATE prediction_events SET total_amount = total_amount + 1.25"))
+        assert connection.execute(text("SELECT total_amount FROM prediction_events")).scalar() == 1.25
+    engine.dispose()
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.endpoints import predictions
+from app.api.endpoints.auth import get_current_user
+from app.models.database import get_db
+
+
+@pytest.fixture
+def client(db, make_user):
+    admin = make_user(is_admin=True)
+    app = FastAPI()
+    app.include_router(predictions.router, prefix="/predictions")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: admin
+    return TestClient(app)
+
+
+def fetch_all(client, path, **params):
+    """X-Next-Cursor가 없을 때까지 페이지를 따라가며 (ID 목록, 페이지 수) 반환"""
+    ids, pages, cursor = [], 0, None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = client.get(path, params=query)
+        assert response.status_code == 200
+        ids.extend(item["id"] for item in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return ids, pages
+
+
+def test_cursor_pages_cover_every_prediction_once(client, make_user, make_prediction):
+    creator = make_user()
+    base = datetime(2025, 8, 1)
+    # 같은 created_at이 페이지 경계에 걸려도 id로 순서가 이어져야 함
+    created = [
+        make_prediction(creator, created_at=base + timedelta(minutes=index // 2))
+        for index in range(7)
+    ]
+    expected = [
+        prediction.id
+        for prediction in sorted(created, key=lambda p: (p.created_at, p.id), reverse=True)
+    ]
+
+    ids, pages = fetch_all(client, "/predictions/", limit=2)
+
+    assert ids == expected
+    assert pages == 4
+
+
+def test_last_page_has_no_cursor(client, make_user, make_prediction):
+    creator = make_user()
+    for _ in range(3):
+        make_prediction(creator)
+
+    response = client.get("/predictions/", params={"limit": 3})
+
+    assert len(response.json()) == 3
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/predictions/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+def test_filters_apply_across_pages(client, make_user, make_prediction):
+    alice, bob = make_user(), make_user()
+    base = datetime(2025, 8, 1)
+    wanted = [
+        make_prediction(alice, game_id="g2", created_at=base + timedelta(minutes=index)).id
+        for index in range(3)
+    ]
+    make_prediction(alice, game_id="g1", created_at=base)
+    make_prediction(bob, game_id="g2", created_at=base)
+
+    ids, _ = fetch_all(client, "/predictions/", limit=1, game_id="g2", creator=alice.username)
+
+    assert ids == list(reversed(wanted))
+
+
+def test_approved_feed_merges_statuses_and_hides_expired(client, make_user, make_prediction):
+    creator = make_user()
+    base = datetime(2025, 8, 1)
+    statuses = ["approved", "completed", "approved", "pending", "completed", "approved"]
+    visible = []
+    for index, prediction_status in enumerate(statuses):
+        prediction = make_prediction(
+            creator, status=prediction_status, created_at=base + timedelta(minutes=index)
+        )
+        if prediction_status != "pending":
+            visible.append(prediction.id)
+    # 스케줄러가 아직 expired로 바꾸지 않은 마감 지난 approved 예측은 숨김
+    make_prediction(
+        creator, status="approved",
+        created_at=base + timedelta(minutes=10),
+        expires_at=datetime.utcnow() - timedelta(minutes=1)
+    )
+
+    ids, _ = fetch_all(client, "/predictions/approved", limit=2)
+
+    assert ids == list(reversed(visible))
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.endpoints import realtime
+from app.services import realtime as realtime_service
+
+
+class FakePoolOdds:
+    def odds(self, prediction_id):
+        return {"prediction_id": prediction_id, "total_amount": 0.0}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(realtime_service, "_broker", None)
+    monkeypatch.setattr(realtime, "get_pool_odds", lambda: FakePoolOdds())
+    app = FastAPI()
+    app.include_router(realtime.router, prefix="/realtime")
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("command", [
+    {"subscribe": ["abc"]},
+    {"subscribe": 5},
+    {"unsubscribe": [1, None]},
+    {"subscribe": [True]},
+])
+def test_malformed_command_is_ignored(client, command):
+    with client.websocket_connect("/realtime/ws") as websocket:
+        websocket.send_json(command)
+        websocket.send_json({"subscribe": [7]})
+
+        # 잘못된 명령 뒤에도 연결이 유지되어 다음 구독의 현재 배당을 받음
+        event = websocket.receive_json()
+
+    assert event["type"] == "odds"
+    assert event["prediction_id"] == 7
+
+
+def test_command_ids_validation():
+    assert realtime._command_ids({"subscribe": [1, 2]}, "subscribe") == [1, 2]
+    assert realtime._command_ids({}, "subscribe") == []
+    with pytest.raises(ValueError):
+        realtime._command_ids({"subscribe": "12"}, "subscribe")
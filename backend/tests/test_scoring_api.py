@@ -0,0 +1,57 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.endpoints import scoring
+from app.api.endpoints.auth import get_current_user
+from app.models.database import PredictionScore, get_db
+
+
+@pytest.fixture
+def client(db, make_user):
+    admin = make_user(is_admin=True)
+    app = FastAPI()
+    app.include_router(scoring.router, prefix="/scoring")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: admin
+    return TestClient(app)
+
+
+def test_usage_is_returned_when_flush_fails(client, monkeypatch):
+    def failing_flush():
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(scoring, "flush_usage", failing_flush)
+
+    response = client.get("/scoring/usage", params={"window_minutes": 5, "hours": 1})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["window_minutes"] == 5
+    assert body["hourly"] == []
+
+
+def test_leaderboard_pages_with_cursor_header(client, db, make_user, make_prediction):
+    creator = make_user()
+    # 같은 총점이 페이지 경계에 걸려도 id로 순서가 이어져야 함
+    for total in (90, 80, 80, 80, 70):
+        prediction = make_prediction(creator)
+        db.add(PredictionScore(
+            prediction_id=prediction.id, quality_score=total, demand_score=total, reputation_score=total,
+            novelty_score=total, economic_score=total, total_score=total
+        ))
+    db.commit()
+
+    totals, pages, cursor = [], 0, None
+    while True:
+        response = client.get("/scoring/", params=dict(limit=2, **({"cursor": cursor} if cursor else {})))
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+        totals.extend(item["total_score"] for item in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert totals == [90, 80, 80, 80, 70]
+    assert pages == 3
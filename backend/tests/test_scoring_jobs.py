@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+from app.models.database import ScoringJob, ScoringJobItem
+from app.services import circuit_breaker
+from app.services.scoring_jobs import RETRY_JOB_TYPE, claim_job, create_scoring_job, queue_retry_job
+
+
+def test_job_is_claimed_only_once(db, make_user, make_prediction):
+    make_prediction(make_user())
+    job = create_scoring_job(db, "batch_calculate", {})
+
+    assert claim_job(db, job.id) is not None
+    # 두 번째 워커(다른 프로세스/중복 submit)는 선점에 실패
+    assert claim_job(db, job.id) is None
+
+    db.refresh(job)
+    assert job.status == "running"
+    assert job.started_at is not None
+
+
+def test_stale_running_job_can_be_reclaimed(db, make_user, make_prediction):
+    make_prediction(make_user())
+    job = create_scoring_job(db, "batch_calculate", {})
+    first = claim_job(db, job.id, now=datetime.utcnow() - timedelta(hours=1))
+
+    second = claim_job(db, job.id)
+
+    assert first is not None and second is not None
+    db.refresh(job)
+    assert job.heartbeat_at == second
+
+
+def test_retry_job_is_reused_across_periods(db, monkeypatch, make_user, make_prediction):
+    monkeypatch.setattr(circuit_breaker, "_deferred_ids", set())
+    creator = make_user()
+    first, second = make_prediction(creator), make_prediction(creator)
+
+    job = queue_retry_job(db, [first.id])
+    # 같은 예측이 다시 대기열에 들어와도 pending 항목이 있으면 새로 넣지 않음
+    assert queue_retry_job(db, [first.id]) is None
+
+    reused = queue_retry_job(db, [second.id])
+
+    assert reused.id == job.id
+    assert db.query(ScoringJob).filter(ScoringJob.job_type == RETRY_JOB_TYPE).count() == 1
+    assert sorted(
+        prediction_id for (prediction_id,) in
+        db.query(ScoringJobItem.prediction_id).filter(ScoringJobItem.job_id == job.id)
+    ) == [first.id, second.id]
+    assert (reused.status, reused.total) == ("queued", 2)
+
+
+def test_running_retry_job_defers_back(db, monkeypatch, make_user, make_prediction):
+    monkeypatch.setattr(circuit_breaker, "_deferred_ids", set())
+    creator = make_user()
+    first, second = make_prediction(creator), make_prediction(creator)
+    job = queue_retry_job(db, [first.id])
+    claim_job(db, job.id)
+
+    assert queue_retry_job(db, [second.id]) is None
+    assert circuit_breaker.take_deferred_predictions() == [second.id]
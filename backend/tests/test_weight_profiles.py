@@ -0,0 +1,35 @@
+from app.core.config import settings
+from app.services import weight_profiles
+from app.services.weight_profiles import (
+    DEFAULT_WEIGHTS,
+    activate_weight_profile,
+    create_weight_profile,
+    get_active_weights,
+)
+
+NEW_WEIGHTS = {"quality": 0.2, "demand": 0.2, "reputation": 0.2, "novelty": 0.2, "economic": 0.2}
+
+
+def test_activation_in_another_process_is_picked_up_after_ttl(monkeypatch, session_factory):
+    monkeypatch.setattr(weight_profiles, "SessionLocal", session_factory)
+    monkeypatch.setattr(weight_profiles, "_active_weights", None)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(weight_profiles.time, "monotonic", lambda: clock["now"])
+
+    assert get_active_weights() == DEFAULT_WEIGHTS
+
+    # 다른 워커가 활성화: DB만 바뀌고 이 프로세스의 캐시는 그대로인 상황
+    db = session_factory()
+    try:
+        profile = create_weight_profile(db, "flat", NEW_WEIGHTS)
+        cached = dict(weight_profiles._active_weights), weight_profiles._loaded_at
+        activate_weight_profile(db, profile)
+        weight_profiles._active_weights, weight_profiles._loaded_at = cached
+    finally:
+        db.close()
+
+    assert get_active_weights() == DEFAULT_WEIGHTS
+
+    clock["now"] += settings.SCORING_WEIGHTS_TTL_SECONDS + 1
+
+    assert get_active_weights() == NEW_WEIGHTS
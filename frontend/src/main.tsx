@@ -40,6 +40,9 @@ const PACKAGE_ID =
 const REGISTRY_ID =
   "0xd7016b5632331c9ddee6d76a7d5b1b8cffe667e69be411bfb4720dfb851219f9";
 
+// 공개 예측 피드 한 페이지 크기
+const PREDICTIONS_PAGE_SIZE = 50;
+
 const navItems = [
   { id: "breaking", label: "Live Feed", icon: Zap },
   { id: "stats", label: "Ranking", icon: BarChart3 },
@@ -90,6 +93,12 @@ export default function SportsNewsApp() {
   const [stickyDate, setStickyDate] = useState("2025-08-12");
   const [statsTab, setStatsTab] = useState("team");
   const [predictions, setPredictions] = useState<any[]>([]);
+  // 공개 피드 다음 페이지 cursor (없으면 마지막 페이지)
+  const [predictionsCursor, setPredictionsCursor] = useState<string | null>(
+    null
+  );
+  const [isLoadingMorePredictions, setIsLoadingMorePredictions] =
+    useState(false);
   const [predictionScores, setPredictionScores] = useState<any[]>([]);
   const [isBatchScoring, setIsBatchScoring] = useState(false);
   const [scoringProgress, setScoringProgress] = useState(0);
@@ -290,11 +299,25 @@ export default function SportsNewsApp() {
         headers["Authorization"] = `Bearer ${token}`;
       }
 
-      const response = await fetch(endpoint, { headers });
+      // 키셋 페이지네이션
+      // - Admin: 대기 중인 예측 전체가 필요하므로 X-Next-Cursor 헤더가 없을 때까지 조회
+      // - 일반 사용자: 첫 페이지만 조회하고 나머지는 "Load more"로 요청 시 조회
+      let data: any[] = [];
+      let cursor: string | null = null;
+      let response: Response;
+      do {
+        const url = `${endpoint}?limit=${
+          user?.is_admin ? 200 : PREDICTIONS_PAGE_SIZE
+        }${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ""}`;
+        response = await fetch(url, { headers });
+        if (!response.ok) break;
+        data = data.concat(await response.json());
+        cursor = response.headers.get("X-Next-Cursor");
+      } while (cursor && user?.is_admin);
 
       if (response.ok) {
-        const data = await response.json();
         setPredictions(data);
+        setPredictionsCursor(cursor);
         console.log("백엔드에서 예측 이벤트 로드 성공:", data);
 
         // Pool 정보도 함께 로드
@@ -310,10 +333,41 @@ export default function SportsNewsApp() {
       } else {
         console.error("예측 이벤트 로드 실패:", response.status);
         setPredictions([]);
+        setPredictionsCursor(null);
       }
     } catch (error) {
       console.error("예측 이벤트 로드 오류:", error);
       setPredictions([]);
+      setPredictionsCursor(null);
+    }
+  };
+
+  // 공개 피드 다음 페이지 조회 ("Load more")
+  const loadMorePredictions = async () => {
+    if (!predictionsCursor || isLoadingMorePredictions) return;
+    setIsLoadingMorePredictions(true);
+    try {
+      const response = await fetch(
+        `http://localhost:8000/api/v1/predictions/approved?limit=${PREDICTIONS_PAGE_SIZE}&cursor=${encodeURIComponent(
+          predictionsCursor
+        )}`,
+        { headers: { "Content-Type": "application/json" } }
+      );
+      if (!response.ok) {
+        console.error("예측 이벤트 추가 로드 실패:", response.status);
+        return;
+      }
+      const data = await response.json();
+      setPredictions((prev) => {
+        const loadedIds = new Set(prev.map((p) => p.id));
+        return prev.concat(data.filter((p: any) => !loadedIds.has(p.id)));
+      });
+      setPredictionsCursor(response.headers.get("X-Next-Cursor"));
+      await loadPoolInfos(data, true);
+    } catch (error) {
+      console.error("예측 이벤트 추가 로드 오류:", error);
+    } finally {
+      setIsLoadingMorePredictions(false);
     }
   };
 
@@ -337,7 +391,7 @@ export default function SportsNewsApp() {
   (window as any).clearUserBets = () => setUserBets({});
 
   // Pool 정보 로드 함수
-  const loadPoolInfos = async (predictions: any[]) => {
+  const loadPoolInfos = async (predictions: any[], append = false) => {
     const poolInfoPromises = predictions
       .filter((prediction) => prediction.pool_id)
       .map(async (prediction) => {
@@ -362,7 +416,7 @@ export default function SportsNewsApp() {
       }
     });
 
-    setPoolInfos(newPoolInfos);
+    setPoolInfos((prev) => (append ? { ...prev, ...newPoolInfos } : newPoolInfos));
     console.log("Pool 정보 로드 완료:", newPoolInfos);
   };
 
@@ -949,8 +1003,12 @@ export default function SportsNewsApp() {
       );
 
       if (response.ok) {
-        const scores = await response.json();
-        setScoringStatus(`Calculated ${scores.length} scores successfully!`);
+        const result = await response.json();
+        const scores = result.scores;
+        setScoringStatus(
+          `Calculated ${result.succeeded} scores successfully!` +
+            (result.failed ? ` (${result.failed} failed)` : "")
+        );
         setScoringProgress(100);
 
         // 기존 점수들과 새로 계산된 점수들을 합치기
@@ -1534,6 +1592,7 @@ export default function SportsNewsApp() {
     const approvedPredictions = predictions.filter(
       (p) =>
         p.status === "approved" ||
+        p.status === "expired" ||
         p.status === "ended" ||
         p.status === "completed"
     );
@@ -2004,7 +2063,8 @@ export default function SportsNewsApp() {
                           </span>
                           {prediction.pool_id && (
                             <>
-                              {prediction.status === "approved" && (
+                              {(prediction.status === "approved" ||
+                                prediction.status === "expired") && (
                                 <button
                                   onClick={() =>
                                     handleEndPrediction(prediction)
@@ -2626,6 +2686,19 @@ export default function SportsNewsApp() {
               </div>
             )}
           </div>
+
+          {/* 이전 예측 이벤트 추가 로드 */}
+          {predictionsCursor && !user?.is_admin && (
+            <div className="mt-8 text-center">
+              <button
+                onClick={loadMorePredictions}
+                disabled={isLoadingMorePredictions}
+                className="bg-gray-100 text-gray-700 px-6 py-2 rounded-lg text-sm font-medium hover:bg-gray-200 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+              >
+                {isLoadingMorePredictions ? "Loading..." : "Load more"}
+              </button>
+            </div>
+          )}
         </div>
       </div>
     );
@@ -3479,7 +3552,8 @@ export default function SportsNewsApp() {
           <div className="bg-white rounded-2xl p-8 w-full max-w-lg mx-4">
             <div className="flex justify-between items-center mb-6">
               <h2 className="text-xl font-bold text-gray-900">
-                {selectedEndPrediction.status === "approved"
+                {selectedEndPrediction.status === "approved" ||
+                selectedEndPrediction.status === "expired"
                   ? "End Match"
                   : "Set Result"}
               </h2>
@@ -3596,7 +3670,10 @@ export default function SportsNewsApp() {
 
                       // 상태에 따라 다른 함수 호출
                       let result;
-                      if (selectedEndPrediction.status === "approved") {
+                      if (
+                        selectedEndPrediction.status === "approved" ||
+                        selectedEndPrediction.status === "expired"
+                      ) {
                         // 모달에서 미리 가져온 matchId 사용
                         const matchId = selectedEndPrediction.poolInfo?.matchId;
                         if (!matchId) {
@@ -3651,7 +3728,8 @@ export default function SportsNewsApp() {
                           const token = localStorage.getItem("access_token");
                           if (token) {
                             const newStatus =
-                              selectedEndPrediction.status === "approved"
+                              selectedEndPrediction.status === "approved" ||
+                              selectedEndPrediction.status === "expired"
                                 ? "ended"
                                 : "completed";
                             const statusResponse = await fetch(
@@ -3704,7 +3782,8 @@ export default function SportsNewsApp() {
                   }
                   className="flex-1 bg-red-500 text-white py-3 rounded-lg font-medium hover:bg-red-600 transition-colors disabled:bg-gray-300 disabled:cursor-not-allowed"
                 >
-                  {selectedEndPrediction.status === "approved"
+                  {selectedEndPrediction.status === "approved" ||
+                  selectedEndPrediction.status === "expired"
                     ? "End Match"
                     : "Set Result"}
                 </button>